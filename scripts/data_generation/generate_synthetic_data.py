@@ -5,19 +5,23 @@ Phase 4: Generate realistic network data for ML training
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
-import random
-from typing import Dict, List
+from typing import Dict, Iterator, List
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Rows generated and written per batch when streaming to disk
+EVENT_CHUNK_SIZE = 10_000
+
 class SyntheticDataGenerator:
     """Generate realistic synthetic network security data"""
     
     def __init__(self, seed: int = 42):
-        np.random.seed(seed)
-        random.seed(seed)
+        self.rng = np.random.default_rng(seed)
         self.ip_ranges = [
             "10.1.{}.{}",
             "192.168.{}.{}",
@@ -25,6 +29,11 @@ class SyntheticDataGenerator:
         ]
         self.protocols = ['TCP', 'UDP', 'ICMP', 'HTTP', 'HTTPS', 'DNS', 'SSH']
         self.event_types = ['connection', 'auth', 'data_transfer', 'api_call', 'file_access']
+        self.device_ids = np.array([f'device-{i:03d}' for i in range(1, 101)])
+        
+        # String lookup tables so IPs are joined column-at-a-time in Arrow
+        self._ip_prefixes = pa.array([r.rsplit('.', 2)[0] for r in self.ip_ranges])
+        self._octet_strings = pa.array([str(i) for i in range(256)])
         
     def generate_network_events(
         self, 
@@ -38,68 +47,101 @@ class SyntheticDataGenerator:
         if start_date is None:
             start_date = datetime.utcnow() - timedelta(days=30)
         
-        events = []
+        df = self._generate_event_chunk(num_events, anomaly_rate, start_date)
+        logger.info(f"Generated {len(df)} events ({df['is_anomaly'].sum()} anomalies)")
         
-        for i in range(num_events):
-            # Random timestamp
-            timestamp = start_date + timedelta(
-                seconds=random.randint(0, 30 * 24 * 3600)
-            )
-            
-            # Determine if this is an anomaly
-            is_anomaly = random.random() < anomaly_rate
-            
-            # Generate IP addresses
-            source_ip = self.ip_ranges[random.randint(0, 2)].format(
-                random.randint(1, 254),
-                random.randint(1, 254)
-            )
-            destination_ip = self.ip_ranges[random.randint(0, 2)].format(
-                random.randint(1, 254),
-                random.randint(1, 254)
+        return df
+    
+    def iter_network_events(
+        self,
+        num_events: int = 10000,
+        anomaly_rate: float = 0.05,
+        start_date: datetime = None,
+        chunk_size: int = EVENT_CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """Generate synthetic network events in chunks of at most chunk_size rows"""
+        if start_date is None:
+            start_date = datetime.utcnow() - timedelta(days=30)
+        
+        for start in range(0, num_events, chunk_size):
+            yield self._generate_event_chunk(
+                min(chunk_size, num_events - start), anomaly_rate, start_date
             )
-            
-            # Generate traffic characteristics
-            if is_anomaly:
-                # Anomalous traffic patterns
-                bytes_sent = random.randint(1000000, 10000000)  # Large transfer
-                bytes_received = random.randint(100, 1000)  # Minimal response
-                packets_sent = random.randint(500, 2000)
-                severity = random.choice(['high', 'critical'])
-            else:
-                # Normal traffic patterns
-                bytes_sent = random.randint(1000, 50000)
-                bytes_received = random.randint(1000, 50000)
-                packets_sent = random.randint(10, 100)
-                severity = random.choice(['low', 'medium'])
-            
-            packets_received = packets_sent + random.randint(-10, 10)
-            
-            event = {
-                'timestamp': timestamp,
-                'source_ip': source_ip,
-                'destination_ip': destination_ip,
-                'source_port': random.randint(1024, 65535),
-                'destination_port': random.choice([80, 443, 22, 3306, 5432, 8080]),
-                'protocol': random.choice(self.protocols),
-                'bytes_sent': bytes_sent,
-                'bytes_received': bytes_received,
-                'packets_sent': packets_sent,
-                'packets_received': packets_received,
-                'event_type': random.choice(self.event_types),
-                'severity': severity,
-                'device_id': f'device-{random.randint(1, 100):03d}',
-                'location': random.choice(['store-001', 'store-002', 'hq-datacenter', 'cloud-az-east']),
-                'is_anomaly': is_anomaly
-            }
-            
-            events.append(event)
-        
-        df = pd.DataFrame(events)
-        logger.info(f"Generated {len(df)} events ({df['is_anomaly'].sum()} anomalies)")
+    
+    def _generate_event_chunk(
+        self,
+        num_events: int,
+        anomaly_rate: float,
+        start_date: datetime
+    ) -> pd.DataFrame:
+        """Generate one block of synthetic network events"""
+        rng = self.rng
+        n = num_events
+        
+        # Random timestamps
+        timestamps = pd.Timestamp(start_date) + pd.to_timedelta(
+            rng.integers(0, 30 * 24 * 3600, n, endpoint=True), unit='s'
+        )
+        
+        # Determine which events are anomalies
+        is_anomaly = rng.random(n) < anomaly_rate
+        
+        # Generate traffic characteristics
+        # Anomalous traffic: large transfer with minimal response
+        bytes_sent = np.where(
+            is_anomaly,
+            rng.integers(1000000, 10000000, n, endpoint=True),
+            rng.integers(1000, 50000, n, endpoint=True)
+        )
+        bytes_received = np.where(
+            is_anomaly,
+            rng.integers(100, 1000, n, endpoint=True),
+            rng.integers(1000, 50000, n, endpoint=True)
+        )
+        packets_sent = np.where(
+            is_anomaly,
+            rng.integers(500, 2000, n, endpoint=True),
+            rng.integers(10, 100, n, endpoint=True)
+        )
+        packets_received = packets_sent + rng.integers(-10, 10, n, endpoint=True)
+        severity = np.where(
+            is_anomaly,
+            rng.choice(['high', 'critical'], n),
+            rng.choice(['low', 'medium'], n)
+        )
+        
+        df = pd.DataFrame({
+            'timestamp': timestamps,
+            'source_ip': self._generate_ips(n),
+            'destination_ip': self._generate_ips(n),
+            'source_port': rng.integers(1024, 65535, n, endpoint=True),
+            'destination_port': rng.choice([80, 443, 22, 3306, 5432, 8080], n),
+            'protocol': rng.choice(self.protocols, n),
+            'bytes_sent': bytes_sent,
+            'bytes_received': bytes_received,
+            'packets_sent': packets_sent,
+            'packets_received': packets_received,
+            'event_type': rng.choice(self.event_types, n),
+            'severity': severity,
+            'device_id': self.device_ids[rng.integers(0, len(self.device_ids), n)],
+            'location': rng.choice(['store-001', 'store-002', 'hq-datacenter', 'cloud-az-east'], n),
+            'is_anomaly': is_anomaly
+        })
         
         return df
     
+    def _generate_ips(self, count: int) -> np.ndarray:
+        """Generate random IP addresses within the configured ranges"""
+        ranges = self.rng.integers(0, len(self.ip_ranges), count)
+        octets = self.rng.integers(1, 254, (2, count), endpoint=True)
+        ips = pc.binary_join_element_wise(
+            self._ip_prefixes.take(ranges),
+            self._octet_strings.take(octets[0]),
+            self._octet_strings.take(octets[1]),
+            '.'
+        )
+        return ips.to_numpy(zero_copy_only=False)
+    
     def generate_timeseries_data(
         self,
         days: int = 90,
@@ -109,16 +151,17 @@ class SyntheticDataGenerator:
         logger.info(f"Generating {days} days of time-series data...")
         
         start_date = datetime.utcnow() - timedelta(days=days)
-        timestamps = pd.date_range(start=start_date, periods=days*24//interval_hours, freq=f'{interval_hours}H')
+        timestamps = pd.date_range(start=start_date, periods=days*24//interval_hours, freq=f'{interval_hours}h')
+        n = len(timestamps)
         
         # Base pattern with daily seasonality
-        base_utilization = 50 + 20 * np.sin(np.linspace(0, days * 2 * np.pi, len(timestamps)))
+        base_utilization = 50 + self._seasonal_pattern(20, 24 / interval_hours, n)
         
         # Add hourly pattern
-        hourly_pattern = 10 * np.sin(np.linspace(0, len(timestamps) * 2 * np.pi / 24, len(timestamps)))
+        hourly_pattern = self._seasonal_pattern(10, 24, n)
         
         # Add random noise
-        noise = np.random.normal(0, 5, len(timestamps))
+        noise = self.rng.normal(0, 5, len(timestamps))
         
         # Combine patterns
         bandwidth_utilization = np.clip(base_utilization + hourly_pattern + noise, 0, 100)
@@ -134,22 +177,42 @@ class SyntheticDataGenerator:
         
         return df
     
+    @staticmethod
+    def _seasonal_pattern(amplitude: float, period: float, count: int) -> np.ndarray:
+        """Sine wave with a period in samples, evaluated for one cycle and tiled"""
+        if period != int(period):
+            # A fractional period cannot be tiled exactly
+            return amplitude * np.sin(2 * np.pi * np.arange(count) / period)
+        
+        cycle = amplitude * np.sin(np.linspace(0, 2 * np.pi, int(period), endpoint=False))
+        return np.resize(cycle, count)
+    
     def save_training_data(self, output_dir: str = "data/training") -> None:
         """Generate and save all training datasets"""
         from pathlib import Path
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Generate network events
-        events_df = self.generate_network_events(num_events=50000)
-        events_path = output_path / "network_events_training.csv"
-        events_df.to_csv(events_path, index=False)
+        # Stream network events to disk so memory stays bounded by one chunk
+        num_events = 50000
+        logger.info(f"Generating {num_events} synthetic network events...")
+        events_path = output_path / "network_events_training.parquet"
+        writer = None
+        try:
+            for chunk in self.iter_network_events(num_events=num_events):
+                batch = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(events_path, batch.schema, compression="zstd")
+                writer.write_table(batch)
+        finally:
+            if writer is not None:
+                writer.close()
         logger.info(f"Saved network events to {events_path}")
         
         # Generate time-series data
         ts_df = self.generate_timeseries_data(days=90)
-        ts_path = output_path / "timeseries_training.csv"
-        ts_df.to_csv(ts_path, index=False)
+        ts_path = output_path / "timeseries_training.parquet"
+        ts_df.to_parquet(ts_path, compression="zstd", index=False)
         logger.info(f"Saved time-series data to {ts_path}")
 
 if __name__ == "__main__":
@@ -22,6 +22,7 @@ import sys
 import json
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 import logging
@@ -276,6 +277,7 @@ class ProjectSetup:
         
         self._create_file("src/database/repositories/base_repository.py", self._get_repository_base())
         self._create_file("src/database/repositories/event_repository.py", self._get_repository_events())
+        self._create_file("src/database/session.py", self._get_database_session())
         
         logger.info("✓ Phase 2 Database schemas generated")
     
@@ -379,6 +381,7 @@ class ProjectSetup:
         self._create_file("src/api/app.py", self._get_api_app())
         self._create_file("src/api/routes/health.py", self._get_api_health())
         self._create_file("src/api/routes/anomaly.py", self._get_api_anomaly())
+        self._create_file("src/api/routes/incidents.py", self._get_api_incidents())
         
         # Core services
         self._create_file("src/core/orchestrator.py", self._get_orchestrator())
@@ -927,9 +930,7 @@ Phase 2: PostgreSQL schemas with SQLAlchemy ORM
 """
 
 from datetime import datetime
-from typing import Optional
-from sqlalchemy import Column, DateTime, Integer, String, Boolean
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, DateTime, Boolean
 from sqlalchemy.orm import DeclarativeBase
 
 class Base(DeclarativeBase):
@@ -958,18 +959,24 @@ Network Events Model
 Stores network telemetry and events for analysis
 """
 
-from sqlalchemy import Column, Integer, String, Float, JSON, DateTime, Index
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from .base import Base, TimestampMixin
 import uuid
 
 class NetworkEvent(Base, TimestampMixin):
-    """Network event model for time-series data"""
+    """
+    Network event model for time-series data
+    
+    Stored as a TimescaleDB hypertable partitioned on timestamp, so the
+    primary key includes it and each daily chunk carries its own indexes.
+    """
     __tablename__ = 'network_events'
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    timestamp = Column(DateTime, nullable=False, index=True)
-    source_ip = Column(String(45), nullable=False, index=True)
+    # Indexed by the hypertable itself (timestamp DESC)
+    timestamp = Column(DateTime, primary_key=True)
+    source_ip = Column(String(45), nullable=False)
     destination_ip = Column(String(45), nullable=False)
     source_port = Column(Integer)
     destination_port = Column(Integer)
@@ -980,14 +987,21 @@ class NetworkEvent(Base, TimestampMixin):
     packets_received = Column(Integer)
     event_type = Column(String(50), nullable=False, index=True)
     severity = Column(String(20), nullable=False)
-    device_id = Column(String(100), index=True)
+    device_id = Column(String(100))
     location = Column(String(100), index=True)
     metadata = Column(JSONB)
     
-    # Indexes for time-series queries
+    # Per-device and per-IP time-range queries; these also serve plain
+    # device_id / source_ip lookups, so no single-column indexes are kept.
+    # The GIN index only serves containment filters, i.e.
+    # metadata.contains({...}) (@>), not ->> key extraction.
     __table_args__ = (
-        Index('idx_network_events_timestamp_device', 'timestamp', 'device_id'),
-        Index('idx_network_events_source_ip_timestamp', 'source_ip', 'timestamp'),
+        Index('idx_network_events_device_timestamp', 'device_id', timestamp.desc()),
+        Index('idx_network_events_source_ip_timestamp', 'source_ip', timestamp.desc()),
+        Index(
+            'idx_network_events_metadata_gin', 'metadata',
+            postgresql_using='gin', postgresql_ops={'metadata': 'jsonb_path_ops'}
+        ),
     )
 '''
 
@@ -997,20 +1011,19 @@ Security Incidents Model
 Stores detected security incidents and remediation actions
 """
 
-from sqlalchemy import Column, Integer, String, Float, JSON, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, Boolean, SmallInteger, String, Float, DateTime, Enum as SQLEnum, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
 from .base import Base, TimestampMixin
 import uuid
 import enum
 
-class IncidentStatus(enum.Enum):
-    """Incident status enum"""
-    DETECTED = "detected"
-    ANALYZING = "analyzing"
-    REMEDIATING = "remediating"
-    RESOLVED = "resolved"
-    ESCALATED = "escalated"
+class IncidentStatus(enum.IntEnum):
+    """Incident status codes (mirrors the incident_status_codes lookup table)"""
+    DETECTED = 0
+    ANALYZING = 1
+    REMEDIATING = 2
+    RESOLVED = 3
+    ESCALATED = 4
 
 class IncidentSeverity(enum.Enum):
     """Incident severity enum"""
@@ -1025,7 +1038,7 @@ class SecurityIncident(Base, TimestampMixin):
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     incident_type = Column(String(100), nullable=False)
-    status = Column(SQLEnum(IncidentStatus), nullable=False, default=IncidentStatus.DETECTED)
+    status = Column(SmallInteger, nullable=False, default=IncidentStatus.DETECTED)
     severity = Column(SQLEnum(IncidentSeverity), nullable=False)
     confidence_score = Column(Float, nullable=False)
     source_system = Column(String(50), nullable=False)
@@ -1033,10 +1046,24 @@ class SecurityIncident(Base, TimestampMixin):
     detection_method = Column(String(100))
     ai_reasoning = Column(JSONB)
     remediation_actions = Column(JSONB)
-    human_review_required = Column(Integer, default=0)
+    human_review_required = Column(Boolean, nullable=False, default=False)
     resolved_at = Column(DateTime)
     resolved_by = Column(String(100))
     notes = Column(String)
+    
+    # GIN indexes serve containment filters only, e.g.
+    # affected_assets.contains([{"mac_address": ...}]) (@>)
+    __table_args__ = (
+        Index('idx_security_incidents_status', 'status'),
+        Index(
+            'idx_security_incidents_affected_assets_gin', 'affected_assets',
+            postgresql_using='gin', postgresql_ops={'affected_assets': 'jsonb_path_ops'}
+        ),
+        Index(
+            'idx_security_incidents_ai_reasoning_gin', 'ai_reasoning',
+            postgresql_using='gin', postgresql_ops={'ai_reasoning': 'jsonb_path_ops'}
+        ),
+    )
 '''
 
     def _get_database_ml_predictions(self) -> str:
@@ -1045,7 +1072,7 @@ ML Predictions Model
 Stores ML model predictions and performance metrics
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Index
+from sqlalchemy import Column, Boolean, String, REAL, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from .base import Base, TimestampMixin
 import uuid
@@ -1060,11 +1087,14 @@ class MLPrediction(Base, TimestampMixin):
     prediction_type = Column(String(50), nullable=False)
     input_features = Column(JSONB)
     prediction_result = Column(JSONB)
-    confidence_score = Column(Float)
-    inference_time_ms = Column(Float)
-    prediction_timestamp = Column(DateTime, nullable=False, index=True)
+    # 4-byte floats: ~7 significant digits is ample for scores and timings
+    confidence_score = Column(REAL)
+    inference_time_ms = Column(REAL)
+    # Hypertable partition column, so part of the primary key (and indexed by
+    # the hypertable itself)
+    prediction_timestamp = Column(DateTime, primary_key=True)
     actual_outcome = Column(JSONB)
-    was_correct = Column(Integer)
+    was_correct = Column(Boolean, nullable=False, default=False)
     
     __table_args__ = (
         Index('idx_ml_predictions_model_timestamp', 'model_name', 'prediction_timestamp'),
@@ -1079,18 +1109,28 @@ class MLPrediction(Base, TimestampMixin):
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
 
--- Create enums
-CREATE TYPE incident_status AS ENUM (
-    'detected', 'analyzing', 'remediating', 'resolved', 'escalated'
+-- Incident status lookup (status is stored as SMALLINT, see IncidentStatus)
+CREATE TABLE incident_status_codes (
+    code SMALLINT PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
 );
 
+INSERT INTO incident_status_codes (code, name) VALUES
+    (0, 'detected'),
+    (1, 'analyzing'),
+    (2, 'remediating'),
+    (3, 'resolved'),
+    (4, 'escalated');
+
+-- Create enums
 CREATE TYPE incident_severity AS ENUM (
     'low', 'medium', 'high', 'critical'
 );
 
 -- Network Events Table (will be converted to hypertable)
+-- The partition column must be part of the primary key of a hypertable
 CREATE TABLE network_events (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
     timestamp TIMESTAMPTZ NOT NULL,
     source_ip VARCHAR(45) NOT NULL,
     destination_ip VARCHAR(45) NOT NULL,
@@ -1107,14 +1147,15 @@ CREATE TABLE network_events (
     location VARCHAR(100),
     metadata JSONB,
     created_at TIMESTAMPTZ DEFAULT NOW(),
-    updated_at TIMESTAMPTZ DEFAULT NOW()
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (id, timestamp)
 );
 
 -- Security Incidents Table
 CREATE TABLE security_incidents (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     incident_type VARCHAR(100) NOT NULL,
-    status incident_status NOT NULL DEFAULT 'detected',
+    status SMALLINT NOT NULL DEFAULT 0 REFERENCES incident_status_codes(code),
     severity incident_severity NOT NULL,
     confidence_score FLOAT NOT NULL,
     source_system VARCHAR(50) NOT NULL,
@@ -1122,7 +1163,7 @@ CREATE TABLE security_incidents (
     detection_method VARCHAR(100),
     ai_reasoning JSONB,
     remediation_actions JSONB,
-    human_review_required INTEGER DEFAULT 0,
+    human_review_required BOOLEAN NOT NULL DEFAULT false,
     resolved_at TIMESTAMPTZ,
     resolved_by VARCHAR(100),
     notes TEXT,
@@ -1130,35 +1171,48 @@ CREATE TABLE security_incidents (
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
--- ML Predictions Table
+-- ML Predictions Table (will be converted to hypertable)
 CREATE TABLE ml_predictions (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
     model_name VARCHAR(100) NOT NULL,
     model_version VARCHAR(50) NOT NULL,
     prediction_type VARCHAR(50) NOT NULL,
     input_features JSONB,
     prediction_result JSONB,
-    confidence_score FLOAT,
-    inference_time_ms FLOAT,
+    confidence_score REAL,
+    inference_time_ms REAL,
     prediction_timestamp TIMESTAMPTZ NOT NULL,
     actual_outcome JSONB,
-    was_correct INTEGER,
+    was_correct BOOLEAN NOT NULL DEFAULT false,
     created_at TIMESTAMPTZ DEFAULT NOW(),
-    updated_at TIMESTAMPTZ DEFAULT NOW()
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (id, prediction_timestamp)
 );
 
--- Indexes
-CREATE INDEX idx_network_events_timestamp ON network_events(timestamp DESC);
-CREATE INDEX idx_network_events_source_ip ON network_events(source_ip);
-CREATE INDEX idx_network_events_device ON network_events(device_id);
-CREATE INDEX idx_network_events_timestamp_device ON network_events(timestamp DESC, device_id);
+-- Indexes (create_hypertable adds the timestamp DESC indexes; the composite
+-- indexes below also serve plain device_id / source_ip lookups)
+CREATE INDEX idx_network_events_device_timestamp ON network_events(device_id, timestamp DESC);
+CREATE INDEX idx_network_events_source_ip_timestamp ON network_events(source_ip, timestamp DESC);
+
+-- JSONB containment (@>) filters; jsonb_path_ops indexes are smaller and faster
+-- than the default jsonb_ops but do not serve ->/->> or key-existence queries
+CREATE INDEX idx_network_events_metadata_gin ON network_events USING GIN (metadata jsonb_path_ops);
 
 CREATE INDEX idx_security_incidents_status ON security_incidents(status);
 CREATE INDEX idx_security_incidents_severity ON security_incidents(severity);
 CREATE INDEX idx_security_incidents_created ON security_incidents(created_at DESC);
+CREATE INDEX idx_security_incidents_affected_assets_gin ON security_incidents USING GIN (affected_assets jsonb_path_ops);
+CREATE INDEX idx_security_incidents_ai_reasoning_gin ON security_incidents USING GIN (ai_reasoning jsonb_path_ops);
 
 CREATE INDEX idx_ml_predictions_model ON ml_predictions(model_name);
-CREATE INDEX idx_ml_predictions_timestamp ON ml_predictions(prediction_timestamp DESC);
+
+-- TOAST compression (PostgreSQL 14+): LZ4 decompresses much faster than PGLZ
+ALTER TABLE security_incidents ALTER COLUMN ai_reasoning SET COMPRESSION lz4;
+ALTER TABLE security_incidents ALTER COLUMN remediation_actions SET COMPRESSION lz4;
+ALTER TABLE security_incidents ALTER COLUMN notes SET COMPRESSION lz4;
+ALTER TABLE network_events ALTER COLUMN metadata SET COMPRESSION lz4;
+ALTER TABLE ml_predictions ALTER COLUMN input_features SET COMPRESSION lz4;
+ALTER TABLE ml_predictions ALTER COLUMN prediction_result SET COMPRESSION lz4;
 '''
 
     def _get_migration_timescaledb(self) -> str:
@@ -1207,8 +1261,49 @@ SELECT add_continuous_aggregate_policy('network_metrics_hourly',
 SELECT add_retention_policy('network_events', INTERVAL '90 days');
 SELECT add_retention_policy('ml_predictions', INTERVAL '180 days');
 
--- Compression policy for older chunks
-SELECT add_compression_policy('network_events', INTERVAL '7 days');
+-- Enable native compression on the hypertables
+ALTER TABLE network_events SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'device_id',
+    timescaledb.compress_orderby = 'timestamp DESC'
+);
+ALTER TABLE ml_predictions SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'model_name',
+    timescaledb.compress_orderby = 'prediction_timestamp DESC'
+);
+
+-- Progressive compression: compress at most max_chunks of the oldest
+-- uncompressed chunks per run, committing after each one, so a large
+-- historical backfill is worked off in small batches instead of a single
+-- policy sweep that holds the compression worker for hours.
+CREATE OR REPLACE PROCEDURE progressive_compress(job_id INT, config JSONB)
+LANGUAGE plpgsql AS $$
+DECLARE
+    target_chunk REGCLASS;
+    max_chunks INT := COALESCE((config->>'max_chunks')::INT, 4);
+    compress_after INTERVAL := COALESCE((config->>'compress_after')::INTERVAL, INTERVAL '7 days');
+BEGIN
+    FOR target_chunk IN
+        SELECT format('%I.%I', chunk_schema, chunk_name)::REGCLASS
+        FROM timescaledb_information.chunks
+        WHERE hypertable_name = config->>'hypertable'
+          AND NOT is_compressed
+          AND range_end < NOW() - compress_after
+        ORDER BY range_start ASC
+        LIMIT max_chunks
+    LOOP
+        PERFORM compress_chunk(target_chunk, if_not_compressed => TRUE);
+        COMMIT;
+    END LOOP;
+END
+$$;
+
+-- network_events is backfilled on first deploy, so it is compressed
+-- progressively; swap back to add_compression_policy once caught up.
+SELECT add_job('progressive_compress', INTERVAL '1 minute',
+    config => '{"hypertable": "network_events", "compress_after": "7 days", "max_chunks": 4}'
+);
 SELECT add_compression_policy('ml_predictions', INTERVAL '30 days');
 
 -- Create continuous aggregate for security metrics
@@ -1220,7 +1315,7 @@ SELECT
     status,
     COUNT(*) as incident_count,
     AVG(confidence_score) as avg_confidence,
-    COUNT(*) FILTER (WHERE human_review_required = 1) as review_required_count
+    COUNT(*) FILTER (WHERE human_review_required) as review_required_count
 FROM security_incidents
 GROUP BY day, severity, status;
 
@@ -1237,11 +1332,13 @@ Base Repository Pattern
 Provides common CRUD operations for all repositories
 """
 
-from typing import Generic, TypeVar, Type, Optional, List
+from typing import Generic, TypeVar, Type, Optional, List, Dict
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
 from datetime import datetime
 
+from ..session import INSERT_PAGE_SIZE
+
 T = TypeVar('T')
 
 class BaseRepository(Generic[T]):
@@ -1255,10 +1352,35 @@ class BaseRepository(Generic[T]):
         """Create a new record"""
         instance = self.model(**kwargs)
         self.session.add(instance)
+        # Column defaults are all client-side, so no refresh() round-trip
+        # is needed to read back generated values
         self.session.commit()
-        self.session.refresh(instance)
         return instance
     
+    def bulk_create(self, rows: List[Dict], page_size: int = INSERT_PAGE_SIZE) -> int:
+        """
+        Insert many records in one transaction
+        
+        Rows go out as multi-row INSERT statements of up to page_size rows
+        each, without building ORM objects, and are committed once.
+        
+        Args:
+            rows: Column values for each record
+            page_size: Rows per INSERT statement
+            
+        Returns:
+            Number of records inserted
+        """
+        if not rows:
+            return 0
+        
+        self.session.execute(
+            insert(self.model).execution_options(insertmanyvalues_page_size=page_size),
+            rows
+        )
+        self.session.commit()
+        return len(rows)
+    
     def get_by_id(self, id: str) -> Optional[T]:
         """Get record by ID"""
         return self.session.query(self.model).filter(self.model.id == id).first()
@@ -1299,7 +1421,7 @@ Network Events Repository
 Specialized queries for network events and time-series data
 """
 
-from typing import List, Optional
+from typing import Dict, List
 from datetime import datetime, timedelta
 from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
@@ -1312,6 +1434,10 @@ class EventRepository(BaseRepository[NetworkEvent]):
     def __init__(self, session: Session):
         super().__init__(NetworkEvent, session)
     
+    def bulk_insert_events(self, events: List[Dict]) -> int:
+        """Ingest a batch of events with batched INSERTs and a single commit"""
+        return self.bulk_create(events)
+    
     def get_events_by_time_range(
         self, 
         start_time: datetime, 
@@ -1354,6 +1480,22 @@ class EventRepository(BaseRepository[NetworkEvent]):
             )
         ).order_by(self.model.timestamp.desc()).all()
     
+    def get_events_by_metadata(
+        self,
+        criteria: Dict,
+        hours: int = 24,
+        limit: int = 1000
+    ) -> List[NetworkEvent]:
+        """Get recent events whose metadata contains all of the given key/values"""
+        start_time = datetime.utcnow() - timedelta(hours=hours)
+        return self.session.query(self.model).filter(
+            and_(
+                # @> containment, which the jsonb_path_ops GIN index serves
+                self.model.metadata.contains(criteria),
+                self.model.timestamp >= start_time
+            )
+        ).order_by(self.model.timestamp.desc()).limit(limit).all()
+    
     def get_high_severity_events(
         self, 
         hours: int = 24, 
@@ -1390,6 +1532,62 @@ class EventRepository(BaseRepository[NetworkEvent]):
             for stat in stats
         }
 '''
+    
+    def _get_database_session(self) -> str:
+        return '''"""
+Database Session Management
+Pooled SQLAlchemy engine shared by the API and repositories
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..config import DatabaseConfig
+
+logger = logging.getLogger(__name__)
+
+# Recycle connections before server/proxy idle timeouts can drop them
+POOL_RECYCLE_SECONDS = 300
+CONNECT_TIMEOUT_SECONDS = 3
+
+# Rows per multi-row INSERT ... VALUES statement for executemany-style inserts
+INSERT_PAGE_SIZE = 5000
+
+def create_pooled_engine(config: DatabaseConfig) -> Engine:
+    """Create an engine whose connection pool is sized from the configuration"""
+    return create_engine(
+        config.connection_string,
+        pool_size=config.pool_size,
+        max_overflow=config.pool_size,
+        pool_pre_ping=True,  # SELECT 1 before handing out a pooled connection
+        pool_recycle=POOL_RECYCLE_SECONDS,
+        connect_args={"connect_timeout": CONNECT_TIMEOUT_SECONDS},
+        insertmanyvalues_page_size=INSERT_PAGE_SIZE,
+    )
+    
+def open_database(config: DatabaseConfig) -> Optional[Engine]:
+    """
+    Create the pooled engine and verify connectivity
+    
+    Returns:
+        The engine, or None if the database cannot be reached
+    """
+    engine = create_pooled_engine(config)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except SQLAlchemyError as e:
+        logger.warning(f"Database unavailable, continuing without it: {e}")
+        engine.dispose()
+        return None
+    
+    logger.info(f"Database pool ready (size {config.pool_size})")
+    return engine
+'''
 
     # =========================================================================
     # INTEGRATION FILE GENERATORS
@@ -1412,7 +1610,14 @@ logger = logging.getLogger(__name__)
 class CiscoISEClient:
     """Cisco Identity Services Engine API Client"""
     
-    def __init__(self, base_url: str, username: str, password: str, verify_ssl: bool = True):
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        verify_ssl: bool = True,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize Cisco ISE client
         
@@ -1421,12 +1626,14 @@ class CiscoISEClient:
             username: ISE admin username
             password: ISE admin password
             verify_ssl: Whether to verify SSL certificates
+            session: Session to reuse (and its open connections); a new
+                one is created when omitted
         """
         self.base_url = base_url.rstrip('/')
         self.username = username
         self.password = password
         self.verify_ssl = verify_ssl
-        self.session = requests.Session()
+        self.session = session if session is not None else requests.Session()
         self.session.auth = HTTPBasicAuth(username, password)
         self.session.headers.update({
             'Content-Type': 'application/json',
@@ -2246,12 +2453,13 @@ class NetworkAnomalyDetector:
         
         return metrics
     
-    def predict(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    def predict(self, df: pd.DataFrame, batch_size: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Predict anomalies in new data
         
         Args:
             df: DataFrame with network events
+            batch_size: Score at most this many rows at a time (bounds memory)
             
         Returns:
             Tuple of (predictions, anomaly_scores)
@@ -2261,6 +2469,18 @@ class NetworkAnomalyDetector:
         if not self.is_trained:
             raise ValueError("Model must be trained before prediction")
         
+        if batch_size is None or len(df) <= batch_size:
+            return self._predict_batch(df)
+        
+        batches = [
+            self._predict_batch(df.iloc[start:start + batch_size])
+            for start in range(0, len(df), batch_size)
+        ]
+        predictions, scores = zip(*batches)
+        return np.concatenate(predictions), np.concatenate(scores)
+    
+    def _predict_batch(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Score one batch of events"""
         X = self.prepare_features(df)
         X_scaled = self.scaler.transform(X)
         
@@ -2269,18 +2489,25 @@ class NetworkAnomalyDetector:
         
         return predictions, scores
     
-    def detect_anomalies(self, df: pd.DataFrame, threshold: Optional[float] = None) -> pd.DataFrame:
+    def detect_anomalies(
+        self,
+        df: pd.DataFrame,
+        threshold: Optional[float] = None,
+        batch_size: Optional[int] = None
+    ) -> pd.DataFrame:
         """
         Detect anomalies with detailed results
         
         Args:
             df: DataFrame with network events
             threshold: Custom threshold for anomaly scores
+            batch_size: Score at most this many rows at a time (bounds memory);
+                confidence is still normalized across all rows
             
         Returns:
             DataFrame with anomaly detection results
         """
-        predictions, scores = self.predict(df)
+        predictions, scores = self.predict(df, batch_size)
         
         results = df.copy()
         results['is_anomaly'] = predictions == -1
@@ -2330,13 +2557,17 @@ class NetworkAnomalyDetector:
             'version': self.version
         }
         
-        joblib.dump(model_data, path)
+        # Left uncompressed (compress=0) so load_model can memory-map the plain
+        # numpy arrays, which joblib cannot do for compressed files
+        joblib.dump(model_data, path, compress=0)
         logger.info(f"Model saved to {path}")
     
     @classmethod
     def load_model(cls, path: str) -> 'NetworkAnomalyDetector':
         """Load model from disk"""
-        model_data = joblib.load(path)
+        # Memory-map plain numpy arrays read-only; the trees' node arrays are
+        # still copied into process memory when sklearn unpickles them
+        model_data = joblib.load(path, mmap_mode='r')
         
         detector = cls()
         detector.model = model_data['model']
@@ -2356,6 +2587,7 @@ LSTM Time-Series Predictor
 Phase 4: Predictive maintenance and capacity forecasting
 """
 
+import importlib.util
 import numpy as np
 import pandas as pd
 from typing import Tuple, List, Dict, Optional
@@ -2363,17 +2595,21 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-# Try to import TensorFlow, but make it optional for local testing
-try:
-    import tensorflow as tf
-    from tensorflow import keras
-    from tensorflow.keras.models import Sequential
-    from tensorflow.keras.layers import LSTM, Dense, Dropout
-    from tensorflow.keras.callbacks import EarlyStopping, ModelCheckpoint
-    TF_AVAILABLE = True
-except ImportError:
+# TensorFlow is optional for local testing and only imported on first use,
+# so importing this module does not pay TensorFlow's multi-second load time
+TF_AVAILABLE = importlib.util.find_spec("tensorflow") is not None
+if not TF_AVAILABLE:
     logger.warning("TensorFlow not available. LSTM functionality will be limited.")
-    TF_AVAILABLE = False
+
+def __getattr__(name: str):
+    """Resolve the module-level tf/keras names lazily"""
+    if name == 'tf':
+        import tensorflow as tf
+        return tf
+    if name == 'keras':
+        from tensorflow import keras
+        return keras
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class NetworkLSTMPredictor:
     """
@@ -2419,6 +2655,9 @@ class NetworkLSTMPredictor:
         if not TF_AVAILABLE:
             raise RuntimeError("TensorFlow is required but not available")
         
+        from tensorflow.keras.models import Sequential
+        from tensorflow.keras.layers import LSTM, Dense, Dropout
+        
         self.model = Sequential()
         
         # First LSTM layer
@@ -2521,6 +2760,8 @@ class NetworkLSTMPredictor:
         if self.model is None:
             self._build_model(n_features=len(feature_columns))
         
+        from tensorflow.keras.callbacks import EarlyStopping
+        
         # Callbacks
         callbacks = [
             EarlyStopping(
@@ -2655,6 +2896,7 @@ class NetworkLSTMPredictor:
             raise RuntimeError("TensorFlow is required but not available")
         
         import joblib
+        from tensorflow import keras
         
         config = joblib.load(f"{path}_config.joblib")
         
@@ -2745,8 +2987,15 @@ class NetworkLSTMPredictor:
             "tests", "tests/unit", "tests/integration"
         ]
         
-        for dir_path in init_dirs:
-            self._create_file(f"{dir_path}/__init__.py", "# Package initialization\n")
+        # Directories first (one mkdir per package), then the files in parallel,
+        # which overlaps filesystem round trips on network/slow disks
+        init_files = [self.project_root / dir_path / "__init__.py" for dir_path in init_dirs]
+        for init_file in init_files:
+            init_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda path: path.write_bytes(b"# Package initialization\n"), init_files))
+        logger.debug(f"Created {len(init_files)} __init__.py files")
         
         logger.info("✓ Additional files generated")
     
@@ -2761,6 +3010,10 @@ Phase 4: Training pipeline for all ML models
 """
 
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Optional
 import pandas as pd
 import numpy as np
@@ -2768,6 +3021,23 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+def _forward_worker_logs(log_queue: multiprocessing.Queue, level: int) -> None:
+    """Pool initializer: hand this worker's log records to the parent process"""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+def _train_lstm_in_worker(trainer: "ModelTrainer", training_data_path: str) -> Dict:
+    """Train the LSTM in a pool worker, leaving half the cores to the forest"""
+    try:
+        import tensorflow as tf
+        threads = max(1, (os.cpu_count() or 2) // 2)
+        tf.config.threading.set_intra_op_parallelism_threads(threads)
+    except Exception:
+        pass
+    
+    return trainer.train_lstm_predictor(training_data_path)
+
 class ModelTrainer:
     """Centralized ML model training orchestrator"""
     
@@ -2781,7 +3051,7 @@ class ModelTrainer:
         logger.info("Training anomaly detection model...")
         
         # Load training data
-        df = pd.read_csv(training_data_path)
+        df = pd.read_parquet(training_data_path)
         
         # Import and train model
         from ..ml.models.anomaly_detector import NetworkAnomalyDetector
@@ -2801,7 +3071,7 @@ class ModelTrainer:
         logger.info("Training LSTM prediction model...")
         
         # Load training data
-        df = pd.read_csv(training_data_path, parse_dates=['timestamp'])
+        df = pd.read_parquet(training_data_path)
         df = df.set_index('timestamp')
         
         # Import and train model
@@ -2818,24 +3088,46 @@ class ModelTrainer:
         return metrics
     
     def train_all_models(self) -> Dict:
-        """Train all ML models"""
+        """Train all ML models (the models share no state, so they train in parallel)"""
         results = {}
         
+        anomaly_data = self.data_dir / "network_events_training.parquet"
+        lstm_data = self.data_dir / "timeseries_training.parquet"
+        
+        # Spawned workers start without the parent's TensorFlow/BLAS thread state,
+        # and without its logging setup, so their records come back over a queue
+        context = multiprocessing.get_context('spawn')
+        log_queue = context.Queue()
+        root = logging.getLogger()
+        listener = QueueListener(
+            log_queue,
+            *(root.handlers or [logging.lastResort]),
+            respect_handler_level=True
+        )
+        listener.start()
         try:
-            # Train anomaly detector
-            anomaly_data = self.data_dir / "network_events_training.csv"
-            if anomaly_data.exists():
-                results['anomaly_detector'] = self.train_anomaly_detector(str(anomaly_data))
-            
-            # Train LSTM predictor
-            lstm_data = self.data_dir / "timeseries_training.csv"
-            if lstm_data.exists():
-                results['lstm_predictor'] = self.train_lstm_predictor(str(lstm_data))
-            
+            with ProcessPoolExecutor(
+                max_workers=2,
+                mp_context=context,
+                initializer=_forward_worker_logs,
+                initargs=(log_queue, root.getEffectiveLevel())
+            ) as executor:
+                futures = {}
+                if anomaly_data.exists():
+                    futures['anomaly_detector'] = executor.submit(self.train_anomaly_detector, str(anomaly_data))
+                if lstm_data.exists():
+                    futures['lstm_predictor'] = executor.submit(_train_lstm_in_worker, self, str(lstm_data))
+                
+                for name, future in futures.items():
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error training {name}: {e}", exc_info=True)
+        finally:
+            listener.stop()
+        
+        if len(results) == len(futures):
             logger.info("All models trained successfully")
-            
-        except Exception as e:
-            logger.error(f"Error training models: {e}", exc_info=True)
         
         return results
 '''
@@ -2848,19 +3140,28 @@ Phase 4: Real-time inference for trained models
 
 import logging
 from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from collections import defaultdict
 import time
 
 logger = logging.getLogger(__name__)
 
+# Inference latency is logged as a running average once every N calls
+LATENCY_LOG_INTERVAL = 1000
+LATENCY_EMA_ALPHA = 0.05
+
 class InferenceEngine:
     """ML inference engine for real-time predictions"""
     
-    def __init__(self, models_dir: str = "data/models"):
+    def __init__(self, models_dir: str = "data/models", batch_size: int = 5000):
         self.models_dir = Path(models_dir)
+        self.batch_size = batch_size
         self.anomaly_detector = None
         self.lstm_predictor = None
+        self._calls = defaultdict(int)
+        self._ema_ms = defaultdict(float)
         self.load_models()
         
     def load_models(self) -> None:
@@ -2873,26 +3174,45 @@ class InferenceEngine:
                 self.anomaly_detector = NetworkAnomalyDetector.load_model(str(anomaly_path))
                 logger.info("Anomaly detector loaded")
             
-            # Load LSTM predictor
-            from ..ml.models.lstm_predictor import NetworkLSTMPredictor
+            # Load LSTM predictor (only then is TensorFlow imported)
             lstm_path = self.models_dir / "lstm_predictor_v1"
             if (lstm_path.parent / f"{lstm_path.name}.h5").exists():
+                from ..ml.models.lstm_predictor import NetworkLSTMPredictor
                 self.lstm_predictor = NetworkLSTMPredictor.load_model(str(lstm_path))
                 logger.info("LSTM predictor loaded")
                 
         except Exception as e:
             logger.error(f"Error loading models: {e}", exc_info=True)
+        
+        self._warm_up()
+    
+    def _warm_up(self) -> None:
+        """Run each model once on dummy input so first requests see steady latency"""
+        try:
+            if self.anomaly_detector is not None:
+                dummy_events = pd.DataFrame(
+                    np.zeros((2, 4)),
+                    columns=self.anomaly_detector.feature_names[:4]
+                )
+                self.anomaly_detector.predict(dummy_events)
+            
+            if self.lstm_predictor is not None:
+                predictor = self.lstm_predictor
+                sequence_shape = (predictor.sequence_length, predictor.scaler_X.n_features_in_)
+                predictor.predict(np.zeros(sequence_shape))
+        except Exception as e:
+            logger.warning(f"Model warm-up failed: {e}")
     
     def detect_anomalies(self, events_df: pd.DataFrame) -> pd.DataFrame:
         """Detect anomalies in network events"""
         if self.anomaly_detector is None:
             raise ValueError("Anomaly detector not loaded")
         
-        start_time = time.time()
-        results = self.anomaly_detector.detect_anomalies(events_df)
-        inference_time = (time.time() - start_time) * 1000  # Convert to ms
-        
-        logger.info(f"Anomaly detection completed in {inference_time:.2f}ms")
+        start_time = time.perf_counter()
+        results = self.anomaly_detector.detect_anomalies(
+            events_df, batch_size=self.batch_size
+        )
+        self._record_latency('Anomaly detection', time.perf_counter() - start_time)
         
         return results
     
@@ -2901,17 +3221,27 @@ class InferenceEngine:
         if self.lstm_predictor is None:
             raise ValueError("LSTM predictor not loaded")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         forecast = self.lstm_predictor.forecast(
             historical_df,
             feature_columns=['bandwidth_utilization'],
             steps_ahead=steps
         )
-        inference_time = (time.time() - start_time) * 1000
-        
-        logger.info(f"Capacity forecast completed in {inference_time:.2f}ms")
+        self._record_latency('Capacity forecast', time.perf_counter() - start_time)
         
         return forecast
+    
+    def _record_latency(self, name: str, elapsed: float) -> None:
+        """Fold one call into the running latency average, logging it periodically"""
+        elapsed_ms = elapsed * 1000
+        calls = self._calls[name] = self._calls[name] + 1
+        if calls == 1:
+            self._ema_ms[name] = elapsed_ms
+        else:
+            self._ema_ms[name] += LATENCY_EMA_ALPHA * (elapsed_ms - self._ema_ms[name])
+        
+        if calls % LATENCY_LOG_INTERVAL == 1 and logger.isEnabledFor(logging.INFO):
+            logger.info("%s latency avg=%.2fms calls=%d", name, self._ema_ms[name], calls)
 '''
     
     def _get_synthetic_data_generator(self) -> str:
@@ -2922,19 +3252,23 @@ Phase 4: Generate realistic network data for ML training
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
-import random
-from typing import Dict, List
+from typing import Dict, Iterator, List
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Rows generated and written per batch when streaming to disk
+EVENT_CHUNK_SIZE = 10_000
+
 class SyntheticDataGenerator:
     """Generate realistic synthetic network security data"""
     
     def __init__(self, seed: int = 42):
-        np.random.seed(seed)
-        random.seed(seed)
+        self.rng = np.random.default_rng(seed)
         self.ip_ranges = [
             "10.1.{}.{}",
             "192.168.{}.{}",
@@ -2942,6 +3276,11 @@ class SyntheticDataGenerator:
         ]
         self.protocols = ['TCP', 'UDP', 'ICMP', 'HTTP', 'HTTPS', 'DNS', 'SSH']
         self.event_types = ['connection', 'auth', 'data_transfer', 'api_call', 'file_access']
+        self.device_ids = np.array([f'device-{i:03d}' for i in range(1, 101)])
+        
+        # String lookup tables so IPs are joined column-at-a-time in Arrow
+        self._ip_prefixes = pa.array([r.rsplit('.', 2)[0] for r in self.ip_ranges])
+        self._octet_strings = pa.array([str(i) for i in range(256)])
         
     def generate_network_events(
         self, 
@@ -2955,68 +3294,101 @@ class SyntheticDataGenerator:
         if start_date is None:
             start_date = datetime.utcnow() - timedelta(days=30)
         
-        events = []
+        df = self._generate_event_chunk(num_events, anomaly_rate, start_date)
+        logger.info(f"Generated {len(df)} events ({df['is_anomaly'].sum()} anomalies)")
         
-        for i in range(num_events):
-            # Random timestamp
-            timestamp = start_date + timedelta(
-                seconds=random.randint(0, 30 * 24 * 3600)
-            )
-            
-            # Determine if this is an anomaly
-            is_anomaly = random.random() < anomaly_rate
-            
-            # Generate IP addresses
-            source_ip = self.ip_ranges[random.randint(0, 2)].format(
-                random.randint(1, 254),
-                random.randint(1, 254)
-            )
-            destination_ip = self.ip_ranges[random.randint(0, 2)].format(
-                random.randint(1, 254),
-                random.randint(1, 254)
+        return df
+    
+    def iter_network_events(
+        self,
+        num_events: int = 10000,
+        anomaly_rate: float = 0.05,
+        start_date: datetime = None,
+        chunk_size: int = EVENT_CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """Generate synthetic network events in chunks of at most chunk_size rows"""
+        if start_date is None:
+            start_date = datetime.utcnow() - timedelta(days=30)
+        
+        for start in range(0, num_events, chunk_size):
+            yield self._generate_event_chunk(
+                min(chunk_size, num_events - start), anomaly_rate, start_date
             )
-            
-            # Generate traffic characteristics
-            if is_anomaly:
-                # Anomalous traffic patterns
-                bytes_sent = random.randint(1000000, 10000000)  # Large transfer
-                bytes_received = random.randint(100, 1000)  # Minimal response
-                packets_sent = random.randint(500, 2000)
-                severity = random.choice(['high', 'critical'])
-            else:
-                # Normal traffic patterns
-                bytes_sent = random.randint(1000, 50000)
-                bytes_received = random.randint(1000, 50000)
-                packets_sent = random.randint(10, 100)
-                severity = random.choice(['low', 'medium'])
-            
-            packets_received = packets_sent + random.randint(-10, 10)
-            
-            event = {
-                'timestamp': timestamp,
-                'source_ip': source_ip,
-                'destination_ip': destination_ip,
-                'source_port': random.randint(1024, 65535),
-                'destination_port': random.choice([80, 443, 22, 3306, 5432, 8080]),
-                'protocol': random.choice(self.protocols),
-                'bytes_sent': bytes_sent,
-                'bytes_received': bytes_received,
-                'packets_sent': packets_sent,
-                'packets_received': packets_received,
-                'event_type': random.choice(self.event_types),
-                'severity': severity,
-                'device_id': f'device-{random.randint(1, 100):03d}',
-                'location': random.choice(['store-001', 'store-002', 'hq-datacenter', 'cloud-az-east']),
-                'is_anomaly': is_anomaly
-            }
-            
-            events.append(event)
+    
+    def _generate_event_chunk(
+        self,
+        num_events: int,
+        anomaly_rate: float,
+        start_date: datetime
+    ) -> pd.DataFrame:
+        """Generate one block of synthetic network events"""
+        rng = self.rng
+        n = num_events
         
-        df = pd.DataFrame(events)
-        logger.info(f"Generated {len(df)} events ({df['is_anomaly'].sum()} anomalies)")
+        # Random timestamps
+        timestamps = pd.Timestamp(start_date) + pd.to_timedelta(
+            rng.integers(0, 30 * 24 * 3600, n, endpoint=True), unit='s'
+        )
+        
+        # Determine which events are anomalies
+        is_anomaly = rng.random(n) < anomaly_rate
+        
+        # Generate traffic characteristics
+        # Anomalous traffic: large transfer with minimal response
+        bytes_sent = np.where(
+            is_anomaly,
+            rng.integers(1000000, 10000000, n, endpoint=True),
+            rng.integers(1000, 50000, n, endpoint=True)
+        )
+        bytes_received = np.where(
+            is_anomaly,
+            rng.integers(100, 1000, n, endpoint=True),
+            rng.integers(1000, 50000, n, endpoint=True)
+        )
+        packets_sent = np.where(
+            is_anomaly,
+            rng.integers(500, 2000, n, endpoint=True),
+            rng.integers(10, 100, n, endpoint=True)
+        )
+        packets_received = packets_sent + rng.integers(-10, 10, n, endpoint=True)
+        severity = np.where(
+            is_anomaly,
+            rng.choice(['high', 'critical'], n),
+            rng.choice(['low', 'medium'], n)
+        )
+        
+        df = pd.DataFrame({
+            'timestamp': timestamps,
+            'source_ip': self._generate_ips(n),
+            'destination_ip': self._generate_ips(n),
+            'source_port': rng.integers(1024, 65535, n, endpoint=True),
+            'destination_port': rng.choice([80, 443, 22, 3306, 5432, 8080], n),
+            'protocol': rng.choice(self.protocols, n),
+            'bytes_sent': bytes_sent,
+            'bytes_received': bytes_received,
+            'packets_sent': packets_sent,
+            'packets_received': packets_received,
+            'event_type': rng.choice(self.event_types, n),
+            'severity': severity,
+            'device_id': self.device_ids[rng.integers(0, len(self.device_ids), n)],
+            'location': rng.choice(['store-001', 'store-002', 'hq-datacenter', 'cloud-az-east'], n),
+            'is_anomaly': is_anomaly
+        })
         
         return df
     
+    def _generate_ips(self, count: int) -> np.ndarray:
+        """Generate random IP addresses within the configured ranges"""
+        ranges = self.rng.integers(0, len(self.ip_ranges), count)
+        octets = self.rng.integers(1, 254, (2, count), endpoint=True)
+        ips = pc.binary_join_element_wise(
+            self._ip_prefixes.take(ranges),
+            self._octet_strings.take(octets[0]),
+            self._octet_strings.take(octets[1]),
+            '.'
+        )
+        return ips.to_numpy(zero_copy_only=False)
+    
     def generate_timeseries_data(
         self,
         days: int = 90,
@@ -3026,16 +3398,17 @@ class SyntheticDataGenerator:
         logger.info(f"Generating {days} days of time-series data...")
         
         start_date = datetime.utcnow() - timedelta(days=days)
-        timestamps = pd.date_range(start=start_date, periods=days*24//interval_hours, freq=f'{interval_hours}H')
+        timestamps = pd.date_range(start=start_date, periods=days*24//interval_hours, freq=f'{interval_hours}h')
+        n = len(timestamps)
         
         # Base pattern with daily seasonality
-        base_utilization = 50 + 20 * np.sin(np.linspace(0, days * 2 * np.pi, len(timestamps)))
+        base_utilization = 50 + self._seasonal_pattern(20, 24 / interval_hours, n)
         
         # Add hourly pattern
-        hourly_pattern = 10 * np.sin(np.linspace(0, len(timestamps) * 2 * np.pi / 24, len(timestamps)))
+        hourly_pattern = self._seasonal_pattern(10, 24, n)
         
         # Add random noise
-        noise = np.random.normal(0, 5, len(timestamps))
+        noise = self.rng.normal(0, 5, len(timestamps))
         
         # Combine patterns
         bandwidth_utilization = np.clip(base_utilization + hourly_pattern + noise, 0, 100)
@@ -3051,22 +3424,42 @@ class SyntheticDataGenerator:
         
         return df
     
+    @staticmethod
+    def _seasonal_pattern(amplitude: float, period: float, count: int) -> np.ndarray:
+        """Sine wave with a period in samples, evaluated for one cycle and tiled"""
+        if period != int(period):
+            # A fractional period cannot be tiled exactly
+            return amplitude * np.sin(2 * np.pi * np.arange(count) / period)
+        
+        cycle = amplitude * np.sin(np.linspace(0, 2 * np.pi, int(period), endpoint=False))
+        return np.resize(cycle, count)
+    
     def save_training_data(self, output_dir: str = "data/training") -> None:
         """Generate and save all training datasets"""
         from pathlib import Path
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Generate network events
-        events_df = self.generate_network_events(num_events=50000)
-        events_path = output_path / "network_events_training.csv"
-        events_df.to_csv(events_path, index=False)
+        # Stream network events to disk so memory stays bounded by one chunk
+        num_events = 50000
+        logger.info(f"Generating {num_events} synthetic network events...")
+        events_path = output_path / "network_events_training.parquet"
+        writer = None
+        try:
+            for chunk in self.iter_network_events(num_events=num_events):
+                batch = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(events_path, batch.schema, compression="zstd")
+                writer.write_table(batch)
+        finally:
+            if writer is not None:
+                writer.close()
         logger.info(f"Saved network events to {events_path}")
         
         # Generate time-series data
         ts_df = self.generate_timeseries_data(days=90)
-        ts_path = output_path / "timeseries_training.csv"
-        ts_df.to_csv(ts_path, index=False)
+        ts_path = output_path / "timeseries_training.parquet"
+        ts_df.to_parquet(ts_path, compression="zstd", index=False)
         logger.info(f"Saved time-series data to {ts_path}")
 
 if __name__ == "__main__":
@@ -3085,19 +3478,21 @@ Main Application Entry Point
 Orchestrates all system components
 """
 
+import asyncio
 import logging
+import os
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.config import Config
+from src.config import get_config
 from src.core.orchestrator import SystemOrchestrator
 
-# Configure logging
+# Configure logging (LOG_LEVEL=WARNING in production skips INFO formatting)
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv('LOG_LEVEL', 'INFO').upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
@@ -3115,7 +3510,7 @@ def main():
     
     try:
         # Load configuration
-        config = Config()
+        config = get_config()
         
         # Initialize orchestrator
         orchestrator = SystemOrchestrator(config)
@@ -3126,7 +3521,7 @@ def main():
         logger.info("System started successfully")
         
         # Keep running
-        orchestrator.run()
+        asyncio.run(orchestrator.run())
         
     except KeyboardInterrupt:
         logger.info("Shutting down gracefully...")
@@ -3145,8 +3540,10 @@ Centralized configuration management
 """
 
 import os
-from typing import Optional
+from typing import Dict, Optional
 from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import quote_plus
 import logging
 
 logger = logging.getLogger(__name__)
@@ -3163,7 +3560,11 @@ class DatabaseConfig:
     
     @property
     def connection_string(self) -> str:
-        return f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
+        """SQLAlchemy URL for the psycopg2 driver (credentials URL-encoded)"""
+        return (
+            f"postgresql+psycopg2://{quote_plus(self.username)}:{quote_plus(self.password)}"
+            f"@{self.host}:{self.port}/{self.database}"
+        )
 
 @dataclass
 class ISEConfig:
@@ -3186,9 +3587,35 @@ class MLConfig:
     """ML models configuration"""
     models_dir: str
     training_data_dir: str
-    inference_batch_size: int = 100
+    inference_batch_size: int = 5000
     anomaly_threshold: float = 0.1
 
+@dataclass
+class RedisConfig:
+    """Redis cache configuration (disabled when host is empty)"""
+    host: str
+    port: int = 6379
+
+@dataclass
+class AlertingConfig:
+    """Security team alert webhooks (a channel is skipped when its URL is empty)"""
+    slack_webhook_url: str = ''
+    email_webhook_url: str = ''
+    servicenow_url: str = ''
+    
+    @property
+    def webhooks(self) -> Dict[str, str]:
+        return {
+            'slack': self.slack_webhook_url,
+            'email': self.email_webhook_url,
+            'servicenow': self.servicenow_url
+        }
+
+@dataclass
+class RemediationConfig:
+    """Remediation engine configuration"""
+    history_size: int = 100_000
+
 class Config:
     """Main application configuration"""
     
@@ -3226,15 +3653,44 @@ class Config:
         self.ml = MLConfig(
             models_dir=os.getenv('ML_MODELS_DIR', 'data/models'),
             training_data_dir=os.getenv('ML_TRAINING_DATA_DIR', 'data/training'),
-            inference_batch_size=int(os.getenv('ML_BATCH_SIZE', '100')),
+            inference_batch_size=int(os.getenv('ML_BATCH_SIZE', '5000')),
             anomaly_threshold=float(os.getenv('ML_ANOMALY_THRESHOLD', '0.1'))
         )
         
+        # Redis configuration
+        self.redis = RedisConfig(
+            host=os.getenv('REDIS_HOST', ''),
+            port=int(os.getenv('REDIS_PORT', '6379'))
+        )
+        
+        # Alerting configuration
+        self.alerting = AlertingConfig(
+            slack_webhook_url=os.getenv('ALERT_SLACK_WEBHOOK_URL', ''),
+            email_webhook_url=os.getenv('ALERT_EMAIL_WEBHOOK_URL', ''),
+            servicenow_url=os.getenv('ALERT_SERVICENOW_URL', '')
+        )
+        
+        # Remediation configuration
+        self.remediation = RemediationConfig(
+            history_size=int(os.getenv('REMEDIATION_HISTORY_SIZE', '100000'))
+        )
+        
         # API configuration
         self.api_host = os.getenv('API_HOST', '0.0.0.0')
         self.api_port = int(os.getenv('API_PORT', '8000'))
+        # Extra browser origins allowed by CORS (comma-separated, exact match)
+        self.cors_origins = [
+            origin.strip()
+            for origin in os.getenv('CORS_ORIGINS', '').split(',')
+            if origin.strip()
+        ]
         
         logger.info(f"Configuration loaded for environment: {self.environment}")
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Process-wide configuration, read from the environment on first use"""
+    return Config()
 '''
     
     def _get_orchestrator(self) -> str:
@@ -3243,10 +3699,9 @@ System Orchestrator
 Coordinates all system components and workflows
 """
 
+import asyncio
 import logging
 from typing import Dict
-import time
-import threading
 
 logger = logging.getLogger(__name__)
 
@@ -3257,6 +3712,8 @@ class SystemOrchestrator:
         self.config = config
         self.running = False
         self.components = {}
+        self._loop = None
+        self._stop_event = None
         
     def start(self) -> None:
         """Initialize and start all system components"""
@@ -3311,7 +3768,8 @@ class SystemOrchestrator:
         
         try:
             self.components['ml_engine'] = InferenceEngine(
-                models_dir=self.config.ml.models_dir
+                models_dir=self.config.ml.models_dir,
+                batch_size=self.config.ml.inference_batch_size
             )
             logger.info("ML engine initialized")
         except Exception as e:
@@ -3321,25 +3779,24 @@ class SystemOrchestrator:
         """Initialize REST API"""
         logger.info("API will be started separately")
     
-    def run(self) -> None:
-        """Main execution loop"""
+    async def run(self) -> None:
+        """Main execution loop; idles on an event until stop() is called"""
         logger.info("System orchestrator running...")
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        if not self.running:
+            return
         
-        while self.running:
-            try:
-                # Main processing loop
-                time.sleep(10)
-                
-            except KeyboardInterrupt:
-                logger.info("Shutdown requested")
-                self.running = False
-            except Exception as e:
-                logger.error(f"Error in main loop: {e}", exc_info=True)
+        await self._stop_event.wait()
+        logger.info("System orchestrator stopped")
     
     def stop(self) -> None:
         """Stop all components"""
         logger.info("Stopping orchestrator...")
         self.running = False
+        if self._loop is not None and self._stop_event is not None:
+            # stop() may be called from a signal handler or another thread
+            self._loop.call_soon_threadsafe(self._stop_event.set)
 '''
     
     def _get_remediation_engine(self) -> str:
@@ -3348,14 +3805,29 @@ Autonomous Remediation Engine
 Phase 4: AI-driven automated response actions
 """
 
+import asyncio
+import inspect
 import logging
-from typing import Dict, List, Optional
-from enum import Enum
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional
+from enum import StrEnum
+
+import httpx
+import orjson
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
-class RemediationAction(Enum):
-    """Available remediation actions"""
+# Default number of executed actions kept in memory; older entries are dropped first
+MAX_ACTION_HISTORY = 100_000
+
+# Alert channels notified concurrently by _alert_security_team
+ALERT_CHANNELS = ('slack', 'email', 'servicenow')
+
+class RemediationAction(StrEnum):
+    """Available remediation actions (members are their own string values)"""
     QUARANTINE_DEVICE = "quarantine_device"
     BLOCK_IP = "block_ip"
     ISOLATE_VLAN = "isolate_vlan"
@@ -3364,24 +3836,118 @@ class RemediationAction(Enum):
     UPDATE_POLICY = "update_policy"
     BLOCK_FILE = "block_file"
 
+@dataclass(slots=True, frozen=True)
+class Incident:
+    """Security incident, parsed once at the API boundary"""
+    type: str
+    severity: str = 'low'
+    confidence: float = 0.0
+    mac_address: Optional[str] = None
+    source_ip: Optional[str] = None
+    session_id: Optional[str] = None
+    dlp_incident_id: Optional[str] = None
+    # Remaining reported fields, forwarded untouched in alert payloads
+    details: Dict = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Incident':
+        """Build an incident from a payload dict; unknown keys go to details"""
+        known = {key: value for key, value in data.items() if key in INCIDENT_FIELDS}
+        details = {key: value for key, value in data.items() if key not in INCIDENT_FIELDS}
+        return cls(**known, details=details)
+
+# Payload keys that map onto Incident attributes
+INCIDENT_FIELDS = frozenset(Incident.__dataclass_fields__) - {'details'}
+
+class RemediationRule(NamedTuple):
+    """One action recommended for a matching incident type"""
+    action: RemediationAction
+    reasoning: str
+    confidence_factor: float = 1.0
+    # Own confidence bar for autonomy; None uses the incident-wide rule
+    autonomous_above: Optional[float] = None
+
+HIGH_SEVERITIES = frozenset({'high', 'critical'})
+
+# Incident-type keyword -> recommended actions, built once at import
+INCIDENT_RULES = (
+    ('data_exfiltration', (
+        RemediationRule(
+            RemediationAction.QUARANTINE_DEVICE,
+            'Prevent further data loss by isolating device'
+        ),
+        RemediationRule(
+            RemediationAction.BLOCK_FILE,
+            'Quarantine potentially exfiltrated files'
+        ),
+    )),
+    ('unauthorized_access', (
+        RemediationRule(
+            RemediationAction.TERMINATE_SESSION,
+            'Terminate unauthorized session immediately'
+        ),
+        # Slightly lower confidence for IP block
+        RemediationRule(
+            RemediationAction.BLOCK_IP,
+            'Block source IP to prevent further access',
+            confidence_factor=0.9,
+            autonomous_above=0.85
+        ),
+    )),
+    ('malware', (
+        RemediationRule(
+            RemediationAction.QUARANTINE_DEVICE,
+            'Isolate infected device to prevent spread'
+        ),
+    )),
+)
+
 class RemediationEngine:
     """Autonomous remediation decision and execution engine"""
     
-    def __init__(self, ise_client=None, dlp_client=None):
+    def __init__(
+        self,
+        ise_client=None,
+        dlp_client=None,
+        alert_client: Optional[httpx.AsyncClient] = None,
+        alert_webhooks: Optional[Dict[str, str]] = None,
+        history_size: int = MAX_ACTION_HISTORY
+    ):
         self.ise_client = ise_client
         self.dlp_client = dlp_client
-        self.action_history = []
+        self.alert_client = alert_client
+        # Channel name -> webhook URL; channels without a URL are skipped
+        self.alert_webhooks = {
+            channel: url for channel, url in (alert_webhooks or {}).items() if url
+        }
+        # Ring buffers: O(1) append, and the oldest entries drop out at history_size
+        self.action_history = deque(maxlen=history_size)
+        
+        # Columnar copy of the history for analytics (see history_frame)
+        self._history_columns = {
+            name: deque(maxlen=history_size)
+            for name in ('executed_at', 'action', 'incident_type', 'severity', 'success')
+        }
+        
+        # Action value -> executor, for O(1) dispatch in execute_remediation
+        self._executors = {
+            RemediationAction.QUARANTINE_DEVICE: self._quarantine_device,
+            RemediationAction.BLOCK_IP: self._block_ip,
+            RemediationAction.TERMINATE_SESSION: self._terminate_session,
+            RemediationAction.BLOCK_FILE: self._block_file,
+            RemediationAction.ALERT_SECURITY_TEAM: self._alert_security_team
+        }
         
     def decide_remediation(
         self, 
-        incident: Dict,
+        incident: Incident,
         confidence_threshold: float = 0.80
     ) -> List[Dict]:
         """
         Decide appropriate remediation actions based on incident
         
         Args:
-            incident: Incident dictionary with type, severity, confidence
+            incident: Incident with type, severity, confidence
             confidence_threshold: Minimum confidence for autonomous action
             
         Returns:
@@ -3389,61 +3955,36 @@ class RemediationEngine:
         """
         actions = []
         
-        # Extract incident details
-        incident_type = incident.get('type', '')
-        severity = incident.get('severity', 'low')
-        confidence = incident.get('confidence', 0.0)
+        # Extract incident details (type folded once for the keyword scan)
+        incident_type = incident.type.casefold()
+        severity = incident.severity
+        confidence = incident.confidence
         
         # High confidence + high severity = autonomous action
-        autonomous = confidence >= confidence_threshold and severity in ['high', 'critical']
-        
-        # Decision logic based on incident type
-        if 'data_exfiltration' in incident_type.lower():
-            actions.extend([
-                {
-                    'action': RemediationAction.QUARANTINE_DEVICE.value,
-                    'reasoning': 'Prevent further data loss by isolating device',
-                    'confidence': confidence,
-                    'autonomous': autonomous
-                },
-                {
-                    'action': RemediationAction.BLOCK_FILE.value,
-                    'reasoning': 'Quarantine potentially exfiltrated files',
-                    'confidence': confidence,
-                    'autonomous': autonomous
-                }
-            ])
-        
-        elif 'unauthorized_access' in incident_type.lower():
-            actions.extend([
-                {
-                    'action': RemediationAction.TERMINATE_SESSION.value,
-                    'reasoning': 'Terminate unauthorized session immediately',
-                    'confidence': confidence,
-                    'autonomous': autonomous
-                },
-                {
-                    'action': RemediationAction.BLOCK_IP.value,
-                    'reasoning': 'Block source IP to prevent further access',
-                    'confidence': confidence * 0.9,  # Slightly lower confidence for IP block
-                    'autonomous': confidence >= 0.85
-                }
-            ])
-        
-        elif 'malware' in incident_type.lower():
-            actions.extend([
-                {
-                    'action': RemediationAction.QUARANTINE_DEVICE.value,
-                    'reasoning': 'Isolate infected device to prevent spread',
-                    'confidence': confidence,
-                    'autonomous': autonomous
-                }
-            ])
+        high_severity = severity in HIGH_SEVERITIES
+        autonomous = confidence >= confidence_threshold and high_severity
+        
+        # Decision logic based on incident type (first matching keyword wins)
+        for keyword, rules in INCIDENT_RULES:
+            if keyword in incident_type:
+                actions.extend(
+                    {
+                        'action': rule.action,
+                        'reasoning': rule.reasoning,
+                        'confidence': confidence * rule.confidence_factor,
+                        'autonomous': (
+                            autonomous if rule.autonomous_above is None
+                            else confidence >= rule.autonomous_above
+                        )
+                    }
+                    for rule in rules
+                )
+                break
         
         # Always alert for high/critical severity
-        if severity in ['high', 'critical']:
+        if high_severity:
             actions.append({
-                'action': RemediationAction.ALERT_SECURITY_TEAM.value,
+                'action': RemediationAction.ALERT_SECURITY_TEAM,
                 'reasoning': 'High severity incident requires human review',
                 'confidence': 1.0,
                 'autonomous': True
@@ -3453,7 +3994,7 @@ class RemediationEngine:
         
         return actions
     
-    def execute_remediation(self, action: Dict, incident: Dict) -> Dict:
+    async def execute_remediation(self, action: Dict, incident: Incident) -> Dict:
         """
         Execute a remediation action
         
@@ -3474,30 +4015,15 @@ class RemediationEngine:
         }
         
         try:
-            if action_type == RemediationAction.QUARANTINE_DEVICE.value:
-                result = self._quarantine_device(incident)
-            
-            elif action_type == RemediationAction.BLOCK_IP.value:
-                result = self._block_ip(incident)
-            
-            elif action_type == RemediationAction.TERMINATE_SESSION.value:
-                result = self._terminate_session(incident)
-            
-            elif action_type == RemediationAction.BLOCK_FILE.value:
-                result = self._block_file(incident)
-            
-            elif action_type == RemediationAction.ALERT_SECURITY_TEAM.value:
-                result = self._alert_security_team(incident)
-            
+            executor = self._executors.get(action_type)
+            if executor is not None:
+                result = executor(incident)
+                if inspect.isawaitable(result):
+                    result = await result
             else:
                 result['message'] = f"Unknown action type: {action_type}"
             
-            # Log action
-            self.action_history.append({
-                'action': action,
-                'incident': incident,
-                'result': result
-            })
+            self._record_action(action, incident, result)
             
         except Exception as e:
             logger.error(f"Error executing remediation: {e}", exc_info=True)
@@ -3505,9 +4031,35 @@ class RemediationEngine:
         
         return result
     
-    def _quarantine_device(self, incident: Dict) -> Dict:
-        """Quarantine a device using ISE"""
-        mac_address = incident.get('mac_address')
+    def _record_action(self, action: Dict, incident: Incident, result: Dict) -> None:
+        """Append an executed action to the bounded history"""
+        self.action_history.append({
+            'action': action,
+            'incident': incident,
+            'result': result
+        })
+        
+        columns = self._history_columns
+        columns['executed_at'].append(datetime.utcnow())
+        columns['action'].append(action.get('action'))
+        columns['incident_type'].append(incident.type)
+        columns['severity'].append(incident.severity)
+        columns['success'].append(bool(result.get('success')))
+    
+    def history_frame(self) -> pd.DataFrame:
+        """Executed actions as a DataFrame, one typed column per field"""
+        return pd.DataFrame({name: list(values) for name, values in self._history_columns.items()})
+    
+    def action_history_json(self) -> bytes:
+        """Serialize the action history to JSON bytes (numpy values included)"""
+        return orjson.dumps(
+            list(self.action_history),
+            option=orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+        )
+    
+    async def _quarantine_device(self, incident: Incident) -> Dict:
+        """Quarantine a device using ISE (its blocking client runs in a thread)"""
+        mac_address = incident.mac_address
         
         if not self.ise_client:
             return {'success': False, 'message': 'ISE client not available'}
@@ -3515,9 +4067,10 @@ class RemediationEngine:
         if not mac_address:
             return {'success': False, 'message': 'No MAC address provided'}
         
-        success = self.ise_client.quarantine_endpoint(
+        success = await asyncio.to_thread(
+            self.ise_client.quarantine_endpoint,
             mac_address,
-            reason=f"Security incident: {incident.get('type', 'Unknown')}"
+            reason=f"Security incident: {incident.type}"
         )
         
         return {
@@ -3525,9 +4078,9 @@ class RemediationEngine:
             'message': f"Device {mac_address} {'quarantined' if success else 'quarantine failed'}"
         }
     
-    def _block_ip(self, incident: Dict) -> Dict:
+    def _block_ip(self, incident: Incident) -> Dict:
         """Block an IP address"""
-        ip_address = incident.get('source_ip')
+        ip_address = incident.source_ip
         
         # Implementation would integrate with firewall/ACL management
         logger.info(f"Would block IP: {ip_address}")
@@ -3537,9 +4090,9 @@ class RemediationEngine:
             'message': f"IP {ip_address} blocked (simulated)"
         }
     
-    def _terminate_session(self, incident: Dict) -> Dict:
+    def _terminate_session(self, incident: Incident) -> Dict:
         """Terminate a network session"""
-        session_id = incident.get('session_id')
+        session_id = incident.session_id
         
         logger.info(f"Would terminate session: {session_id}")
         
@@ -3548,9 +4101,9 @@ class RemediationEngine:
             'message': f"Session {session_id} terminated (simulated)"
         }
     
-    def _block_file(self, incident: Dict) -> Dict:
-        """Block/quarantine a file using DLP"""
-        incident_id = incident.get('dlp_incident_id')
+    async def _block_file(self, incident: Incident) -> Dict:
+        """Block/quarantine a file using DLP (its blocking client runs in a thread)"""
+        incident_id = incident.dlp_incident_id
         
         if not self.dlp_client:
             return {'success': False, 'message': 'DLP client not available'}
@@ -3558,69 +4111,233 @@ class RemediationEngine:
         if not incident_id:
             return {'success': False, 'message': 'No DLP incident ID provided'}
         
-        success = self.dlp_client.quarantine_file(incident_id)
+        success = await asyncio.to_thread(self.dlp_client.quarantine_file, incident_id)
         
         return {
             'success': success,
             'message': f"File {'quarantined' if success else 'quarantine failed'}"
         }
     
-    def _alert_security_team(self, incident: Dict) -> Dict:
-        """Send alert to security team"""
-        # Implementation would integrate with Slack, email, ServiceNow, etc.
-        logger.info(f"ALERT: {incident.get('type')} - Severity: {incident.get('severity')}")
+    async def _alert_security_team(self, incident: Incident) -> Dict:
+        """Send alert to security team over every configured channel at once"""
+        # Lazy %-formatting: nothing is formatted when INFO is filtered out
+        logger.info("ALERT: %s - Severity: %s", incident.type, incident.severity)
+        
+        if self.alert_client is None or not self.alert_webhooks:
+            return {
+                'success': True,
+                'message': 'Security team alerted (simulated)'
+            }
+        
+        channels = [c for c in ALERT_CHANNELS if c in self.alert_webhooks]
+        # One round-trip instead of one per channel; a failed channel
+        # does not cancel the others
+        outcomes = await asyncio.gather(
+            *(self._post_alert(channel, incident) for channel in channels),
+            return_exceptions=True
+        )
+        
+        delivered = []
+        for channel, outcome in zip(channels, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error alerting security team via {channel}: {outcome}")
+            else:
+                delivered.append(channel)
         
         return {
-            'success': True,
-            'message': 'Security team alerted (simulated)'
+            'success': bool(delivered),
+            'message': f"Security team alerted via {', '.join(delivered) or 'no channel'}"
         }
+    
+    async def _post_alert(self, channel: str, incident: Incident) -> None:
+        """POST one incident alert to a channel's webhook"""
+        summary = f"{incident.type} - Severity: {incident.severity}"
+        
+        if channel == 'slack':
+            payload = {'text': f":rotating_light: {summary}"}
+        elif channel == 'email':
+            payload = {'subject': f"Security alert: {summary}", 'body': incident}
+        else:
+            payload = {
+                'short_description': summary,
+                'urgency': 1 if incident.severity == 'critical' else 2,
+                'description': incident
+            }
+        
+        response = await self.alert_client.post(
+            self.alert_webhooks[channel],
+            content=orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+            headers={'Content-Type': 'application/json'}
+        )
+        response.raise_for_status()
 '''
     
     def _get_api_app(self) -> str:
         return '''"""
 FastAPI Application
 REST API for the automation platform
+
+Serve it with the uvloop event loop and the httptools parser (the Dockerfile
+CMD does; WEB_CONCURRENCY sets the worker count):
+
+    uvicorn src.api.app:app --loop uvloop --http httptools --no-access-log
+
+create_app() builds a fresh, independent app, e.g. for tests.
 """
 
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
+from redis.exceptions import RedisError
+from sqlalchemy.orm import sessionmaker
 from typing import List, Optional
+from pathlib import Path
+import asyncio
 import logging
+import os
+import sys
+
+import httpx
+import redis.asyncio
+
+from ..automation.remediation.engine import RemediationEngine
+from ..config import RedisConfig, get_config
+from ..database.session import open_database
+from ..ml.inference.engine import InferenceEngine
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(
-    title="Walmart Network Security Automation API",
-    description="AI-Driven Network Security Automation Platform",
-    version="1.0.0"
-)
+# Browser clients are served from walmart.com subdomains, plus any origins
+# listed in CORS_ORIGINS (e.g. the local dashboard)
+CORS_ORIGIN_REGEX = r"https://([a-z0-9-]+\\.)*walmart\\.com"
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+async def open_redis(config: RedisConfig) -> Optional[redis.asyncio.Redis]:
+    """
+    Create the shared Redis client and open its first pooled connection
+    
+    Returns:
+        The client, or None if Redis is not configured
+    """
+    if not config.host:
+        return None
+    
+    client = redis.asyncio.Redis(
+        host=config.host,
+        port=config.port,
+        socket_connect_timeout=0.1,
+        socket_timeout=0.1,
+    )
+    try:
+        await client.ping()
+    except RedisError as e:
+        # Kept anyway: the pool reconnects once Redis is back
+        logger.warning(f"Redis unavailable, caching in-process only: {e}")
+    return client
+
+def configure_logging() -> None:
+    """Log to stdout and logs/application.log unless the root logger is already set up"""
+    if logging.getLogger().handlers:
+        return
+    
+    Path('logs').mkdir(exist_ok=True)
+    logging.basicConfig(
+        level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler('logs/application.log')
+        ]
+    )
 
-@app.on_event("startup")
-async def startup_event():
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared resources at startup and release them at shutdown"""
+    # Root handlers exist even when uvicorn imports the app directly
+    configure_logging()
     logger.info("API starting up...")
-
-@app.on_event("shutdown")
-async def shutdown_event():
+    config = get_config()
+    
+    # One pooled engine per worker; routes take sessions from app.state
+    engine = await asyncio.to_thread(open_database, config.database)
+    app.state.db_engine = engine
+    # Objects stay loaded after commit; every column default is client-side
+    app.state.db_sessions = (
+        sessionmaker(bind=engine, expire_on_commit=False) if engine is not None else None
+    )
+    
+    # Models are loaded once per worker, off the event loop. Only plain numpy
+    # arrays in the model file are memory-mapped; sklearn copies each tree's
+    # node arrays when unpickling, so every worker holds its own forest
+    app.state.inference = await asyncio.to_thread(
+        InferenceEngine, config.ml.models_dir, config.ml.inference_batch_size
+    )
+    
+    # Redis response cache, connected before the first request needs it
+    redis_client = await open_redis(config.redis)
+    app.state.redis = redis_client
+    
+    # Shared keep-alive client for outbound webhooks (security team alerts)
+    http_client = httpx.AsyncClient(timeout=httpx.Timeout(5.0))
+    app.state.http_client = http_client
+    app.state.remediation = RemediationEngine(
+        alert_client=http_client,
+        alert_webhooks=config.alerting.webhooks,
+        history_size=config.remediation.history_size
+    )
+    
+    yield
+    
     logger.info("API shutting down...")
+    await http_client.aclose()
+    if redis_client is not None:
+        await redis_client.aclose()
+    if engine is not None:
+        engine.dispose()
 
 # Import routes
-from .routes import health, anomaly
+from .routes import health, anomaly, incidents
+
+def create_app() -> FastAPI:
+    """Build the API application with its middleware and routes"""
+    app = FastAPI(
+        title="Walmart Network Security Automation API",
+        description="AI-Driven Network Security Automation Platform",
+        version="1.0.0",
+        # Serialize route return values with orjson instead of the stdlib encoder
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
+    )
+    
+    # Compress large JSON bodies (e.g. detection results); small ones go out as-is
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    
+    # CORS middleware (explicit lists; browsers cache preflights for a day)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=get_config().cors_origins,
+        allow_origin_regex=CORS_ORIGIN_REGEX,
+        allow_credentials=True,
+        allow_methods=["GET", "POST"],
+        allow_headers=["Authorization", "Content-Type"],
+        max_age=86400,
+    )
+    
+    app.include_router(health.router, prefix="/api/v1", tags=["health"])
+    app.include_router(anomaly.router, prefix="/api/v1", tags=["anomaly"])
+    app.include_router(incidents.router, prefix="/api/v1", tags=["incidents"])
+    
+    return app
 
-app.include_router(health.router, prefix="/api/v1", tags=["health"])
-app.include_router(anomaly.router, prefix="/api/v1", tags=["anomaly"])
+app = create_app()
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # C event loop and HTTP parser (uvloop has no Windows build)
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop=loop, http="httptools", log_level="warning")
 '''
     
     def _get_api_health(self) -> str:
@@ -3629,24 +4346,29 @@ Health Check Routes
 System health monitoring endpoints
 """
 
-from fastapi import APIRouter
-from typing import Dict
+import time
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
-@router.get("/health")
-async def health_check() -> Dict:
-    """Basic health check"""
-    return {
-        "status": "healthy",
-        "service": "Network Security Automation",
-        "version": "1.0.0"
-    }
+# Probes hit these every few seconds, so bodies are encoded ahead of time
+HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "Network Security Automation",
+    "version": "1.0.0"
+})
 
-@router.get("/health/detailed")
-async def detailed_health() -> Dict:
-    """Detailed health check with component status"""
-    return {
+# The detailed body carries uptime, so it is re-encoded at most this often
+DETAILED_HEALTH_TTL_SECONDS = 5.0
+
+_started_at = time.monotonic()
+_detailed_body = b""
+_detailed_expires_at = 0.0
+
+def _build_detailed_body(now: float) -> bytes:
+    """Encode the detailed health payload as of now"""
+    return orjson.dumps({
         "status": "healthy",
         "components": {
             "database": "healthy",
@@ -3655,10 +4377,27 @@ async def detailed_health() -> Dict:
             "ml_engine": "healthy"
         },
         "metrics": {
-            "uptime_seconds": 3600,
+            "uptime_seconds": int(now - _started_at),
             "requests_processed": 1000
         }
-    }
+    })
+
+@router.get("/health")
+async def health_check() -> Response:
+    """Basic health check"""
+    return Response(HEALTH_BODY, media_type="application/json")
+
+@router.get("/health/detailed")
+async def detailed_health() -> Response:
+    """Detailed health check with component status"""
+    global _detailed_body, _detailed_expires_at
+    
+    now = time.monotonic()
+    if now >= _detailed_expires_at:
+        _detailed_body = _build_detailed_body(now)
+        _detailed_expires_at = now + DETAILED_HEALTH_TTL_SECONDS
+    
+    return Response(_detailed_body, media_type="application/json")
 '''
     
     def _get_api_anomaly(self) -> str:
@@ -3667,47 +4406,262 @@ Anomaly Detection Routes
 Endpoints for anomaly detection and analysis
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import List, Dict
+import asyncio
+import logging
+import time
+import msgspec
+import orjson
+import pandas as pd
+import redis.asyncio
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from redis.exceptions import RedisError
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
-class AnomalyDetectionRequest(BaseModel):
-    """Request model for anomaly detection"""
-    events: List[Dict]
+# Unknown fields are dropped without being stored; instances are immutable
+API_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, ser_json_timedelta="iso8601")
+
+class NetworkEventIn(msgspec.Struct, frozen=True):
+    """One event to score; only the fields the detector reads are decoded"""
+    id: Union[int, str, None] = None
+    timestamp: Optional[str] = None
+    source_ip: Optional[str] = None
+    destination_port: Optional[int] = None
+    bytes_sent: Optional[float] = None
+    bytes_received: Optional[float] = None
+    packets_sent: Optional[float] = None
+    packets_received: Optional[float] = None
+
+class AnomalyDetectionRequest(msgspec.Struct, frozen=True):
+    """Request model for anomaly detection (decoded by msgspec, extra fields ignored)"""
+    events: List[NetworkEventIn]
     threshold: float = 0.1
 
+_request_decoder = msgspec.json.Decoder(AnomalyDetectionRequest)
+# Event schema inlined, since "#/$defs/..." refs do not resolve inside OpenAPI
+_schema_defs = msgspec.json.schema(AnomalyDetectionRequest)["$defs"]
+_request_schema = _schema_defs["AnomalyDetectionRequest"]
+_request_schema["properties"]["events"]["items"] = _schema_defs["NetworkEventIn"]
+
 class AnomalyDetectionResponse(BaseModel):
     """Response model for anomaly detection"""
+    model_config = API_MODEL_CONFIG
+    
     anomalies_detected: int
     total_events: int
     anomaly_rate: float
     results: List[Dict]
+    
+    def model_dump(self, **kwargs) -> Dict:
+        """Dump without None values, including inside each result dict"""
+        kwargs.setdefault("exclude_none", True)
+        data = super().model_dump(**kwargs)
+        if kwargs["exclude_none"] and "results" in data:
+            data["results"] = [
+                {key: value for key, value in result.items() if value is not None}
+                for result in data["results"]
+            ]
+        return data
+
+# Fields the detector reads directly; missing counters count as 0
+EVENT_COUNTER_FIELDS = ('bytes_sent', 'bytes_received', 'packets_sent', 'packets_received')
+# Left out of the frame when no event carries them, so the detector's
+# defaults apply (no timestamp -> default hour/day, no port -> no scan count)
+EVENT_OPTIONAL_FIELDS = ('id', 'timestamp', 'destination_port')
+
+def _events_frame(events: List[NetworkEventIn]) -> pd.DataFrame:
+    """Build a column-per-field frame from decoded events"""
+    columns = {'source_ip': [event.source_ip for event in events]}
+    for name in EVENT_COUNTER_FIELDS:
+        columns[name] = [
+            0.0 if value is None else value
+            for value in (getattr(event, name) for event in events)
+        ]
+    for name in EVENT_OPTIONAL_FIELDS:
+        values = [getattr(event, name) for event in events]
+        if any(value is not None for value in values):
+            columns[name] = values
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(events)))
 
-@router.post("/anomaly/detect", response_model=AnomalyDetectionResponse)
-async def detect_anomalies(request: AnomalyDetectionRequest):
+def _detect(inference, events: List[NetworkEventIn]) -> Tuple[int, List[Dict]]:
+    """Score events and return (anomaly count, anomalous result rows)
+    
+    Each row carries event_index, the position of its event in the request.
+    CPU-bound (pandas/sklearn), so it is run in a worker thread.
+    """
+    results = inference.detect_anomalies(_events_frame(events))
+    anomalies = results.loc[results["is_anomaly"]]
+    return len(anomalies), anomalies.reset_index(names="event_index").to_dict("records")
+
+# Schema is documented via responses= only; no response_model revalidation per call
+@router.post(
+    "/anomaly/detect",
+    responses={200: {"model": AnomalyDetectionResponse}},
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": _request_schema}},
+            "required": True
+        }
+    }
+)
+async def detect_anomalies(raw: Request) -> ORJSONResponse:
     """Detect anomalies in network events"""
+    # msgspec decodes and validates the (potentially large) event list in one pass
+    try:
+        request = _request_decoder.decode(await raw.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    inference = raw.app.state.inference
+    if inference.anomaly_detector is None:
+        raise HTTPException(status_code=503, detail="Anomaly detector not loaded")
+    
     try:
-        # Implementation will use ML engine
-        return AnomalyDetectionResponse(
-            anomalies_detected=5,
-            total_events=len(request.events),
-            anomaly_rate=5 / len(request.events) if request.events else 0,
-            results=[]
+        total_events = len(request.events)
+        anomalies_detected, results = 0, []
+        if total_events:
+            # Off the event loop, so other requests are served while this scores
+            anomalies_detected, results = await asyncio.to_thread(
+                _detect, inference, request.events
+            )
+        
+        # model_construct skips validation: values are computed server-side and
+        # must already match the field types, since nothing coerces or checks them
+        response = AnomalyDetectionResponse.model_construct(
+            anomalies_detected=anomalies_detected,
+            total_events=total_events,
+            # float even when empty, since model_construct does not coerce
+            anomaly_rate=anomalies_detected / total_events if total_events else 0.0,
+            results=results
         )
+        return ORJSONResponse(content=response.model_dump())
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Recent-anomaly responses are cached per (hours, limit): in-process for
+# repeated dashboard polls, and in Redis (when configured) across workers
+RECENT_CACHE_TTL_SECONDS = 30
+RECENT_CACHE_MAX_ENTRIES = 256
+
+_recent_cache: Dict[Tuple[int, int], Tuple[float, bytes]] = {}
+# Loads in progress, so concurrent misses for a key share one query
+_recent_inflight: Dict[Tuple[int, int], asyncio.Future] = {}
+
+def _query_recent_anomalies(hours: int, limit: int) -> Dict:
+    """Load recent anomaly detections from the store"""
+    return {"anomalies": [], "count": 0, "time_range_hours": hours}
+    
+async def _load_recent_anomalies(
+    client: Optional[redis.asyncio.Redis], hours: int, limit: int
+) -> bytes:
+    """Encoded recent anomalies, read through the Redis cache when available"""
+    key = f"anom:{hours}:{limit}"
+    if client is not None:
+        try:
+            body = await client.get(key)
+            if body is not None:
+                return body
+        except RedisError as e:
+            logger.warning(f"Redis cache read failed: {e}")
+            client = None
+    
+    body = orjson.dumps(_query_recent_anomalies(hours, limit))
+    if client is not None:
+        try:
+            await client.setex(key, RECENT_CACHE_TTL_SECONDS, body)
+        except RedisError as e:
+            logger.warning(f"Redis cache write failed: {e}")
+    return body
+    
 @router.get("/anomaly/recent")
-async def get_recent_anomalies(hours: int = 24, limit: int = 100):
+async def get_recent_anomalies(request: Request, hours: int = 24, limit: int = 100) -> Response:
     """Get recent anomaly detections"""
-    return {
-        "anomalies": [],
-        "count": 0,
-        "time_range_hours": hours
-    }
+    key = (hours, limit)
+    now = time.monotonic()
+    cached = _recent_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return Response(cached[1], media_type="application/json")
+    
+    load = _recent_inflight.get(key)
+    if load is None:
+        # Shared client opened in the app lifespan (None without REDIS_HOST)
+        load = asyncio.ensure_future(
+            _load_recent_anomalies(request.app.state.redis, hours, limit)
+        )
+        _recent_inflight[key] = load
+        load.add_done_callback(lambda _: _recent_inflight.pop(key, None))
+    # Shielded: a disconnecting client must not cancel the others' load
+    body = await asyncio.shield(load)
+    if key not in _recent_cache and len(_recent_cache) >= RECENT_CACHE_MAX_ENTRIES:
+        # Evict the oldest key (dicts keep insertion order)
+        del _recent_cache[next(iter(_recent_cache))]
+    _recent_cache[key] = (now + RECENT_CACHE_TTL_SECONDS, body)
+    return Response(body, media_type="application/json")
+    '''
+    
+    def _get_api_incidents(self) -> str:
+        return '''"""
+Incident Routes
+Endpoints for incident remediation
+"""
+
+from fastapi import APIRouter, BackgroundTasks, Request
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, List
+import logging
+
+from ...automation.remediation.engine import Incident, RemediationEngine
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+class IncidentRequest(BaseModel):
+    """Incident to remediate (extra fields such as mac_address are kept)"""
+    model_config = ConfigDict(extra='allow', frozen=True)
+    
+    type: str
+    severity: str = 'low'
+    confidence: float = 0.0
+
+class IncidentRemediationResponse(BaseModel):
+    """Recommended actions and how many were scheduled to run autonomously"""
+    actions: List[Dict]
+    scheduled: int
+
+async def _run_actions(engine: RemediationEngine, actions: List[Dict], incident: Incident) -> None:
+    """Execute autonomous actions after the response has been sent"""
+    for action in actions:
+        result = await engine.execute_remediation(action, incident)
+        logger.info(f"Remediation {action['action']}: {result.get('message')}")
+
+@router.post("/incidents/remediate", response_model=IncidentRemediationResponse, status_code=202)
+async def remediate_incident(
+    incident: IncidentRequest,
+    request: Request,
+    background_tasks: BackgroundTasks
+) -> IncidentRemediationResponse:
+    """
+    Recommend remediation actions and run the autonomous ones in the background
+    
+    Alerting and device actions can take several round-trips, so they run
+    after the response is returned.
+    """
+    engine: RemediationEngine = request.app.state.remediation
+    incident_data = Incident.from_dict(incident.model_dump())
+    
+    actions = engine.decide_remediation(incident_data)
+    autonomous = [action for action in actions if action['autonomous']]
+    if autonomous:
+        background_tasks.add_task(_run_actions, engine, autonomous, incident_data)
+    
+    return IncidentRemediationResponse(actions=actions, scheduled=len(autonomous))
 '''
     
     def _get_docker_compose(self) -> str:
@@ -3718,6 +4672,7 @@ services:
   postgres:
     image: timescale/timescaledb:latest-pg15
     container_name: walmart-netsec-postgres
+    command: postgres -c default_toast_compression=lz4
     environment:
       POSTGRES_DB: network_security_automation
       POSTGRES_USER: postgres
@@ -3849,16 +4804,28 @@ networks:
 '''
     
     def _get_dockerfile(self) -> str:
-        return '''FROM python:3.13-slim
+        return '''FROM python:3.13-slim-bookworm
 
 WORKDIR /app
 
+# Unbuffered logs, no .pyc writes at runtime, asserts stripped (-O; docstrings
+# are kept because FastAPI builds the OpenAPI descriptions from them)
+ENV PYTHONUNBUFFERED=1 \\
+    PYTHONDONTWRITEBYTECODE=1 \\
+    PYTHONOPTIMIZE=1 \\
+    PYTHONMALLOC=mimalloc
+
 # Install system dependencies
 RUN apt-get update && apt-get install -y \\
     gcc \\
     g++ \\
     postgresql-client \\
-    && rm -rf /var/lib/apt/lists/*
+    libmimalloc2.0 \\
+    && rm -rf /var/lib/apt/lists/* \\
+    && ln -s /usr/lib/*-linux-gnu/libmimalloc.so.2 /usr/local/lib/libmimalloc.so.2
+
+# mimalloc also serves native allocations (numpy/sklearn buffers)
+ENV LD_PRELOAD=/usr/local/lib/libmimalloc.so.2
 
 # Copy requirements
 COPY requirements.txt .
@@ -3871,8 +4838,13 @@ COPY data/ ./data/
 # Create logs directory
 RUN mkdir -p /app/logs
 
+# One uvicorn worker per CPU of the pod's limit (2000m); override with
+# WEB_CONCURRENCY. Access logging is off since it costs a write per request.
+ENV WEB_CONCURRENCY=2
+
 # Run application
-CMD ["python", "-m", "src.main"]
+CMD ["uvicorn", "src.api.app:app", "--host", "0.0.0.0", "--port", "8000", \\
+     "--loop", "uvloop", "--http", "httptools", "--no-access-log"]
 '''
     
     def _get_dockerignore(self) -> str:
@@ -3926,6 +4898,8 @@ docs/build/
         return '''# Core dependencies
 fastapi==0.104.1
 uvicorn[standard]==0.24.0
+uvloop==0.19.0; sys_platform != "win32"
+httptools==0.6.1
 pydantic==2.5.0
 python-dotenv==1.0.0
 
@@ -3941,10 +4915,15 @@ redis==5.0.1
 requests==2.31.0
 httpx==0.25.1
 
+# Serialization
+orjson==3.10.12
+msgspec==0.19.0
+
 # ML/AI
 scikit-learn==1.3.2
 numpy==1.26.2
 pandas==2.1.3
+pyarrow==18.1.0
 joblib==1.3.2
 
 # Optional: TensorFlow for LSTM (heavy dependency)
@@ -3997,9 +4976,12 @@ ipdb==0.13.13
 
 # Application
 ENVIRONMENT=development
+# Use WARNING in production: INFO logs are not formatted at all then
 LOG_LEVEL=INFO
 API_HOST=0.0.0.0
 API_PORT=8000
+# Browser origins allowed besides *.walmart.com (comma-separated)
+CORS_ORIGINS=http://localhost:5173
 
 # Database
 DB_HOST=localhost
@@ -4025,10 +5007,18 @@ DLP_USERNAME=admin
 DLP_PASSWORD=admin
 DLP_VERIFY_SSL=false
 
+# Security team alert webhooks (leave empty to only log alerts)
+ALERT_SLACK_WEBHOOK_URL=
+ALERT_EMAIL_WEBHOOK_URL=
+ALERT_SERVICENOW_URL=
+
+# Remediation (executed actions kept in memory per worker)
+REMEDIATION_HISTORY_SIZE=100000
+
 # ML Configuration
 ML_MODELS_DIR=data/models
 ML_TRAINING_DATA_DIR=data/training
-ML_BATCH_SIZE=100
+ML_BATCH_SIZE=5000
 ML_ANOMALY_THRESHOLD=0.1
 
 # Azure (for production deployment)
@@ -4165,6 +5155,9 @@ spec:
             secretKeyRef:
               name: app-secrets
               key: DB_PASSWORD
+        # Models ship in the image (COPY data/); each worker loads its own copy
+        - name: ML_MODELS_DIR
+          value: "/app/data/models"
         resources:
           requests:
             memory: "512Mi"
@@ -4215,7 +5208,7 @@ data:
   DB_NAME: "network_security_automation"
   REDIS_HOST: "redis-service"
   REDIS_PORT: "6379"
-  LOG_LEVEL: "INFO"
+  LOG_LEVEL: "WARNING"
 '''
     
     def _get_ansible_deploy_local(self) -> str:
@@ -4495,9 +5488,15 @@ import pytest
 import sys
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Rows in the shared synthetic_events frame (enough for the performance tests)
+SYNTHETIC_EVENT_ROWS = 1000
+
 @pytest.fixture
 def sample_network_event():
     """Sample network event for testing"""
@@ -4518,6 +5517,36 @@ def sample_network_event():
         'location': 'store-001'
     }
 
+@pytest.fixture(scope="session")
+def synthetic_events():
+    """
+    Synthetic hourly traffic built once per test session
+    
+    Tests slice rows from it instead of rebuilding a frame each; the
+    detector never modifies its input, so sharing is safe.
+    """
+    rng = np.random.default_rng(0)
+    n_rows = SYNTHETIC_EVENT_ROWS
+    counters = np.empty((n_rows, 4), dtype=np.int32)
+    counters[:, :2] = rng.integers(1000, 50000, size=(n_rows, 2), dtype=np.int32)
+    counters[:, 2:] = rng.integers(10, 100, size=(n_rows, 2), dtype=np.int32)
+    
+    df = pd.DataFrame(
+        counters,
+        columns=['bytes_sent', 'bytes_received', 'packets_sent', 'packets_received'],
+        copy=False
+    )
+    df['timestamp'] = pd.date_range('2024-01-01', periods=n_rows, freq='h').as_unit('s')
+    return df
+
+@pytest.fixture(scope="session")
+def ise_session():
+    """HTTP session shared by every ISE integration test, so connections are reused"""
+    import requests
+    session = requests.Session()
+    yield session
+    session.close()
+
 @pytest.fixture
 def sample_security_incident():
     """Sample security incident for testing"""
@@ -4538,7 +5567,6 @@ Phase 7: ML model testing
 
 import pytest
 import pandas as pd
-import numpy as np
 from src.ml.models.anomaly_detector import NetworkAnomalyDetector
 
 class TestNetworkAnomalyDetector:
@@ -4559,17 +5587,9 @@ class TestNetworkAnomalyDetector:
         assert features.shape[0] == 1
         assert features.shape[1] == len(detector.feature_names)
     
-    def test_training(self):
+    def test_training(self, synthetic_events):
         """Test model training"""
-        # Generate synthetic training data
-        data = {
-            'bytes_sent': np.random.randint(1000, 50000, 100),
-            'bytes_received': np.random.randint(1000, 50000, 100),
-            'packets_sent': np.random.randint(10, 100, 100),
-            'packets_received': np.random.randint(10, 100, 100),
-            'timestamp': pd.date_range('2024-01-01', periods=100, freq='H')
-        }
-        df = pd.DataFrame(data)
+        df = synthetic_events[:100]
         
         detector = NetworkAnomalyDetector(contamination=0.1)
         metrics = detector.train(df)
@@ -4578,17 +5598,10 @@ class TestNetworkAnomalyDetector:
         assert metrics['samples_trained'] == 100
         assert 0 <= metrics['anomaly_rate'] <= 1
     
-    def test_prediction(self):
+    def test_prediction(self, synthetic_events):
         """Test anomaly prediction"""
         # Train model
-        data = {
-            'bytes_sent': np.random.randint(1000, 50000, 100),
-            'bytes_received': np.random.randint(1000, 50000, 100),
-            'packets_sent': np.random.randint(10, 100, 100),
-            'packets_received': np.random.randint(10, 100, 100),
-            'timestamp': pd.date_range('2024-01-01', periods=100, freq='H')
-        }
-        df = pd.DataFrame(data)
+        df = synthetic_events[:100]
         
         detector = NetworkAnomalyDetector(contamination=0.1)
         detector.train(df)
@@ -4615,13 +5628,14 @@ class TestCiscoISEIntegration:
     """Test ISE integration with simulator"""
     
     @pytest.fixture
-    def ise_client(self):
-        """Create ISE client connected to simulator"""
+    def ise_client(self, ise_session):
+        """Create ISE client connected to simulator (on the shared session)"""
         return CiscoISEClient(
             base_url='http://localhost:9060',
             username='admin',
             password='admin',
-            verify_ssl=False
+            verify_ssl=False,
+            session=ise_session
         )
     
     def test_get_endpoints(self, ise_client):
@@ -4643,26 +5657,17 @@ Phase 7: Load and performance testing
 """
 
 import pytest
+import statistics
 import time
-import pandas as pd
-import numpy as np
 from src.ml.models.anomaly_detector import NetworkAnomalyDetector
 
 @pytest.mark.performance
 class TestPerformance:
     """Performance benchmarks"""
     
-    def test_anomaly_detection_latency(self):
+    def test_anomaly_detection_latency(self, synthetic_events):
         """Test anomaly detection latency < 100ms for 100 events"""
-        # Generate test data
-        data = {
-            'bytes_sent': np.random.randint(1000, 50000, 1000),
-            'bytes_received': np.random.randint(1000, 50000, 1000),
-            'packets_sent': np.random.randint(10, 100, 1000),
-            'packets_received': np.random.randint(10, 100, 1000),
-            'timestamp': pd.date_range('2024-01-01', periods=1000, freq='H')
-        }
-        df = pd.DataFrame(data)
+        df = synthetic_events
         
         # Train model
         detector = NetworkAnomalyDetector()
@@ -4671,11 +5676,18 @@ class TestPerformance:
         # Test inference latency
         test_data = df[800:][:100]
         
-        start = time.time()
-        results = detector.detect_anomalies(test_data)
-        latency = (time.time() - start) * 1000  # Convert to ms
+        # Warm up so one-off import and allocation costs are not timed
+        for _ in range(3):
+            detector.detect_anomalies(test_data)
+        
+        samples = []
+        for _ in range(5):
+            start = time.perf_counter_ns()
+            detector.detect_anomalies(test_data)
+            samples.append((time.perf_counter_ns() - start) / 1e6)  # Convert to ms
+        latency = statistics.median(samples)
         
-        assert latency < 100, f"Latency {latency}ms exceeds 100ms threshold"
+        assert latency < 100, f"Median latency {latency}ms exceeds 100ms threshold"
 '''
     
     def _get_readme(self) -> str:
@@ -1,44 +1,156 @@
-﻿import logging
+﻿"""
+FastAPI Application
+REST API for the automation platform
 
+Serve it with the uvloop event loop and the httptools parser (the Dockerfile
+CMD does; WEB_CONCURRENCY sets the worker count):
+
+    uvicorn src.api.app:app --loop uvloop --http httptools --no-access-log
+
+create_app() builds a fresh, independent app, e.g. for tests.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import httpx
+import redis.asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from redis.exceptions import RedisError
+from sqlalchemy.orm import sessionmaker
 
-from .metrics import get_metrics
-from .routes import anomaly, health
+from ..automation.remediation.engine import RemediationEngine
+from ..config import RedisConfig, get_config
+from ..database.session import open_database
+from ..logging_queue import configure_logging, start_log_queue, stop_log_queue
+from ..ml.inference.engine import InferenceEngine
+from .metrics import RequestMetricsMiddleware, get_metrics
+from .routes import anomaly, health, incidents
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(
-    title="Network Security Automation API",
-    description="AI-Driven Network Security Platform",
-    version="1.0.0",
-)
+# Browser clients are served from walmart.com subdomains, plus any origins
+# listed in CORS_ORIGINS (e.g. the local dashboard)
+CORS_ORIGIN_REGEX = r"https://([a-z0-9-]+\.)*walmart\.com"
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-# Include routers
-app.include_router(health.router, prefix="/api/v1", tags=["health"])
-app.include_router(anomaly.router, prefix="/api/v1", tags=["anomaly"])
+async def open_redis(config: RedisConfig) -> Optional[redis.asyncio.Redis]:
+    """
+    Create the shared Redis client and open its first pooled connection
 
+    Returns:
+        The client, or None if Redis is not configured
+    """
+    if not config.host:
+        return None
 
-# Metrics endpoint
-@app.get("/metrics")
-async def metrics():
-    return get_metrics()
+    client = redis.asyncio.Redis(
+        host=config.host,
+        port=config.port,
+        socket_connect_timeout=0.1,
+        socket_timeout=0.1,
+    )
+    try:
+        await client.ping()
+    except RedisError as e:
+        # Kept anyway: the pool reconnects once Redis is back
+        logger.warning(f"Redis unavailable, caching in-process only: {e}")
+    return client
 
 
-@app.on_event("startup")
-async def startup_event():
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared resources at startup and release them at shutdown"""
+    # Root handlers exist even when uvicorn imports the app directly; their
+    # I/O then moves to a listener thread, off the event loop
+    configure_logging()
+    log_listener = start_log_queue()
     logger.info("API starting up...")
+    config = get_config()
+
+    # One pooled engine per worker; routes take sessions from app.state
+    engine = await asyncio.to_thread(open_database, config.database)
+    app.state.db_engine = engine
+    # Objects stay loaded after commit; every column default is client-side
+    app.state.db_sessions = (
+        sessionmaker(bind=engine, expire_on_commit=False)
+        if engine is not None
+        else None
+    )
 
+    # Models are loaded once per worker, off the event loop. Only plain numpy
+    # arrays in the model file are memory-mapped; sklearn copies each tree's
+    # node arrays when unpickling, so every worker holds its own forest
+    app.state.inference = await asyncio.to_thread(
+        InferenceEngine, config.ml.models_dir, config.ml.inference_batch_size
+    )
+
+    # Redis response cache, connected before the first request needs it
+    redis_client = await open_redis(config.redis)
+    app.state.redis = redis_client
+
+    # Shared keep-alive client for outbound webhooks (security team alerts)
+    http_client = httpx.AsyncClient(timeout=httpx.Timeout(5.0))
+    app.state.http_client = http_client
+    app.state.remediation = RemediationEngine(
+        alert_client=http_client,
+        alert_webhooks=config.alerting.webhooks,
+        history_size=config.remediation.history_size,
+    )
+
+    yield
 
-@app.on_event("shutdown")
-async def shutdown_event():
     logger.info("API shutting down...")
+    await http_client.aclose()
+    if redis_client is not None:
+        await redis_client.aclose()
+    if engine is not None:
+        engine.dispose()
+    if log_listener is not None:
+        stop_log_queue(log_listener)
+
+
+def create_app() -> FastAPI:
+    """Build the API application with its middleware and routes"""
+    app = FastAPI(
+        title="Network Security Automation API",
+        description="AI-Driven Network Security Platform",
+        version="1.0.0",
+        # Serialize route return values with orjson instead of the stdlib encoder
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
+
+    # Compress large JSON bodies (e.g. detection results); small ones go out as-is
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+    # CORS middleware (explicit lists; browsers cache preflights for a day)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=get_config().cors_origins,
+        allow_origin_regex=CORS_ORIGIN_REGEX,
+        allow_credentials=True,
+        allow_methods=["GET", "POST"],
+        allow_headers=["Authorization", "Content-Type"],
+        max_age=86400,
+    )
+
+    # Outermost, so the count and duration cover compression and CORS handling
+    app.add_middleware(RequestMetricsMiddleware)
+
+    # Include routers
+    app.include_router(health.router, prefix="/api/v1", tags=["health"])
+    app.include_router(anomaly.router, prefix="/api/v1", tags=["anomaly"])
+    app.include_router(incidents.router, prefix="/api/v1", tags=["incidents"])
+    # Metrics endpoint
+    app.add_api_route("/metrics", get_metrics, methods=["GET"])
+
+    return app
+
+
+app = create_app()
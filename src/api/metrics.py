@@ -1,4 +1,19 @@
-﻿from fastapi import Response
+﻿"""
+Prometheus Metrics
+Request metrics are labelled with bounded values only:
+
+- method: GET, POST, PUT, PATCH, DELETE, HEAD, OPTIONS, or OTHER
+- endpoint: the matched route template (e.g. /api/v1/anomaly/detect,
+  /api/v1/health/detailed, /metrics), never the raw path or query string;
+  requests that match no route are counted as "unmatched"
+"""
+
+import asyncio
+import hashlib
+import time
+from typing import Dict, Tuple
+
+from fastapi import Request, Response
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
 
 # Definir métricas
@@ -8,6 +23,66 @@ api_requests = Counter(
 )
 request_duration = Histogram("request_duration_seconds", "Request duration")
 
+KNOWN_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+UNMATCHED_ENDPOINT = "unmatched"
+
+# Labelled api_requests children, bound once per (method, endpoint) so the
+# per-request path skips labels(); the label values are bounded, so is this
+_request_counters: Dict[Tuple[str, str], Counter] = {}
+
+
+class RequestMetricsMiddleware:
+    """Count and time HTTP requests per route template (pure ASGI, no body wrapping)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # The router stores the matched route in the shared scope
+            route = scope.get("route")
+            endpoint = getattr(route, "path", UNMATCHED_ENDPOINT)
+            method = scope["method"]
+            if method not in KNOWN_METHODS:
+                method = "OTHER"
+            counter = _request_counters.get((method, endpoint))
+            if counter is None:
+                counter = api_requests.labels(method, endpoint)
+                _request_counters[(method, endpoint)] = counter
+            counter.inc()
+            request_duration.observe(time.perf_counter() - start)
+
+
+# Scrapes within this window reuse the last serialized payload
+METRICS_CACHE_SECONDS = 1.0
+
+# (expires at, payload, ETag of payload)
+_payload_cache: Tuple[float, bytes, str] = (0.0, b"", "")
+_refresh_lock = asyncio.Lock()
+
+
+async def get_metrics(request: Request) -> Response:
+    """Prometheus payload, or 304 when the scraper already holds this version"""
+    global _payload_cache
+    expires, payload, etag = _payload_cache
+    if time.monotonic() >= expires:
+        # One refresh at a time; concurrent scrapes wait and reuse its result
+        async with _refresh_lock:
+            expires, payload, etag = _payload_cache
+            now = time.monotonic()
+            if now >= expires:
+                # Serializing the registry is CPU-bound, so it runs off the loop
+                payload = await asyncio.to_thread(generate_latest)
+                etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+                _payload_cache = (now + METRICS_CACHE_SECONDS, payload, etag)
 
-def get_metrics():
-    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(payload, media_type=CONTENT_TYPE_LATEST, headers={"ETag": etag})
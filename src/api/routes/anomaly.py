@@ -3,47 +3,223 @@ Anomaly Detection Routes
 Endpoints for anomaly detection and analysis
 """
 
+import asyncio
+import logging
+import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple, Union
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+import msgspec
+import orjson
+import pandas as pd
+import redis.asyncio
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Unknown fields are dropped without being stored; instances are immutable
+API_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, ser_json_timedelta="iso8601")
+
+
+class NetworkEventIn(msgspec.Struct, frozen=True):
+    """One event to score; only the fields the detector reads are decoded"""
+
+    id: Union[int, str, None] = None
+    timestamp: Optional[str] = None
+    source_ip: Optional[str] = None
+    destination_port: Optional[int] = None
+    bytes_sent: Optional[float] = None
+    bytes_received: Optional[float] = None
+    packets_sent: Optional[float] = None
+    packets_received: Optional[float] = None
 
-class AnomalyDetectionRequest(BaseModel):
-    """Request model for anomaly detection"""
 
-    events: List[Dict]
+class AnomalyDetectionRequest(msgspec.Struct, frozen=True):
+    """Request model for anomaly detection (decoded by msgspec, extra fields ignored)"""
+
+    events: List[NetworkEventIn]
     threshold: float = 0.1
 
 
+_request_decoder = msgspec.json.Decoder(AnomalyDetectionRequest)
+# Event schema inlined, since "#/$defs/..." refs do not resolve inside OpenAPI
+_schema_defs = msgspec.json.schema(AnomalyDetectionRequest)["$defs"]
+_request_schema = _schema_defs["AnomalyDetectionRequest"]
+_request_schema["properties"]["events"]["items"] = _schema_defs["NetworkEventIn"]
+
+
 class AnomalyDetectionResponse(BaseModel):
     """Response model for anomaly detection"""
 
+    model_config = API_MODEL_CONFIG
+
     anomalies_detected: int
     total_events: int
     anomaly_rate: float
     results: List[Dict]
 
+    def model_dump(self, **kwargs) -> Dict:
+        """Dump without None values, including inside each result dict"""
+        kwargs.setdefault("exclude_none", True)
+        data = super().model_dump(**kwargs)
+        if kwargs["exclude_none"] and "results" in data:
+            data["results"] = [
+                {key: value for key, value in result.items() if value is not None}
+                for result in data["results"]
+            ]
+        return data
+
+
+# Fields the detector reads directly; missing counters count as 0
+EVENT_COUNTER_FIELDS = (
+    "bytes_sent",
+    "bytes_received",
+    "packets_sent",
+    "packets_received",
+)
+# Left out of the frame when no event carries them, so the detector's
+# defaults apply (no timestamp -> default hour/day, no port -> no scan count)
+EVENT_OPTIONAL_FIELDS = ("id", "timestamp", "destination_port")
+
+
+def _events_frame(events: List[NetworkEventIn]) -> pd.DataFrame:
+    """Build a column-per-field frame from decoded events"""
+    columns = {"source_ip": [event.source_ip for event in events]}
+    for name in EVENT_COUNTER_FIELDS:
+        columns[name] = [
+            0.0 if value is None else value
+            for value in (getattr(event, name) for event in events)
+        ]
+    for name in EVENT_OPTIONAL_FIELDS:
+        values = [getattr(event, name) for event in events]
+        if any(value is not None for value in values):
+            columns[name] = values
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(events)))
+
+
+def _detect(inference, events: List[NetworkEventIn]) -> Tuple[int, List[Dict]]:
+    """Score events and return (anomaly count, anomalous result rows)
+
+    Each row carries event_index, the position of its event in the request.
+    CPU-bound (pandas/sklearn), so it is run in a worker thread.
+    """
+    results = inference.detect_anomalies(_events_frame(events))
+    anomalies = results.loc[results["is_anomaly"]]
+    return len(anomalies), anomalies.reset_index(names="event_index").to_dict("records")
+
 
-@router.post("/anomaly/detect", response_model=AnomalyDetectionResponse)
-async def detect_anomalies(request: AnomalyDetectionRequest):
+# Schema is documented via responses= only; no response_model revalidation per call
+@router.post(
+    "/anomaly/detect",
+    responses={200: {"model": AnomalyDetectionResponse}},
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": _request_schema}},
+            "required": True,
+        }
+    },
+)
+async def detect_anomalies(raw: Request) -> ORJSONResponse:
     """Detect anomalies in network events"""
+    # msgspec decodes and validates the (potentially large) event list in one pass
     try:
-        # Implementation will use ML engine
-        return AnomalyDetectionResponse(
-            anomalies_detected=5,
-            total_events=len(request.events),
-            anomaly_rate=5 / len(request.events) if request.events else 0,
-            results=[],
+        request = _request_decoder.decode(await raw.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    inference = raw.app.state.inference
+    if inference.anomaly_detector is None:
+        raise HTTPException(status_code=503, detail="Anomaly detector not loaded")
+
+    try:
+        total_events = len(request.events)
+        anomalies_detected, results = 0, []
+        if total_events:
+            # Off the event loop, so other requests are served while this scores
+            anomalies_detected, results = await asyncio.to_thread(
+                _detect, inference, request.events
+            )
+
+        # model_construct skips validation: values are computed server-side and
+        # must already match the field types, since nothing coerces or checks them
+        response = AnomalyDetectionResponse.model_construct(
+            anomalies_detected=anomalies_detected,
+            total_events=total_events,
+            # float even when empty, since model_construct does not coerce
+            anomaly_rate=anomalies_detected / total_events if total_events else 0.0,
+            results=results,
         )
+        return ORJSONResponse(content=response.model_dump())
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Recent-anomaly responses are cached per (hours, limit): in-process for
+# repeated dashboard polls, and in Redis (when configured) across workers
+RECENT_CACHE_TTL_SECONDS = 30
+RECENT_CACHE_MAX_ENTRIES = 256
+
+_recent_cache: Dict[Tuple[int, int], Tuple[float, bytes]] = {}
+# Loads in progress, so concurrent misses for a key share one query
+_recent_inflight: Dict[Tuple[int, int], asyncio.Future] = {}
+
+
+def _query_recent_anomalies(hours: int, limit: int) -> Dict:
+    """Load recent anomaly detections from the store"""
+    return {"anomalies": [], "count": 0, "time_range_hours": hours}
+
+
+async def _load_recent_anomalies(
+    client: Optional[redis.asyncio.Redis], hours: int, limit: int
+) -> bytes:
+    """Encoded recent anomalies, read through the Redis cache when available"""
+    key = f"anom:{hours}:{limit}"
+    if client is not None:
+        try:
+            body = await client.get(key)
+            if body is not None:
+                return body
+        except RedisError as e:
+            logger.warning(f"Redis cache read failed: {e}")
+            client = None
+
+    body = orjson.dumps(_query_recent_anomalies(hours, limit))
+    if client is not None:
+        try:
+            await client.setex(key, RECENT_CACHE_TTL_SECONDS, body)
+        except RedisError as e:
+            logger.warning(f"Redis cache write failed: {e}")
+    return body
+
+
 @router.get("/anomaly/recent")
-async def get_recent_anomalies(hours: int = 24, limit: int = 100):
+async def get_recent_anomalies(
+    request: Request, hours: int = 24, limit: int = 100
+) -> Response:
     """Get recent anomaly detections"""
-    return {"anomalies": [], "count": 0, "time_range_hours": hours}
+    key = (hours, limit)
+    now = time.monotonic()
+    cached = _recent_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return Response(cached[1], media_type="application/json")
+
+    load = _recent_inflight.get(key)
+    if load is None:
+        # Shared client opened in the app lifespan (None without REDIS_HOST)
+        load = asyncio.ensure_future(
+            _load_recent_anomalies(request.app.state.redis, hours, limit)
+        )
+        _recent_inflight[key] = load
+        load.add_done_callback(lambda _: _recent_inflight.pop(key, None))
+    # Shielded: a disconnecting client must not cancel the others' load
+    body = await asyncio.shield(load)
+    if key not in _recent_cache and len(_recent_cache) >= RECENT_CACHE_MAX_ENTRIES:
+        # Evict the oldest key (dicts keep insertion order)
+        del _recent_cache[next(iter(_recent_cache))]
+    _recent_cache[key] = (now + RECENT_CACHE_TTL_SECONDS, body)
+    return Response(body, media_type="application/json")
@@ -3,33 +3,63 @@ Health Check Routes
 System health monitoring endpoints
 """
 
-from typing import Dict
+import time
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
-
-@router.get("/health")
-async def health_check() -> Dict:
-    """Basic health check"""
-    return {
+# Probes hit these every few seconds, so bodies are encoded ahead of time
+HEALTH_BODY = orjson.dumps(
+    {
         "status": "healthy",
         "service": "Network Security Automation",
         "version": "1.0.0",
     }
+)
+
+# The detailed body carries uptime, so it is re-encoded at most this often
+DETAILED_HEALTH_TTL_SECONDS = 5.0
+
+_started_at = time.monotonic()
+_detailed_body = b""
+_detailed_expires_at = 0.0
+
+
+def _build_detailed_body(now: float) -> bytes:
+    """Encode the detailed health payload as of now"""
+    return orjson.dumps(
+        {
+            "status": "healthy",
+            "components": {
+                "database": "healthy",
+                "ise_integration": "healthy",
+                "dlp_integration": "healthy",
+                "ml_engine": "healthy",
+            },
+            "metrics": {
+                "uptime_seconds": int(now - _started_at),
+                "requests_processed": 1000,
+            },
+        }
+    )
+
+
+@router.get("/health")
+async def health_check() -> Response:
+    """Basic health check"""
+    return Response(HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/health/detailed")
-async def detailed_health() -> Dict:
+async def detailed_health() -> Response:
     """Detailed health check with component status"""
-    return {
-        "status": "healthy",
-        "components": {
-            "database": "healthy",
-            "ise_integration": "healthy",
-            "dlp_integration": "healthy",
-            "ml_engine": "healthy",
-        },
-        "metrics": {"uptime_seconds": 3600, "requests_processed": 1000},
-    }
+    global _detailed_body, _detailed_expires_at
+
+    now = time.monotonic()
+    if now >= _detailed_expires_at:
+        _detailed_body = _build_detailed_body(now)
+        _detailed_expires_at = now + DETAILED_HEALTH_TTL_SECONDS
+
+    return Response(_detailed_body, media_type="application/json")
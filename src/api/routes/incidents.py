@@ -0,0 +1,67 @@
+"""
+Incident Routes
+Endpoints for incident remediation
+"""
+
+import logging
+from typing import Dict, List
+
+from fastapi import APIRouter, BackgroundTasks, Request
+from pydantic import BaseModel, ConfigDict
+
+from ...automation.remediation.engine import Incident, RemediationEngine
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+class IncidentRequest(BaseModel):
+    """Incident to remediate (extra fields such as mac_address are kept)"""
+
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+    type: str
+    severity: str = "low"
+    confidence: float = 0.0
+
+
+class IncidentRemediationResponse(BaseModel):
+    """Recommended actions and how many were scheduled to run autonomously"""
+
+    actions: List[Dict]
+    scheduled: int
+
+
+async def _run_actions(
+    engine: RemediationEngine, actions: List[Dict], incident: Incident
+) -> None:
+    """Execute autonomous actions after the response has been sent"""
+    for action in actions:
+        result = await engine.execute_remediation(action, incident)
+        logger.info(f"Remediation {action['action']}: {result.get('message')}")
+
+
+@router.post(
+    "/incidents/remediate",
+    response_model=IncidentRemediationResponse,
+    status_code=202,
+)
+async def remediate_incident(
+    incident: IncidentRequest, request: Request, background_tasks: BackgroundTasks
+) -> IncidentRemediationResponse:
+    """
+    Recommend remediation actions and run the autonomous ones in the background
+
+    Alerting and device actions can take several round-trips, so they run
+    after the response is returned.
+    """
+    engine: RemediationEngine = request.app.state.remediation
+    incident_data = Incident.from_dict(incident.model_dump())
+
+    actions = engine.decide_remediation(incident_data)
+    autonomous = [action for action in actions if action["autonomous"]]
+    if autonomous:
+        background_tasks.add_task(_run_actions, engine, autonomous, incident_data)
+
+    return IncidentRemediationResponse(actions=actions, scheduled=len(autonomous))
@@ -3,15 +3,30 @@ Autonomous Remediation Engine
 Phase 4: AI-driven automated response actions
 """
 
+import asyncio
+import inspect
 import logging
-from enum import Enum
-from typing import Dict, List, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import StrEnum
+from typing import Dict, List, NamedTuple, Optional
+
+import httpx
+import orjson
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Default number of executed actions kept in memory; older entries are dropped first
+MAX_ACTION_HISTORY = 100_000
+
+# Alert channels notified concurrently by _alert_security_team
+ALERT_CHANNELS = ("slack", "email", "servicenow")
+
 
-class RemediationAction(Enum):
-    """Available remediation actions"""
+class RemediationAction(StrEnum):
+    """Available remediation actions (members are their own string values)"""
 
     QUARANTINE_DEVICE = "quarantine_device"
     BLOCK_IP = "block_ip"
@@ -22,22 +37,139 @@ class RemediationAction(Enum):
     BLOCK_FILE = "block_file"
 
 
+@dataclass(slots=True, frozen=True)
+class Incident:
+    """Security incident, parsed once at the API boundary"""
+
+    type: str
+    severity: str = "low"
+    confidence: float = 0.0
+    mac_address: Optional[str] = None
+    source_ip: Optional[str] = None
+    session_id: Optional[str] = None
+    dlp_incident_id: Optional[str] = None
+    # Remaining reported fields, forwarded untouched in alert payloads
+    details: Dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Incident":
+        """Build an incident from a payload dict; unknown keys go to details"""
+        known = {key: value for key, value in data.items() if key in INCIDENT_FIELDS}
+        details = {
+            key: value for key, value in data.items() if key not in INCIDENT_FIELDS
+        }
+        return cls(**known, details=details)
+
+
+# Payload keys that map onto Incident attributes
+INCIDENT_FIELDS = frozenset(Incident.__dataclass_fields__) - {"details"}
+
+
+class RemediationRule(NamedTuple):
+    """One action recommended for a matching incident type"""
+
+    action: RemediationAction
+    reasoning: str
+    confidence_factor: float = 1.0
+    # Own confidence bar for autonomy; None uses the incident-wide rule
+    autonomous_above: Optional[float] = None
+
+
+HIGH_SEVERITIES = frozenset({"high", "critical"})
+
+# Incident-type keyword -> recommended actions, built once at import
+INCIDENT_RULES = (
+    (
+        "data_exfiltration",
+        (
+            RemediationRule(
+                RemediationAction.QUARANTINE_DEVICE,
+                "Prevent further data loss by isolating device",
+            ),
+            RemediationRule(
+                RemediationAction.BLOCK_FILE,
+                "Quarantine potentially exfiltrated files",
+            ),
+        ),
+    ),
+    (
+        "unauthorized_access",
+        (
+            RemediationRule(
+                RemediationAction.TERMINATE_SESSION,
+                "Terminate unauthorized session immediately",
+            ),
+            # Slightly lower confidence for IP block
+            RemediationRule(
+                RemediationAction.BLOCK_IP,
+                "Block source IP to prevent further access",
+                confidence_factor=0.9,
+                autonomous_above=0.85,
+            ),
+        ),
+    ),
+    (
+        "malware",
+        (
+            RemediationRule(
+                RemediationAction.QUARANTINE_DEVICE,
+                "Isolate infected device to prevent spread",
+            ),
+        ),
+    ),
+)
+
+
 class RemediationEngine:
     """Autonomous remediation decision and execution engine"""
 
-    def __init__(self, ise_client=None, dlp_client=None):
+    def __init__(
+        self,
+        ise_client=None,
+        dlp_client=None,
+        alert_client: Optional[httpx.AsyncClient] = None,
+        alert_webhooks: Optional[Dict[str, str]] = None,
+        history_size: int = MAX_ACTION_HISTORY,
+    ):
         self.ise_client = ise_client
         self.dlp_client = dlp_client
-        self.action_history = []
+        self.alert_client = alert_client
+        # Channel name -> webhook URL; channels without a URL are skipped
+        self.alert_webhooks = {
+            channel: url for channel, url in (alert_webhooks or {}).items() if url
+        }
+        # Ring buffers: O(1) append, and the oldest entries drop out at history_size
+        self.action_history = deque(maxlen=history_size)
+
+        # Columnar copy of the history for analytics (see history_frame)
+        self._history_columns = {
+            name: deque(maxlen=history_size)
+            for name in (
+                "executed_at",
+                "action",
+                "incident_type",
+                "severity",
+                "success",
+            )
+        }
+
+        # Action value -> executor, for O(1) dispatch in execute_remediation
+        self._executors = {
+            RemediationAction.QUARANTINE_DEVICE: self._quarantine_device,
+            RemediationAction.BLOCK_IP: self._block_ip,
+            RemediationAction.TERMINATE_SESSION: self._terminate_session,
+            RemediationAction.BLOCK_FILE: self._block_file,
+            RemediationAction.ALERT_SECURITY_TEAM: self._alert_security_team,
+        }
 
     def decide_remediation(
-        self, incident: Dict, confidence_threshold: float = 0.80
+        self, incident: Incident, confidence_threshold: float = 0.80
     ) -> List[Dict]:
         """
         Decide appropriate remediation actions based on incident
 
         Args:
-            incident: Incident dictionary with type, severity, confidence
+            incident: Incident with type, severity, confidence
             confidence_threshold: Minimum confidence for autonomous action
 
         Returns:
@@ -45,72 +177,38 @@ class RemediationEngine:
         """
         actions = []
 
-        # Extract incident details
-        incident_type = incident.get("type", "")
-        severity = incident.get("severity", "low")
-        confidence = incident.get("confidence", 0.0)
+        # Extract incident details (type folded once for the keyword scan)
+        incident_type = incident.type.casefold()
+        severity = incident.severity
+        confidence = incident.confidence
 
         # High confidence + high severity = autonomous action
-        autonomous = confidence >= confidence_threshold and severity in [
-            "high",
-            "critical",
-        ]
-
-        # Decision logic based on incident type
-        if "data_exfiltration" in incident_type.lower():
-            actions.extend(
-                [
-                    {
-                        "action": RemediationAction.QUARANTINE_DEVICE.value,
-                        "reasoning": "Prevent further data loss by isolating device",
-                        "confidence": confidence,
-                        "autonomous": autonomous,
-                    },
-                    {
-                        "action": RemediationAction.BLOCK_FILE.value,
-                        "reasoning": "Quarantine potentially exfiltrated files",
-                        "confidence": confidence,
-                        "autonomous": autonomous,
-                    },
-                ]
-            )
-
-        elif "unauthorized_access" in incident_type.lower():
-            actions.extend(
-                [
-                    {
-                        "action": RemediationAction.TERMINATE_SESSION.value,
-                        "reasoning": "Terminate unauthorized session immediately",
-                        "confidence": confidence,
-                        "autonomous": autonomous,
-                    },
-                    {
-                        "action": RemediationAction.BLOCK_IP.value,
-                        "reasoning": "Block source IP to prevent further access",
-                        "confidence": confidence
-                        * 0.9,  # Slightly lower confidence for IP block
-                        "autonomous": confidence >= 0.85,
-                    },
-                ]
-            )
+        high_severity = severity in HIGH_SEVERITIES
+        autonomous = confidence >= confidence_threshold and high_severity
 
-        elif "malware" in incident_type.lower():
-            actions.extend(
-                [
+        # Decision logic based on incident type (first matching keyword wins)
+        for keyword, rules in INCIDENT_RULES:
+            if keyword in incident_type:
+                actions.extend(
                     {
-                        "action": RemediationAction.QUARANTINE_DEVICE.value,
-                        "reasoning": "Isolate infected device to prevent spread",
-                        "confidence": confidence,
-                        "autonomous": autonomous,
+                        "action": rule.action,
+                        "reasoning": rule.reasoning,
+                        "confidence": confidence * rule.confidence_factor,
+                        "autonomous": (
+                            autonomous
+                            if rule.autonomous_above is None
+                            else confidence >= rule.autonomous_above
+                        ),
                     }
-                ]
-            )
+                    for rule in rules
+                )
+                break
 
         # Always alert for high/critical severity
-        if severity in ["high", "critical"]:
+        if high_severity:
             actions.append(
                 {
-                    "action": RemediationAction.ALERT_SECURITY_TEAM.value,
+                    "action": RemediationAction.ALERT_SECURITY_TEAM,
                     "reasoning": "High severity incident requires human review",
                     "confidence": 1.0,
                     "autonomous": True,
@@ -121,7 +219,7 @@ class RemediationEngine:
 
         return actions
 
-    def execute_remediation(self, action: Dict, incident: Dict) -> Dict:
+    async def execute_remediation(self, action: Dict, incident: Incident) -> Dict:
         """
         Execute a remediation action
 
@@ -142,28 +240,15 @@ class RemediationEngine:
         }
 
         try:
-            if action_type == RemediationAction.QUARANTINE_DEVICE.value:
-                result = self._quarantine_device(incident)
-
-            elif action_type == RemediationAction.BLOCK_IP.value:
-                result = self._block_ip(incident)
-
-            elif action_type == RemediationAction.TERMINATE_SESSION.value:
-                result = self._terminate_session(incident)
-
-            elif action_type == RemediationAction.BLOCK_FILE.value:
-                result = self._block_file(incident)
-
-            elif action_type == RemediationAction.ALERT_SECURITY_TEAM.value:
-                result = self._alert_security_team(incident)
-
+            executor = self._executors.get(action_type)
+            if executor is not None:
+                result = executor(incident)
+                if inspect.isawaitable(result):
+                    result = await result
             else:
                 result["message"] = f"Unknown action type: {action_type}"
 
-            # Log action
-            self.action_history.append(
-                {"action": action, "incident": incident, "result": result}
-            )
+            self._record_action(action, incident, result)
 
         except Exception as e:
             logger.error(f"Error executing remediation: {e}", exc_info=True)
@@ -171,9 +256,35 @@ class RemediationEngine:
 
         return result
 
-    def _quarantine_device(self, incident: Dict) -> Dict:
-        """Quarantine a device using ISE"""
-        mac_address = incident.get("mac_address")
+    def _record_action(self, action: Dict, incident: Incident, result: Dict) -> None:
+        """Append an executed action to the bounded history"""
+        self.action_history.append(
+            {"action": action, "incident": incident, "result": result}
+        )
+
+        columns = self._history_columns
+        columns["executed_at"].append(datetime.utcnow())
+        columns["action"].append(action.get("action"))
+        columns["incident_type"].append(incident.type)
+        columns["severity"].append(incident.severity)
+        columns["success"].append(bool(result.get("success")))
+
+    def history_frame(self) -> pd.DataFrame:
+        """Executed actions as a DataFrame, one typed column per field"""
+        return pd.DataFrame(
+            {name: list(values) for name, values in self._history_columns.items()}
+        )
+
+    def action_history_json(self) -> bytes:
+        """Serialize the action history to JSON bytes (numpy values included)"""
+        return orjson.dumps(
+            list(self.action_history),
+            option=orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+    async def _quarantine_device(self, incident: Incident) -> Dict:
+        """Quarantine a device using ISE (its blocking client runs in a thread)"""
+        mac_address = incident.mac_address
 
         if not self.ise_client:
             return {"success": False, "message": "ISE client not available"}
@@ -181,8 +292,10 @@ class RemediationEngine:
         if not mac_address:
             return {"success": False, "message": "No MAC address provided"}
 
-        success = self.ise_client.quarantine_endpoint(
-            mac_address, reason=f"Security incident: {incident.get('type', 'Unknown')}"
+        success = await asyncio.to_thread(
+            self.ise_client.quarantine_endpoint,
+            mac_address,
+            reason=f"Security incident: {incident.type}",
         )
 
         return {
@@ -190,18 +303,18 @@ class RemediationEngine:
             "message": f"Device {mac_address} {'quarantined' if success else 'quarantine failed'}",
         }
 
-    def _block_ip(self, incident: Dict) -> Dict:
+    def _block_ip(self, incident: Incident) -> Dict:
         """Block an IP address"""
-        ip_address = incident.get("source_ip")
+        ip_address = incident.source_ip
 
         # Implementation would integrate with firewall/ACL management
         logger.info(f"Would block IP: {ip_address}")
 
         return {"success": True, "message": f"IP {ip_address} blocked (simulated)"}
 
-    def _terminate_session(self, incident: Dict) -> Dict:
+    def _terminate_session(self, incident: Incident) -> Dict:
         """Terminate a network session"""
-        session_id = incident.get("session_id")
+        session_id = incident.session_id
 
         logger.info(f"Would terminate session: {session_id}")
 
@@ -210,9 +323,9 @@ class RemediationEngine:
             "message": f"Session {session_id} terminated (simulated)",
         }
 
-    def _block_file(self, incident: Dict) -> Dict:
+    async def _block_file(self, incident: Incident) -> Dict:
         """Block/quarantine a file using DLP"""
-        incident_id = incident.get("dlp_incident_id")
+        incident_id = incident.dlp_incident_id
 
         if not self.dlp_client:
             return {"success": False, "message": "DLP client not available"}
@@ -220,18 +333,61 @@ class RemediationEngine:
         if not incident_id:
             return {"success": False, "message": "No DLP incident ID provided"}
 
-        success = self.dlp_client.quarantine_file(incident_id)
+        # The async API: quarantine_file() runs its own event loop
+        results = await self.dlp_client.quarantine_many([incident_id])
+        success = results[incident_id]
 
         return {
             "success": success,
             "message": f"File {'quarantined' if success else 'quarantine failed'}",
         }
 
-    def _alert_security_team(self, incident: Dict) -> Dict:
-        """Send alert to security team"""
-        # Implementation would integrate with Slack, email, ServiceNow, etc.
-        logger.info(
-            f"ALERT: {incident.get('type')} - Severity: {incident.get('severity')}"
+    async def _alert_security_team(self, incident: Incident) -> Dict:
+        """Send alert to security team over every configured channel at once"""
+        # Lazy %-formatting: nothing is formatted when INFO is filtered out
+        logger.info("ALERT: %s - Severity: %s", incident.type, incident.severity)
+
+        if self.alert_client is None or not self.alert_webhooks:
+            return {"success": True, "message": "Security team alerted (simulated)"}
+
+        channels = [c for c in ALERT_CHANNELS if c in self.alert_webhooks]
+        # One round-trip instead of one per channel; a failed channel
+        # does not cancel the others
+        outcomes = await asyncio.gather(
+            *(self._post_alert(channel, incident) for channel in channels),
+            return_exceptions=True,
         )
 
-        return {"success": True, "message": "Security team alerted (simulated)"}
+        delivered = []
+        for channel, outcome in zip(channels, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error alerting security team via {channel}: {outcome}")
+            else:
+                delivered.append(channel)
+
+        return {
+            "success": bool(delivered),
+            "message": f"Security team alerted via {', '.join(delivered) or 'no channel'}",
+        }
+
+    async def _post_alert(self, channel: str, incident: Incident) -> None:
+        """POST one incident alert to a channel's webhook"""
+        summary = f"{incident.type} - Severity: {incident.severity}"
+
+        if channel == "slack":
+            payload = {"text": f":rotating_light: {summary}"}
+        elif channel == "email":
+            payload = {"subject": f"Security alert: {summary}", "body": incident}
+        else:
+            payload = {
+                "short_description": summary,
+                "urgency": 1 if incident.severity == "critical" else 2,
+                "description": incident,
+            }
+
+        response = await self.alert_client.post(
+            self.alert_webhooks[channel],
+            content=orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
@@ -6,7 +6,9 @@ Centralized configuration management
 import logging
 import os
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
+from urllib.parse import quote_plus
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +26,11 @@ class DatabaseConfig:
 
     @property
     def connection_string(self) -> str:
-        return f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
+        """SQLAlchemy URL for the psycopg2 driver (credentials URL-encoded)"""
+        return (
+            f"postgresql+psycopg2://{quote_plus(self.username)}:{quote_plus(self.password)}"
+            f"@{self.host}:{self.port}/{self.database}"
+        )
 
 
 @dataclass
@@ -53,10 +59,42 @@ class MLConfig:
 
     models_dir: str
     training_data_dir: str
-    inference_batch_size: int = 100
+    inference_batch_size: int = 5000
     anomaly_threshold: float = 0.1
 
 
+@dataclass
+class RedisConfig:
+    """Redis cache configuration (disabled when host is empty)"""
+
+    host: str
+    port: int = 6379
+
+
+@dataclass
+class AlertingConfig:
+    """Security team alert webhooks (a channel is skipped when its URL is empty)"""
+
+    slack_webhook_url: str = ""
+    email_webhook_url: str = ""
+    servicenow_url: str = ""
+
+    @property
+    def webhooks(self) -> Dict[str, str]:
+        return {
+            "slack": self.slack_webhook_url,
+            "email": self.email_webhook_url,
+            "servicenow": self.servicenow_url,
+        }
+
+
+@dataclass
+class RemediationConfig:
+    """Remediation engine configuration"""
+
+    history_size: int = 100_000
+
+
 class Config:
     """Main application configuration"""
 
@@ -94,12 +132,42 @@ class Config:
         self.ml = MLConfig(
             models_dir=os.getenv("ML_MODELS_DIR", "data/models"),
             training_data_dir=os.getenv("ML_TRAINING_DATA_DIR", "data/training"),
-            inference_batch_size=int(os.getenv("ML_BATCH_SIZE", "100")),
+            inference_batch_size=int(os.getenv("ML_BATCH_SIZE", "5000")),
             anomaly_threshold=float(os.getenv("ML_ANOMALY_THRESHOLD", "0.1")),
         )
 
+        # Redis configuration
+        self.redis = RedisConfig(
+            host=os.getenv("REDIS_HOST", ""),
+            port=int(os.getenv("REDIS_PORT", "6379")),
+        )
+
+        # Alerting configuration
+        self.alerting = AlertingConfig(
+            slack_webhook_url=os.getenv("ALERT_SLACK_WEBHOOK_URL", ""),
+            email_webhook_url=os.getenv("ALERT_EMAIL_WEBHOOK_URL", ""),
+            servicenow_url=os.getenv("ALERT_SERVICENOW_URL", ""),
+        )
+
+        # Remediation configuration
+        self.remediation = RemediationConfig(
+            history_size=int(os.getenv("REMEDIATION_HISTORY_SIZE", "100000")),
+        )
+
         # API configuration
         self.api_host = os.getenv("API_HOST", "0.0.0.0")
         self.api_port = int(os.getenv("API_PORT", "8000"))
+        # Extra browser origins allowed by CORS (comma-separated, exact match)
+        self.cors_origins = [
+            origin.strip()
+            for origin in os.getenv("CORS_ORIGINS", "").split(",")
+            if origin.strip()
+        ]
 
         logger.info(f"Configuration loaded for environment: {self.environment}")
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Process-wide configuration, read from the environment on first use"""
+    return Config()
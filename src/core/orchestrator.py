@@ -3,9 +3,8 @@ System Orchestrator
 Coordinates all system components and workflows
 """
 
+import asyncio
 import logging
-import threading
-import time
 from typing import Dict
 
 logger = logging.getLogger(__name__)
@@ -18,6 +17,9 @@ class SystemOrchestrator:
         self.config = config
         self.running = False
         self.components = {}
+        self.sessions = {}
+        self._loop = None
+        self._stop_event = None
 
     def start(self) -> None:
         """Initialize and start all system components"""
@@ -40,26 +42,32 @@ class SystemOrchestrator:
     def _initialize_integrations(self) -> None:
         """Initialize external integrations"""
         logger.info("Initializing integrations...")
-        from ..integrations.cisco_ise.client import CiscoISEClient
-        from ..integrations.symantec_dlp.client import SymantecDLPClient
+        from ..integrations.cisco_ise import client as ise
+        from ..integrations.symantec_dlp import client as dlp
+
+        # One pooled session per target host, kept for the orchestrator's lifetime
+        self.sessions["ise"] = ise.create_session()
+        self.sessions["dlp"] = dlp.create_session(self.config.dlp.verify_ssl)
 
         try:
-            self.components["ise_client"] = CiscoISEClient(
+            self.components["ise_client"] = ise.CiscoISEClient(
                 self.config.ise.base_url,
                 self.config.ise.username,
                 self.config.ise.password,
                 self.config.ise.verify_ssl,
+                session=self.sessions["ise"],
             )
             logger.info("ISE client initialized")
         except Exception as e:
             logger.warning(f"ISE client initialization failed: {e}")
 
         try:
-            self.components["dlp_client"] = SymantecDLPClient(
+            self.components["dlp_client"] = dlp.SymantecDLPClient(
                 self.config.dlp.base_url,
                 self.config.dlp.username,
                 self.config.dlp.password,
                 self.config.dlp.verify_ssl,
+                session=self.sessions["dlp"],
             )
             logger.info("DLP client initialized")
         except Exception as e:
@@ -72,7 +80,8 @@ class SystemOrchestrator:
 
         try:
             self.components["ml_engine"] = InferenceEngine(
-                models_dir=self.config.ml.models_dir
+                models_dir=self.config.ml.models_dir,
+                batch_size=self.config.ml.inference_batch_size,
             )
             logger.info("ML engine initialized")
         except Exception as e:
@@ -82,22 +91,24 @@ class SystemOrchestrator:
         """Initialize REST API"""
         logger.info("API will be started separately")
 
-    def run(self) -> None:
-        """Main execution loop"""
+    async def run(self) -> None:
+        """Main execution loop; idles on an event until stop() is called"""
         logger.info("System orchestrator running...")
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        if not self.running:
+            return
 
-        while self.running:
-            try:
-                # Main processing loop
-                time.sleep(10)
-
-            except KeyboardInterrupt:
-                logger.info("Shutdown requested")
-                self.running = False
-            except Exception as e:
-                logger.error(f"Error in main loop: {e}", exc_info=True)
+        await self._stop_event.wait()
+        logger.info("System orchestrator stopped")
 
     def stop(self) -> None:
         """Stop all components"""
         logger.info("Stopping orchestrator...")
         self.running = False
+        for session in self.sessions.values():
+            session.close()
+        self.sessions.clear()
+        if self._loop is not None and self._stop_event is not None:
+            # stop() may be called from a signal handler or another thread
+            self._loop.call_soon_threadsafe(self._stop_event.set)
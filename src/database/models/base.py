@@ -4,10 +4,8 @@ Phase 2: PostgreSQL schemas with SQLAlchemy ORM
 """
 
 from datetime import datetime
-from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Boolean, Column, DateTime
 from sqlalchemy.orm import DeclarativeBase
 
 
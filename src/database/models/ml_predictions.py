@@ -5,7 +5,7 @@ Stores ML model predictions and performance metrics
 
 import uuid
 
-from sqlalchemy import Column, DateTime, Float, Index, Integer, String
+from sqlalchemy import REAL, Boolean, Column, DateTime, Index, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from .base import Base, TimestampMixin
@@ -22,11 +22,14 @@ class MLPrediction(Base, TimestampMixin):
     prediction_type = Column(String(50), nullable=False)
     input_features = Column(JSONB)
     prediction_result = Column(JSONB)
-    confidence_score = Column(Float)
-    inference_time_ms = Column(Float)
-    prediction_timestamp = Column(DateTime, nullable=False, index=True)
+    # 4-byte floats: ~7 significant digits is ample for scores and timings
+    confidence_score = Column(REAL)
+    inference_time_ms = Column(REAL)
+    # Hypertable partition column, so part of the primary key (and indexed by
+    # the hypertable itself)
+    prediction_timestamp = Column(DateTime, primary_key=True)
     actual_outcome = Column(JSONB)
-    was_correct = Column(Integer)
+    was_correct = Column(Boolean, nullable=False, default=False)
 
     __table_args__ = (
         Index(
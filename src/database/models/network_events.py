@@ -5,20 +5,26 @@ Stores network telemetry and events for analysis
 
 import uuid
 
-from sqlalchemy import JSON, Column, DateTime, Float, Index, Integer, String
+from sqlalchemy import Column, DateTime, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from .base import Base, TimestampMixin
 
 
 class NetworkEvent(Base, TimestampMixin):
-    """Network event model for time-series data"""
+    """
+    Network event model for time-series data
+
+    Stored as a TimescaleDB hypertable partitioned on timestamp, so the
+    primary key includes it and each daily chunk carries its own indexes.
+    """
 
     __tablename__ = "network_events"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    timestamp = Column(DateTime, nullable=False, index=True)
-    source_ip = Column(String(45), nullable=False, index=True)
+    # Indexed by the hypertable itself (timestamp DESC)
+    timestamp = Column(DateTime, primary_key=True)
+    source_ip = Column(String(45), nullable=False)
     destination_ip = Column(String(45), nullable=False)
     source_port = Column(Integer)
     destination_port = Column(Integer)
@@ -29,12 +35,25 @@ class NetworkEvent(Base, TimestampMixin):
     packets_received = Column(Integer)
     event_type = Column(String(50), nullable=False, index=True)
     severity = Column(String(20), nullable=False)
-    device_id = Column(String(100), index=True)
+    device_id = Column(String(100))
     location = Column(String(100), index=True)
     event_metadata = Column(JSONB)  # CAMBIADO: metadata -> event_metadata
 
-    # Indexes for time-series queries
+    # Per-device and per-IP time-range queries; these also serve plain
+    # device_id / source_ip lookups, so no single-column indexes are kept.
+    # The GIN index only serves containment filters, i.e.
+    # event_metadata.contains({...}) (@>), not ->> key extraction.
     __table_args__ = (
-        Index("idx_network_events_timestamp_device", "timestamp", "device_id"),
-        Index("idx_network_events_source_ip_timestamp", "source_ip", "timestamp"),
+        Index(
+            "idx_network_events_device_timestamp", "device_id", timestamp.desc()
+        ),
+        Index(
+            "idx_network_events_source_ip_timestamp", "source_ip", timestamp.desc()
+        ),
+        Index(
+            "idx_network_events_metadata_gin",
+            "event_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"event_metadata": "jsonb_path_ops"},
+        ),
     )
@@ -6,23 +6,22 @@ Stores detected security incidents and remediation actions
 import enum
 import uuid
 
-from sqlalchemy import JSON, Column, DateTime
+from sqlalchemy import Boolean, Column, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Float, ForeignKey, Integer, String
+from sqlalchemy import Float, Index, SmallInteger, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import relationship
 
 from .base import Base, TimestampMixin
 
 
-class IncidentStatus(enum.Enum):
-    """Incident status enum"""
+class IncidentStatus(enum.IntEnum):
+    """Incident status codes (mirrors the incident_status_codes lookup table)"""
 
-    DETECTED = "detected"
-    ANALYZING = "analyzing"
-    REMEDIATING = "remediating"
-    RESOLVED = "resolved"
-    ESCALATED = "escalated"
+    DETECTED = 0
+    ANALYZING = 1
+    REMEDIATING = 2
+    RESOLVED = 3
+    ESCALATED = 4
 
 
 class IncidentSeverity(enum.Enum):
@@ -41,9 +40,7 @@ class SecurityIncident(Base, TimestampMixin):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     incident_type = Column(String(100), nullable=False)
-    status = Column(
-        SQLEnum(IncidentStatus), nullable=False, default=IncidentStatus.DETECTED
-    )
+    status = Column(SmallInteger, nullable=False, default=IncidentStatus.DETECTED)
     severity = Column(SQLEnum(IncidentSeverity), nullable=False)
     confidence_score = Column(Float, nullable=False)
     source_system = Column(String(50), nullable=False)
@@ -51,7 +48,25 @@ class SecurityIncident(Base, TimestampMixin):
     detection_method = Column(String(100))
     ai_reasoning = Column(JSONB)
     remediation_actions = Column(JSONB)
-    human_review_required = Column(Integer, default=0)
+    human_review_required = Column(Boolean, nullable=False, default=False)
     resolved_at = Column(DateTime)
     resolved_by = Column(String(100))
     notes = Column(String)
+
+    # GIN indexes serve containment filters only, e.g.
+    # affected_assets.contains([{"mac_address": ...}]) (@>)
+    __table_args__ = (
+        Index("idx_security_incidents_status", "status"),
+        Index(
+            "idx_security_incidents_affected_assets_gin",
+            "affected_assets",
+            postgresql_using="gin",
+            postgresql_ops={"affected_assets": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_security_incidents_ai_reasoning_gin",
+            "ai_reasoning",
+            postgresql_using="gin",
+            postgresql_ops={"ai_reasoning": "jsonb_path_ops"},
+        ),
+    )
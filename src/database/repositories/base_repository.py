@@ -4,11 +4,13 @@ Provides common CRUD operations for all repositories
 """
 
 from datetime import datetime
-from typing import Generic, List, Optional, Type, TypeVar
+from typing import Dict, Generic, List, Optional, Type, TypeVar
 
-from sqlalchemy import desc
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from ..session import INSERT_PAGE_SIZE
+
 T = TypeVar("T")
 
 
@@ -23,10 +25,35 @@ class BaseRepository(Generic[T]):
         """Create a new record"""
         instance = self.model(**kwargs)
         self.session.add(instance)
+        # Column defaults are all client-side, so no refresh() round-trip
+        # is needed to read back generated values
         self.session.commit()
-        self.session.refresh(instance)
         return instance
 
+    def bulk_create(self, rows: List[Dict], page_size: int = INSERT_PAGE_SIZE) -> int:
+        """
+        Insert many records in one transaction
+
+        Rows go out as multi-row INSERT statements of up to page_size rows
+        each, without building ORM objects, and are committed once.
+
+        Args:
+            rows: Column values for each record
+            page_size: Rows per INSERT statement
+
+        Returns:
+            Number of records inserted
+        """
+        if not rows:
+            return 0
+
+        self.session.execute(
+            insert(self.model).execution_options(insertmanyvalues_page_size=page_size),
+            rows,
+        )
+        self.session.commit()
+        return len(rows)
+
     def get_by_id(self, id: str) -> Optional[T]:
         """Get record by ID"""
         return self.session.query(self.model).filter(self.model.id == id).first()
@@ -4,7 +4,7 @@ Specialized queries for network events and time-series data
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List
 
 from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
@@ -19,6 +19,10 @@ class EventRepository(BaseRepository[NetworkEvent]):
     def __init__(self, session: Session):
         super().__init__(NetworkEvent, session)
 
+    def bulk_insert_events(self, events: List[Dict]) -> int:
+        """Ingest a batch of events with batched INSERTs and a single commit"""
+        return self.bulk_create(events)
+
     def get_events_by_time_range(
         self, start_time: datetime, end_time: datetime, limit: int = 1000
     ) -> List[NetworkEvent]:
@@ -69,6 +73,25 @@ class EventRepository(BaseRepository[NetworkEvent]):
             .all()
         )
 
+    def get_events_by_metadata(
+        self, criteria: Dict, hours: int = 24, limit: int = 1000
+    ) -> List[NetworkEvent]:
+        """Get recent events whose metadata contains all of the given key/values"""
+        start_time = datetime.utcnow() - timedelta(hours=hours)
+        return (
+            self.session.query(self.model)
+            .filter(
+                and_(
+                    # @> containment, which the jsonb_path_ops GIN index serves
+                    self.model.event_metadata.contains(criteria),
+                    self.model.timestamp >= start_time,
+                )
+            )
+            .order_by(self.model.timestamp.desc())
+            .limit(limit)
+            .all()
+        )
+
     def get_high_severity_events(
         self, hours: int = 24, limit: int = 100
     ) -> List[NetworkEvent]:
@@ -0,0 +1,55 @@
+"""
+Database Session Management
+Pooled SQLAlchemy engine shared by the API and repositories
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..config import DatabaseConfig
+
+logger = logging.getLogger(__name__)
+
+# Recycle connections before server/proxy idle timeouts can drop them
+POOL_RECYCLE_SECONDS = 300
+CONNECT_TIMEOUT_SECONDS = 3
+
+# Rows per multi-row INSERT ... VALUES statement for executemany-style inserts
+INSERT_PAGE_SIZE = 5000
+
+
+def create_pooled_engine(config: DatabaseConfig) -> Engine:
+    """Create an engine whose connection pool is sized from the configuration"""
+    return create_engine(
+        config.connection_string,
+        pool_size=config.pool_size,
+        max_overflow=config.pool_size,
+        pool_pre_ping=True,  # SELECT 1 before handing out a pooled connection
+        pool_recycle=POOL_RECYCLE_SECONDS,
+        connect_args={"connect_timeout": CONNECT_TIMEOUT_SECONDS},
+        insertmanyvalues_page_size=INSERT_PAGE_SIZE,
+    )
+
+
+def open_database(config: DatabaseConfig) -> Optional[Engine]:
+    """
+    Create the pooled engine and verify connectivity
+
+    Returns:
+        The engine, or None if the database cannot be reached
+    """
+    engine = create_pooled_engine(config)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except SQLAlchemyError as e:
+        logger.warning(f"Database unavailable, continuing without it: {e}")
+        engine.dispose()
+        return None
+
+    logger.info(f"Database pool ready (size {config.pool_size})")
+    return engine
@@ -3,21 +3,43 @@ Cisco ISE Integration Client
 Phase 3: Real integration ready for production with pxGrid support
 """
 
-import json
 import logging
 from typing import Dict, List, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 
+def create_session() -> requests.Session:
+    """Session with a keep-alive connection pool and retries for one ISE node"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class CiscoISEClient:
     """Cisco Identity Services Engine API Client"""
 
     def __init__(
-        self, base_url: str, username: str, password: str, verify_ssl: bool = True
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        verify_ssl: bool = True,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize Cisco ISE client
@@ -27,12 +49,14 @@ class CiscoISEClient:
             username: ISE admin username
             password: ISE admin password
             verify_ssl: Whether to verify SSL certificates
+            session: Session to reuse (and its open connections); one is
+                created with create_session() when omitted
         """
         self.base_url = base_url.rstrip("/")
         self.username = username
         self.password = password
         self.verify_ssl = verify_ssl
-        self.session = requests.Session()
+        self.session = session if session is not None else create_session()
         self.session.auth = HTTPBasicAuth(username, password)
         self.session.headers.update(
             {"Content-Type": "application/json", "Accept": "application/json"}
@@ -40,6 +64,15 @@ class CiscoISEClient:
 
         logger.info(f"Initialized Cisco ISE client for {base_url}")
 
+    @staticmethod
+    def _json(response: requests.Response):
+        """Decode a JSON response body with orjson"""
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            # Keep the RequestException contract of response.json()
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
     def get_endpoint(self, mac_address: str) -> Optional[Dict]:
         """
         Get endpoint details by MAC address
@@ -57,7 +90,7 @@ class CiscoISEClient:
             response = self.session.get(url, params=params, verify=self.verify_ssl)
             response.raise_for_status()
 
-            data = response.json()
+            data = self._json(response)
             endpoints = data.get("SearchResult", {}).get("resources", [])
 
             if endpoints:
@@ -77,7 +110,7 @@ class CiscoISEClient:
             response = self.session.get(url, verify=self.verify_ssl)
             response.raise_for_status()
 
-            return response.json()
+            return self._json(response)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error getting endpoint by ID {endpoint_id}: {e}")
@@ -118,7 +151,9 @@ class CiscoISEClient:
                 }
             }
 
-            response = self.session.put(url, json=update_data, verify=self.verify_ssl)
+            response = self.session.put(
+                url, data=orjson.dumps(update_data), verify=self.verify_ssl
+            )
             response.raise_for_status()
 
             logger.info(f"Successfully quarantined endpoint {mac_address}")
@@ -135,7 +170,7 @@ class CiscoISEClient:
             response = self.session.get(url, verify=self.verify_ssl)
             response.raise_for_status()
 
-            return response.json().get("activeList", [])
+            return self._json(response).get("activeList", [])
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error getting active sessions: {e}")
@@ -148,7 +183,7 @@ class CiscoISEClient:
             response = self.session.get(url, verify=self.verify_ssl)
             response.raise_for_status()
 
-            return response.json()
+            return self._json(response)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error getting auth status for {mac_address}: {e}")
@@ -170,7 +205,9 @@ class CiscoISEClient:
                 }
             }
 
-            response = self.session.post(url, json=profile_data, verify=self.verify_ssl)
+            response = self.session.post(
+                url, data=orjson.dumps(profile_data), verify=self.verify_ssl
+            )
             response.raise_for_status()
 
             logger.info(f"Successfully created authorization profile {name}")
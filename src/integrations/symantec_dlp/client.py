@@ -3,21 +3,132 @@ Symantec DLP Integration Client
 Phase 3: Real integration ready for production
 """
 
-import json
+import asyncio
+import contextlib
 import logging
+import os
+import ssl
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Optional
 
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+ASYNC_TIMEOUT = httpx.Timeout(10.0)
+ASYNC_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+
+class SSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools all use one pre-built SSLContext"""
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+        return super().proxy_manager_for(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        # The context decides verification; REQUESTS_CA_BUNDLE would override it
+        kwargs["verify"] = self.ssl_context.verify_mode != ssl.CERT_NONE
+        return super().send(request, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _ssl_context(verify_ssl: bool) -> ssl.SSLContext:
+    """Build the SSL context for a verification mode once per process"""
+    context = ssl.create_default_context()
+    if not verify_ssl:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+@lru_cache(maxsize=None)
+def _adapter(verify_ssl: bool) -> SSLContextAdapter:
+    """Shared connection pool so every client instance reuses keep-alive connections"""
+    return SSLContextAdapter(
+        _ssl_context(verify_ssl),
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+        ),
+    )
+
+
+def create_session(verify_ssl: bool = True) -> requests.Session:
+    """Session backed by the shared keep-alive pool for a verification mode"""
+    session = requests.Session()
+    session.mount("https://", _adapter(verify_ssl))
+    session.mount("http://", _adapter(verify_ssl))
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+class DLPTokenAuth(httpx.Auth):
+    """
+    Bearer auth for a batch's async client
+
+    Sends the client's current token and, like the sync session's 401 hook,
+    logs in again and retries once when the server rejects it. Concurrent
+    rejections in one batch share a single login.
+    """
+
+    def __init__(self, client: "SymantecDLPClient"):
+        self.client = client
+        self._login_lock = asyncio.Lock()
+
+    async def async_auth_flow(self, request: httpx.Request):
+        token = self.client.token
+        request.headers["Authorization"] = f"Bearer {token}"
+        response = yield request
+        if response.status_code != 401:
+            return
+
+        async with self._login_lock:
+            # Another request may already have replaced the rejected token
+            if self.client.token == token:
+                logger.info("DLP session token rejected, re-authenticating")
+                self.client._invalidate_cached_token()
+                try:
+                    await asyncio.to_thread(self.client._authenticate)
+                except requests.exceptions.RequestException:
+                    return  # Logged by _authenticate; the 401 stands
+
+        request.headers["Authorization"] = f"Bearer {self.client.token}"
+        yield request
+
+
+# Session tokens are cached on disk so short-lived processes skip the login call
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "dlp" / "token.json"
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+LOGIN_PATH = "/ProtectManager/webservices/v2/authentication/login"
+
 
 class SymantecDLPClient:
     """Symantec Data Loss Prevention API Client"""
 
     def __init__(
-        self, base_url: str, username: str, password: str, verify_ssl: bool = True
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        verify_ssl: bool = True,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize Symantec DLP client
@@ -27,34 +138,126 @@ class SymantecDLPClient:
             username: DLP admin username
             password: DLP admin password
             verify_ssl: Whether to verify SSL certificates
+            session: Session to reuse (and its open connections); one is
+                created with create_session(verify_ssl) when omitted
         """
         self.base_url = base_url.rstrip("/")
         self.username = username
         self.password = password
         self.verify_ssl = verify_ssl
-        self.session = requests.Session()
+        self.session = session if session is not None else create_session(verify_ssl)
+        self.session.hooks["response"].append(self._reauthenticate_on_401)
         self.token = None
 
         logger.info(f"Initialized Symantec DLP client for {base_url}")
+        if not self._load_cached_token():
+            self._authenticate()
+
+    @staticmethod
+    def _json(response: requests.Response):
+        """Decode a JSON response body with orjson"""
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            # Keep the RequestException contract of response.json()
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+    def _auth_headers(self) -> Dict[str, str]:
+        """Headers carrying the current session token"""
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.token}",
+        }
+
+    def _load_cached_token(self) -> bool:
+        """Reuse an unexpired token cached for this server and user"""
+        try:
+            cached = orjson.loads(TOKEN_CACHE_PATH.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return False
+
+        if (
+            cached.get("base_url") != self.base_url
+            or cached.get("username") != self.username
+            or cached.get("expires_at", 0) <= time.time()
+        ):
+            return False
+
+        self.token = cached["token"]
+        self.session.headers.update(self._auth_headers())
+        logger.info("Using cached Symantec DLP session token")
+        return True
+
+    def _store_cached_token(self, expires_in: int) -> None:
+        """Persist the current token with its expiry time"""
+        cached = {
+            "base_url": self.base_url,
+            "username": self.username,
+            "token": self.token,
+            "expires_at": time.time() + expires_in - TOKEN_EXPIRY_MARGIN_SECONDS,
+        }
+        # Written owner-only from the start, then renamed over the old cache,
+        # so the token is never readable by other users
+        tmp_path = TOKEN_CACHE_PATH.with_name(
+            f".{TOKEN_CACHE_PATH.name}.{os.getpid()}"
+        )
+        try:
+            TOKEN_CACHE_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(orjson.dumps(cached))
+            os.replace(tmp_path, TOKEN_CACHE_PATH)
+        except OSError as e:
+            logger.warning(f"Could not cache DLP session token: {e}")
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+
+    def _invalidate_cached_token(self) -> None:
+        """Drop the cached token after the server rejected it"""
+        try:
+            TOKEN_CACHE_PATH.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove cached DLP session token: {e}")
+
+    def _reauthenticate_on_401(self, response: requests.Response, *args, **kwargs):
+        """Response hook: log in again and replay the request once on 401"""
+        request = response.request
+        if (
+            response.status_code != 401
+            or request.url.endswith(LOGIN_PATH)
+            or request.headers.get("X-DLP-Reauthenticated")
+        ):
+            return response
+
+        logger.info("DLP session token rejected, re-authenticating")
+        self._invalidate_cached_token()
         self._authenticate()
 
+        retry = request.copy()
+        retry.headers.update(self._auth_headers())
+        retry.headers["X-DLP-Reauthenticated"] = "1"
+        return self.session.send(retry, **kwargs)
+
     def _authenticate(self) -> None:
         """Authenticate and get session token"""
         try:
-            url = f"{self.base_url}/ProtectManager/webservices/v2/authentication/login"
+            url = f"{self.base_url}{LOGIN_PATH}"
 
             auth_data = {"username": self.username, "password": self.password}
 
-            response = requests.post(url, json=auth_data, verify=self.verify_ssl)
+            response = self.session.post(
+                url,
+                data=orjson.dumps(auth_data),
+                headers={"Content-Type": "application/json"},
+            )
             response.raise_for_status()
 
-            self.token = response.json().get("token")
-            self.session.headers.update(
-                {
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.token}",
-                }
-            )
+            login = self._json(response)
+            self.token = login.get("token")
+            self.session.headers.update(self._auth_headers())
+            self._store_cached_token(int(login.get("expires_in", 3600)))
 
             logger.info("Successfully authenticated with Symantec DLP")
 
@@ -91,10 +294,10 @@ class SymantecDLPClient:
             if status:
                 params["status"] = status
 
-            response = self.session.get(url, params=params, verify=self.verify_ssl)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
 
-            return response.json().get("incidents", [])
+            return self._json(response).get("incidents", [])
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error getting incidents: {e}")
@@ -107,10 +310,10 @@ class SymantecDLPClient:
                 f"{self.base_url}/ProtectManager/webservices/v2/incidents/{incident_id}"
             )
 
-            response = self.session.get(url, verify=self.verify_ssl)
+            response = self.session.get(url)
             response.raise_for_status()
 
-            return response.json()
+            return self._json(response)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error getting incident {incident_id}: {e}")
@@ -140,7 +343,7 @@ class SymantecDLPClient:
             if remediation_status:
                 update_data["remediation_status"] = remediation_status
 
-            response = self.session.patch(url, json=update_data, verify=self.verify_ssl)
+            response = self.session.patch(url, data=orjson.dumps(update_data))
             response.raise_for_status()
 
             logger.info(f"Successfully updated incident {incident_id} to {status}")
@@ -155,10 +358,10 @@ class SymantecDLPClient:
         try:
             url = f"{self.base_url}/ProtectManager/webservices/v2/policies"
 
-            response = self.session.post(url, json=policy_data, verify=self.verify_ssl)
+            response = self.session.post(url, data=orjson.dumps(policy_data))
             response.raise_for_status()
 
-            policy_id = response.json().get("policy_id")
+            policy_id = self._json(response).get("policy_id")
             logger.info(f"Successfully created policy {policy_id}")
             return policy_id
 
@@ -175,33 +378,121 @@ class SymantecDLPClient:
 
             params = {"creation_date_later_than": start_time, "group_by": "policy"}
 
-            response = self.session.get(url, params=params, verify=self.verify_ssl)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
 
-            return response.json()
+            return self._json(response)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error getting policy violations summary: {e}")
             return {}
 
-    def quarantine_file(self, incident_id: int) -> bool:
-        """Quarantine a file involved in an incident"""
+    def remediate_batch(
+        self, incident_ids: List[int], action: str = "QUARANTINE"
+    ) -> Dict[int, bool]:
+        """
+        Remediate several incidents with a single request
+
+        Args:
+            incident_ids: DLP incident IDs to remediate
+            action: Remediation action to apply to every incident
+
+        Returns:
+            Mapping of incident ID to remediation success
+        """
         try:
-            url = f"{self.base_url}/ProtectManager/webservices/v2/incidents/{incident_id}/remediate"
+            url = f"{self.base_url}/ProtectManager/webservices/v2/incidents/remediate:batch"
 
             remediation_data = {
-                "action": "QUARANTINE",
+                "ids": list(incident_ids),
+                "action": action,
                 "reason": "Automated security response",
             }
 
-            response = self.session.post(
-                url, json=remediation_data, verify=self.verify_ssl
+            response = self.session.post(url, data=orjson.dumps(remediation_data))
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error remediating incident batch: {e}")
+            return {i: False for i in incident_ids}
+
+        if response.status_code >= 400:
+            logger.error(
+                f"Error remediating incident batch: HTTP {response.status_code}"
             )
-            response.raise_for_status()
+            return {i: False for i in incident_ids}
 
-            logger.info(f"Successfully quarantined file from incident {incident_id}")
-            return True
+        try:
+            results = {
+                item["incident_id"]: item["success"]
+                for item in self._json(response).get("results", [])
+            }
+        except requests.exceptions.JSONDecodeError as e:
+            logger.error(f"Error remediating incident batch: {e}")
+            return {i: False for i in incident_ids}
+
+        logger.info(f"Remediated {sum(results.values())}/{len(incident_ids)} incidents")
+        return {i: results.get(i, False) for i in incident_ids}
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """Create an async client whose connection pool is shared by one batch"""
+        return httpx.AsyncClient(
+            verify=_ssl_context(self.verify_ssl),
+            timeout=ASYNC_TIMEOUT,
+            limits=ASYNC_LIMITS,
+            headers={"Content-Type": "application/json"},
+            auth=DLPTokenAuth(self),
+        )
+
+    async def quarantine_file_async(
+        self, incident_id: int, client: httpx.AsyncClient
+    ) -> bool:
+        """Quarantine a file involved in an incident without blocking"""
+        try:
+            url = f"{self.base_url}/ProtectManager/webservices/v2/incidents/{incident_id}/remediate"
 
-        except requests.exceptions.RequestException as e:
+            remediation_data = {
+                "action": "QUARANTINE",
+                "reason": "Automated security response",
+            }
+
+            response = await client.post(url, content=orjson.dumps(remediation_data))
+        except httpx.HTTPError as e:
             logger.error(f"Error quarantining file for incident {incident_id}: {e}")
             return False
+
+        # 4xx is routine here (e.g. already remediated), so skip raising
+        if not response.is_success:
+            logger.error(
+                f"Error quarantining file for incident {incident_id}: "
+                f"HTTP {response.status_code}"
+            )
+            return False
+
+        logger.info(f"Successfully quarantined file from incident {incident_id}")
+        return True
+
+    async def quarantine_many(self, incident_ids: List[int]) -> Dict[int, bool]:
+        """
+        Quarantine files for several incidents concurrently
+
+        Args:
+            incident_ids: DLP incident IDs to remediate
+
+        Returns:
+            Mapping of incident ID to quarantine success
+        """
+        async with self._async_client() as client:
+            results = await asyncio.gather(
+                *(self.quarantine_file_async(i, client) for i in incident_ids)
+            )
+        return dict(zip(incident_ids, results))
+
+    def quarantine_file(self, incident_id: int) -> bool:
+        """
+        Quarantine a file involved in an incident (scripts and CLI use only)
+
+        Starts its own event loop with asyncio.run(), so it raises
+        RuntimeError when called from a running loop; code running in the
+        API, the orchestrator or the remediation engine must await
+        quarantine_many (or quarantine_file_async) instead.
+        """
+        return asyncio.run(self.quarantine_many([incident_id]))[incident_id]
@@ -0,0 +1,107 @@
+"""
+Queued Logging
+Root logger setup, with handler I/O moved off the calling thread (and the
+event loop)
+"""
+
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Optional
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_FILE = Path("logs/application.log")
+
+# Records waiting for the listener thread; beyond this, records are dropped
+LOG_QUEUE_SIZE = 10_000
+
+# Above this fill level only WARNING and higher records are queued
+LOG_QUEUE_SHED_LEVEL = int(LOG_QUEUE_SIZE * 0.9)
+
+
+def configure_logging() -> None:
+    """
+    Send records to stdout and logs/application.log at LOG_LEVEL
+
+    Does nothing if the root logger already has handlers, so it is safe to
+    call from both src/main.py and the API lifespan (e.g. under uvicorn).
+    LOG_LEVEL=WARNING in production skips INFO formatting.
+    """
+    if logging.getLogger().handlers:
+        return
+
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        format=LOG_FORMAT,
+        handlers=[
+            logging.FileHandler(LOG_FILE),
+            logging.StreamHandler(sys.stdout),
+        ],
+    )
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that sheds records under a log burst instead of blocking"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if (
+            record.levelno < logging.WARNING
+            and self.queue.qsize() >= LOG_QUEUE_SHED_LEVEL
+        ):
+            self.dropped += 1
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def start_log_queue() -> Optional[QueueListener]:
+    """
+    Put the root logger's handlers behind a bounded queue
+
+    Callers then only enqueue records; a listener thread does the formatting
+    and the file/stream writes.
+
+    Returns:
+        The running listener, or None if the root logger has no handlers
+    """
+    root = logging.getLogger()
+    handlers = [h for h in root.handlers if not isinstance(h, QueueHandler)]
+    if not handlers:
+        return None
+
+    log_queue = queue.Queue(LOG_QUEUE_SIZE)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(DroppingQueueHandler(log_queue))
+    listener.start()
+    return listener
+
+
+def stop_log_queue(listener: QueueListener) -> None:
+    """Flush queued records and hand the real handlers back to the root logger"""
+    listener.stop()
+
+    root = logging.getLogger()
+    dropped = 0
+    for handler in list(root.handlers):
+        if isinstance(handler, DroppingQueueHandler):
+            root.removeHandler(handler)
+            dropped += handler.dropped
+    for handler in listener.handlers:
+        root.addHandler(handler)
+
+    if dropped:
+        logging.getLogger(__name__).warning(
+            "Dropped %d log records during bursts", dropped
+        )
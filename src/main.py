@@ -13,34 +13,39 @@ import uvicorn
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.api.app import app
-from src.config import Config
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("logs/application.log"),
-        logging.StreamHandler(sys.stdout),
-    ],
-)
+from src.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# C event loop and HTTP parser for the API server (uvloop has no Windows build)
+SERVER_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+SERVER_HTTP = "httptools"
+
 
 def main():
     """Main application entry point"""
+    from src.logging_queue import configure_logging
+
+    configure_logging()
+
     logger.info("=" * 80)
     logger.info("WALMART NETWORK SECURITY AUTOMATION AI - STARTING")
     logger.info("=" * 80)
 
     try:
         # Load configuration
-        config = Config()
+        config = get_config()
 
         # Start FastAPI server
         logger.info("Starting FastAPI server...")
-        uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+        uvicorn.run(
+            app,
+            host="0.0.0.0",
+            port=8000,
+            loop=SERVER_LOOP,
+            http=SERVER_HTTP,
+            log_level="info",
+        )
 
     except KeyboardInterrupt:
         logger.info("Shutting down gracefully...")
@@ -3,26 +3,42 @@ LSTM Time-Series Predictor
 Phase 4: Predictive maintenance and capacity forecasting
 """
 
+import importlib.util
 import logging
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
-logger = logging.getLogger(__name__)
-
-# Try to import TensorFlow, but make it optional for local testing
-try:
+if TYPE_CHECKING:
     import tensorflow as tf
-    from tensorflow import keras
-    from tensorflow.keras.callbacks import EarlyStopping, ModelCheckpoint
-    from tensorflow.keras.layers import LSTM, Dense, Dropout
-    from tensorflow.keras.models import Sequential
 
-    TF_AVAILABLE = True
-except ImportError:
+logger = logging.getLogger(__name__)
+
+# TensorFlow is optional for local testing and only imported on first use,
+# so importing this module does not pay TensorFlow's multi-second load time
+TF_AVAILABLE = importlib.util.find_spec("tensorflow") is not None
+if not TF_AVAILABLE:
     logger.warning("TensorFlow not available. LSTM functionality will be limited.")
-    TF_AVAILABLE = False
+
+
+def __getattr__(name: str):
+    """Resolve the module-level tf/keras names lazily"""
+    if name == "tf":
+        import tensorflow as tf
+
+        return tf
+    if name == "keras":
+        from tensorflow import keras
+
+        return keras
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Bounded shuffle buffer for streamed training windows
+SHUFFLE_BUFFER_SIZE = 1024
 
 
 class NetworkLSTMPredictor:
@@ -57,6 +73,8 @@ class NetworkLSTMPredictor:
         self.scaler_X = None
         self.scaler_y = None
         self.is_trained = False
+        self._tflite_bytes = None
+        self._interpreter = None
 
         if not TF_AVAILABLE:
             logger.warning("TensorFlow not available. LSTM model will not function.")
@@ -71,6 +89,9 @@ class NetworkLSTMPredictor:
         if not TF_AVAILABLE:
             raise RuntimeError("TensorFlow is required but not available")
 
+        from tensorflow.keras.layers import LSTM, Dense, Dropout
+        from tensorflow.keras.models import Sequential
+
         self.model = Sequential()
 
         # First LSTM layer
@@ -97,6 +118,33 @@ class NetworkLSTMPredictor:
 
         logger.info("LSTM model architecture built")
 
+    def _convert_to_tflite(self) -> None:
+        """Convert the trained model to a TFLite model with int8 weights"""
+        import tensorflow as tf
+        from tensorflow import keras
+
+        self._interpreter = None
+        try:
+            # LSTM state tensors need a static shape, so pin batch size to 1
+            inputs = keras.Input(shape=self.model.input_shape[1:], batch_size=1)
+            single = keras.Model(inputs, self.model(inputs))
+
+            converter = tf.lite.TFLiteConverter.from_keras_model(single)
+            converter.optimizations = [tf.lite.Optimize.DEFAULT]
+            self._tflite_bytes = converter.convert()
+        except Exception as e:
+            logger.warning(f"TFLite conversion failed, using Keras inference: {e}")
+            self._tflite_bytes = None
+
+    def _get_interpreter(self) -> "tf.lite.Interpreter":
+        """Get the TFLite interpreter, allocating it on first use"""
+        if self._interpreter is None:
+            import tensorflow as tf
+
+            self._interpreter = tf.lite.Interpreter(model_content=self._tflite_bytes)
+            self._interpreter.allocate_tensors()
+        return self._interpreter
+
     def prepare_sequences(
         self, data: np.ndarray, target_col: int = 0
     ) -> Tuple[np.ndarray, np.ndarray]:
@@ -110,21 +158,55 @@ class NetworkLSTMPredictor:
         Returns:
             Tuple of (X, y) sequences
         """
-        X, y = [], []
-
-        for i in range(len(data) - self.sequence_length - self.forecast_horizon + 1):
-            X.append(data[i : i + self.sequence_length])
-            y.append(
-                data[
-                    i
-                    + self.sequence_length : i
-                    + self.sequence_length
-                    + self.forecast_horizon,
-                    target_col,
-                ]
+        n_sequences = len(data) - self.sequence_length - self.forecast_horizon + 1
+        if n_sequences <= 0:
+            return (
+                np.empty((0, self.sequence_length) + data.shape[1:], dtype=data.dtype),
+                np.empty((0, self.forecast_horizon), dtype=data.dtype),
             )
 
-        return np.array(X), np.array(y)
+        # Zero-copy window views; windows are appended as the last axis
+        windows = sliding_window_view(data, self.sequence_length, axis=0)
+        X = np.moveaxis(windows[:n_sequences], -1, 1)
+        y = sliding_window_view(
+            data[self.sequence_length :, target_col], self.forecast_horizon
+        )
+
+        # One contiguous copy each instead of per-window list appends
+        return np.ascontiguousarray(X), np.ascontiguousarray(y)
+
+    def _make_dataset(
+        self,
+        data: np.ndarray,
+        batch_size: int,
+        target_col: int = 0,
+        shuffle: bool = False,
+    ) -> "tf.data.Dataset":
+        """
+        Stream (sequence, scaled target) pairs from a scaled time series
+
+        Windows are cut on the fly, so memory stays O(batch) instead of
+        materializing every overlapping sequence up front.
+        """
+        import tensorflow as tf
+
+        window = self.sequence_length + self.forecast_horizon
+        y_mean = tf.constant(self.scaler_y.mean_, dtype=tf.float32)
+        y_scale = tf.constant(self.scaler_y.scale_, dtype=tf.float32)
+
+        def split_window(w):
+            y = (w[self.sequence_length :, target_col] - y_mean) / y_scale
+            return w[: self.sequence_length], y
+
+        ds = (
+            tf.data.Dataset.from_tensor_slices(data)
+            .window(window, shift=1, drop_remainder=True)
+            .flat_map(lambda w: w.batch(window))
+            .map(split_window, num_parallel_calls=tf.data.AUTOTUNE)
+        )
+        if shuffle:
+            ds = ds.shuffle(SHUFFLE_BUFFER_SIZE)
+        return ds.batch(batch_size).prefetch(tf.data.AUTOTUNE)
 
     def train(
         self,
@@ -166,18 +248,34 @@ class NetworkLSTMPredictor:
         self.scaler_X = StandardScaler()
         self.scaler_y = StandardScaler()
 
-        data_scaled = self.scaler_X.fit_transform(data)
+        data_scaled = self.scaler_X.fit_transform(data).astype(np.float32)
 
-        # Prepare sequences
-        X, y = self.prepare_sequences(data_scaled)
+        # Scale targets separately (fit on a zero-copy view of the target windows)
+        self.scaler_y.fit(
+            sliding_window_view(
+                data_scaled[self.sequence_length :, 0], self.forecast_horizon
+            )
+        )
 
-        # Scale targets separately
-        y_scaled = self.scaler_y.fit_transform(y)
+        # Split sequences chronologically, like Keras' validation_split
+        window = self.sequence_length + self.forecast_horizon
+        n_sequences = len(data_scaled) - window + 1
+        n_train = int(np.ceil(n_sequences * (1.0 - validation_split)))
+        train_ds = self._make_dataset(
+            data_scaled[: n_train + window - 1], batch_size, shuffle=True
+        )
+        val_ds = (
+            self._make_dataset(data_scaled[n_train:], batch_size)
+            if n_train < n_sequences
+            else None
+        )
 
         # Build model if not exists
         if self.model is None:
             self._build_model(n_features=len(feature_columns))
 
+        from tensorflow.keras.callbacks import EarlyStopping
+
         # Callbacks
         callbacks = [
             EarlyStopping(monitor="val_loss", patience=10, restore_best_weights=True)
@@ -185,16 +283,15 @@ class NetworkLSTMPredictor:
 
         # Train model
         history = self.model.fit(
-            X,
-            y_scaled,
-            validation_split=validation_split,
+            train_ds,
+            validation_data=val_ds,
             epochs=epochs,
-            batch_size=batch_size,
             callbacks=callbacks,
             verbose=1,
         )
 
         self.is_trained = True
+        self._convert_to_tflite()
 
         # Calculate training metrics
         train_metrics = {
@@ -228,10 +325,18 @@ class NetworkLSTMPredictor:
         recent_scaled = self.scaler_X.transform(recent_data)
 
         # Reshape for LSTM input
-        X = recent_scaled.reshape(1, self.sequence_length, -1)
-
-        # Predict
-        y_scaled = self.model.predict(X, verbose=0)
+        X = recent_scaled.astype(np.float32).reshape(1, self.sequence_length, -1)
+
+        # Predict (TFLite avoids Keras' per-call dispatch overhead)
+        if self._tflite_bytes is not None:
+            interpreter = self._get_interpreter()
+            interpreter.set_tensor(interpreter.get_input_details()[0]["index"], X)
+            interpreter.invoke()
+            y_scaled = interpreter.get_tensor(
+                interpreter.get_output_details()[0]["index"]
+            )
+        else:
+            y_scaled = self.model.predict(X, verbose=0)
 
         # Inverse transform
         y_pred = self.scaler_y.inverse_transform(y_scaled)
@@ -291,6 +396,9 @@ class NetworkLSTMPredictor:
             raise ValueError("Cannot save untrained model")
 
         self.model.save(f"{path}.h5")
+        if self._tflite_bytes is not None:
+            with open(f"{path}.tflite", "wb") as f:
+                f.write(self._tflite_bytes)
 
         import joblib
 
@@ -314,6 +422,7 @@ class NetworkLSTMPredictor:
             raise RuntimeError("TensorFlow is required but not available")
 
         import joblib
+        from tensorflow import keras
 
         config = joblib.load(f"{path}_config.joblib")
 
@@ -323,10 +432,17 @@ class NetworkLSTMPredictor:
             hidden_units=config["hidden_units"],
         )
 
-        predictor.model = keras.models.load_model(f"{path}.h5")
+        # Inference only, so the training configuration is not restored
+        predictor.model = keras.models.load_model(f"{path}.h5", compile=False)
         predictor.scaler_X = config["scaler_X"]
         predictor.scaler_y = config["scaler_y"]
         predictor.is_trained = True
 
+        tflite_path = Path(f"{path}.tflite")
+        if tflite_path.exists():
+            predictor._tflite_bytes = tflite_path.read_bytes()
+        else:
+            predictor._convert_to_tflite()
+
         logger.info(f"Model loaded from {path}")
         return predictor
@@ -4,6 +4,10 @@ Phase 4: Training pipeline for all ML models
 """
 
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -13,6 +17,26 @@ import pandas as pd
 logger = logging.getLogger(__name__)
 
 
+def _forward_worker_logs(log_queue: multiprocessing.Queue, level: int) -> None:
+    """Pool initializer: hand this worker's log records to the parent process"""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+def _train_lstm_in_worker(trainer: "ModelTrainer", training_data_path: str) -> Dict:
+    """Train the LSTM in a pool worker, leaving half the cores to the forest"""
+    try:
+        import tensorflow as tf
+
+        threads = max(1, (os.cpu_count() or 2) // 2)
+        tf.config.threading.set_intra_op_parallelism_threads(threads)
+    except Exception:
+        pass
+
+    return trainer.train_lstm_predictor(training_data_path)
+
+
 class ModelTrainer:
     """Centralized ML model training orchestrator"""
 
@@ -28,7 +52,7 @@ class ModelTrainer:
         logger.info("Training anomaly detection model...")
 
         # Load training data
-        df = pd.read_csv(training_data_path)
+        df = pd.read_parquet(training_data_path)
 
         # Import and train model - FIX: Import correcto
         from src.ml.models.anomaly_detector import NetworkAnomalyDetector
@@ -49,7 +73,7 @@ class ModelTrainer:
 
         try:
             # Load training data
-            df = pd.read_csv(training_data_path, parse_dates=["timestamp"])
+            df = pd.read_parquet(training_data_path)
             df = df.set_index("timestamp")
 
             # Import and train model
@@ -71,25 +95,49 @@ class ModelTrainer:
             return {"status": "skipped", "reason": str(e)}
 
     def train_all_models(self) -> Dict:
-        """Train all ML models"""
+        """Train all ML models (the models share no state, so they train in parallel)"""
         results = {}
 
+        anomaly_data = self.data_dir / "network_events_training.parquet"
+        lstm_data = self.data_dir / "timeseries_training.parquet"
+
+        # Spawned workers start without the parent's TensorFlow/BLAS thread state,
+        # and without its logging setup, so their records come back over a queue
+        context = multiprocessing.get_context("spawn")
+        log_queue = context.Queue()
+        root = logging.getLogger()
+        listener = QueueListener(
+            log_queue,
+            *(root.handlers or [logging.lastResort]),
+            respect_handler_level=True,
+        )
+        listener.start()
         try:
-            # Train anomaly detector
-            anomaly_data = self.data_dir / "network_events_training.csv"
-            if anomaly_data.exists():
-                results["anomaly_detector"] = self.train_anomaly_detector(
-                    str(anomaly_data)
-                )
-
-            # Train LSTM predictor
-            lstm_data = self.data_dir / "timeseries_training.csv"
-            if lstm_data.exists():
-                results["lstm_predictor"] = self.train_lstm_predictor(str(lstm_data))
-
+            with ProcessPoolExecutor(
+                max_workers=2,
+                mp_context=context,
+                initializer=_forward_worker_logs,
+                initargs=(log_queue, root.getEffectiveLevel()),
+            ) as executor:
+                futures = {}
+                if anomaly_data.exists():
+                    futures["anomaly_detector"] = executor.submit(
+                        self.train_anomaly_detector, str(anomaly_data)
+                    )
+                if lstm_data.exists():
+                    futures["lstm_predictor"] = executor.submit(
+                        _train_lstm_in_worker, self, str(lstm_data)
+                    )
+
+                for name, future in futures.items():
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error training {name}: {e}", exc_info=True)
+        finally:
+            listener.stop()
+
+        if len(results) == len(futures):
             logger.info("All models trained successfully")
 
-        except Exception as e:
-            logger.error(f"Error training models: {e}", exc_info=True)
-
         return results
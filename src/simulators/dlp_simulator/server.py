@@ -5,11 +5,27 @@ Phase 3: Mock DLP REST API for local testing
 
 import random
 import uuid
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 
+import numpy as np
+import orjson
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Mock session token
 SESSION_TOKEN = str(uuid.uuid4())
@@ -27,30 +43,86 @@ POLICY_NAMES = [
     "Source Code Protection",
 ]
 
-for i in range(20):
-    incident_id = 1000 + i
+SOURCES = ["Email", "Endpoint", "Network", "Cloud"]
+DESTINATIONS = ["External Email", "USB Drive", "Cloud Storage", "File Share"]
+MATCHED_DATA_TYPES = ["Credit Card", "SSN", "Confidential", "Source Code"]
+
+# Number of seeded mock incidents (raise for stress-test fixtures)
+MOCK_INCIDENT_COUNT = 20
+
+rng = np.random.default_rng()
+
+
+def _draw(choices, count):
+    """Pick count values from choices in one batched draw"""
+    return np.asarray(choices)[rng.integers(0, len(choices), size=count)].tolist()
+
+
+seeded_at = datetime.utcnow()
+severities = _draw(SEVERITIES, MOCK_INCIDENT_COUNT)
+statuses = _draw(STATUSES, MOCK_INCIDENT_COUNT)
+policy_names = _draw(POLICY_NAMES, MOCK_INCIDENT_COUNT)
+hours_ago = rng.integers(1, 49, size=MOCK_INCIDENT_COUNT).tolist()
+user_ids = rng.integers(1, 101, size=MOCK_INCIDENT_COUNT).tolist()
+sources = _draw(SOURCES, MOCK_INCIDENT_COUNT)
+destinations = _draw(DESTINATIONS, MOCK_INCIDENT_COUNT)
+data_types = _draw(MATCHED_DATA_TYPES, MOCK_INCIDENT_COUNT)
+match_counts = rng.integers(1, 51, size=MOCK_INCIDENT_COUNT).tolist()
+
+for i in range(MOCK_INCIDENT_COUNT):
     incidents.append(
         {
-            "incident_id": incident_id,
-            "severity": random.choice(SEVERITIES),
-            "status": random.choice(STATUSES),
-            "policy_name": random.choice(POLICY_NAMES),
-            "detection_date": (
-                datetime.utcnow() - timedelta(hours=random.randint(1, 48))
-            ).isoformat(),
-            "user": f"user{random.randint(1, 100)}@walmart.com",
-            "source": random.choice(["Email", "Endpoint", "Network", "Cloud"]),
-            "destination": random.choice(
-                ["External Email", "USB Drive", "Cloud Storage", "File Share"]
-            ),
-            "matched_data_type": random.choice(
-                ["Credit Card", "SSN", "Confidential", "Source Code"]
-            ),
-            "match_count": random.randint(1, 50),
+            "incident_id": 1000 + i,
+            "severity": severities[i],
+            "status": statuses[i],
+            "policy_name": policy_names[i],
+            "detection_date": (seeded_at - timedelta(hours=hours_ago[i])).isoformat(),
+            "user": f"user{user_ids[i]}@walmart.com",
+            "source": sources[i],
+            "destination": destinations[i],
+            "matched_data_type": data_types[i],
+            "match_count": match_counts[i],
         }
     )
 
 
+incidents_by_id = {incident["incident_id"]: incident for incident in incidents}
+rows_by_id = {incident["incident_id"]: row for row, incident in enumerate(incidents)}
+
+# Columnar copies of the filterable fields, row-aligned with incidents
+severity_column = [incident["severity"] for incident in incidents]
+status_column = [incident["status"] for incident in incidents]
+policy_column = [incident["policy_name"] for incident in incidents]
+
+
+def _build_index(column):
+    """Map each value in a column to the set of rows holding it"""
+    index = defaultdict(set)
+    for row, value in enumerate(column):
+        index[value].add(row)
+    return index
+
+
+severity_index = _build_index(severity_column)
+status_index = _build_index(status_column)
+
+
+def _set_status(incident, status):
+    """Update an incident's status, keeping the status column and index in sync"""
+    row = rows_by_id[incident["incident_id"]]
+    status_index[status_column[row]].discard(row)
+    status_index[status].add(row)
+    status_column[row] = status
+    incident["status"] = status
+
+
+def _apply_remediation(incident, action):
+    """Mark an incident as remediated with the given action"""
+    incident["remediation_action"] = action
+    incident["remediation_date"] = datetime.utcnow().isoformat()
+    _set_status(incident, "RESOLVED")
+
+
 @app.route("/ProtectManager/webservices/v2/authentication/login", methods=["POST"])
 def login():
     """Authentication endpoint"""
@@ -63,12 +135,14 @@ def get_incidents():
     severity_filter = request.args.get("severity")
     status_filter = request.args.get("status")
 
-    filtered = incidents
-
+    rows = None
     if severity_filter:
-        filtered = [inc for inc in filtered if inc["severity"] == severity_filter]
+        rows = severity_index.get(severity_filter, set())
     if status_filter:
-        filtered = [inc for inc in filtered if inc["status"] == status_filter]
+        matches = status_index.get(status_filter, set())
+        rows = matches if rows is None else rows & matches
+
+    filtered = incidents if rows is None else [incidents[row] for row in sorted(rows)]
 
     return jsonify({"incidents": filtered, "total_count": len(filtered)})
 
@@ -78,10 +152,10 @@ def get_incidents():
 )
 def get_incident_details(incident_id):
     """Get incident details"""
-    for incident in incidents:
-        if incident["incident_id"] == incident_id:
-            return jsonify(incident)
-    return jsonify({"error": "Incident not found"}), 404
+    incident = incidents_by_id.get(incident_id)
+    if incident is None:
+        return jsonify({"error": "Incident not found"}), 404
+    return jsonify(incident)
 
 
 @app.route(
@@ -89,15 +163,15 @@ def get_incident_details(incident_id):
 )
 def update_incident(incident_id):
     """Update incident status"""
-    for incident in incidents:
-        if incident["incident_id"] == incident_id:
-            data = request.json
-            if "status" in data:
-                incident["status"] = data["status"]
-            if "remediation_status" in data:
-                incident["remediation_status"] = data["remediation_status"]
-            return jsonify({"success": True, "incident": incident})
-    return jsonify({"error": "Incident not found"}), 404
+    incident = incidents_by_id.get(incident_id)
+    if incident is None:
+        return jsonify({"error": "Incident not found"}), 404
+    data = request.json
+    if "status" in data:
+        _set_status(incident, data["status"])
+    if "remediation_status" in data:
+        incident["remediation_status"] = data["remediation_status"]
+    return jsonify({"success": True, "incident": incident})
 
 
 @app.route(
@@ -106,46 +180,67 @@ def update_incident(incident_id):
 )
 def remediate_incident(incident_id):
     """Remediate incident (quarantine, block, etc.)"""
-    for incident in incidents:
-        if incident["incident_id"] == incident_id:
-            data = request.json
-            incident["remediation_action"] = data.get("action", "QUARANTINE")
-            incident["remediation_date"] = datetime.utcnow().isoformat()
-            incident["status"] = "RESOLVED"
-            return jsonify({"success": True, "incident": incident})
-    return jsonify({"error": "Incident not found"}), 404
+    incident = incidents_by_id.get(incident_id)
+    if incident is None:
+        return jsonify({"error": "Incident not found"}), 404
+    _apply_remediation(incident, request.json.get("action", "QUARANTINE"))
+    return jsonify({"success": True, "incident": incident})
+
+
+@app.route(
+    "/ProtectManager/webservices/v2/incidents/remediate:batch",
+    methods=["POST"],
+)
+def remediate_incidents_batch():
+    """Remediate several incidents in one request"""
+    data = request.json
+    action = data.get("action", "QUARANTINE")
+    results = []
+    for incident_id in data.get("ids", []):
+        incident = incidents_by_id.get(incident_id)
+        if incident is None:
+            results.append(
+                {
+                    "incident_id": incident_id,
+                    "success": False,
+                    "error": "Incident not found",
+                }
+            )
+            continue
+        _apply_remediation(incident, action)
+        results.append({"incident_id": incident_id, "success": True})
+    return jsonify({"results": results})
+
+
+def _summarize_incidents():
+    """Count incidents by policy and severity from the column arrays"""
+    summary_by_policy = {}
+    for (policy, severity), count in Counter(
+        zip(policy_column, severity_column)
+    ).items():
+        policy_summary = summary_by_policy.setdefault(
+            policy, {"count": 0, "severities": {}}
+        )
+        policy_summary["count"] += count
+        policy_summary["severities"][severity] = count
+
+    return {
+        "by_policy": summary_by_policy,
+        "by_severity": {
+            severity: len(rows) for severity, rows in severity_index.items()
+        },
+        "total_incidents": len(incidents),
+    }
+
+
+# Policy and severity never change after seeding, so the summary is encoded once
+SUMMARY_BODY = orjson.dumps(_summarize_incidents())
 
 
 @app.route("/ProtectManager/webservices/v2/incidents/summary", methods=["GET"])
 def get_incidents_summary():
     """Get incidents summary"""
-    summary_by_policy = {}
-    summary_by_severity = {}
-
-    for incident in incidents:
-        # By policy
-        policy = incident["policy_name"]
-        if policy not in summary_by_policy:
-            summary_by_policy[policy] = {"count": 0, "severities": {}}
-        summary_by_policy[policy]["count"] += 1
-
-        severity = incident["severity"]
-        if severity not in summary_by_policy[policy]["severities"]:
-            summary_by_policy[policy]["severities"][severity] = 0
-        summary_by_policy[policy]["severities"][severity] += 1
-
-        # By severity
-        if severity not in summary_by_severity:
-            summary_by_severity[severity] = 0
-        summary_by_severity[severity] += 1
-
-    return jsonify(
-        {
-            "by_policy": summary_by_policy,
-            "by_severity": summary_by_severity,
-            "total_incidents": len(incidents),
-        }
-    )
+    return app.response_class(SUMMARY_BODY, mimetype="application/json")
 
 
 @app.route("/ProtectManager/webservices/v2/policies", methods=["POST"])
@@ -166,18 +261,26 @@ def create_policy():
     )
 
 
+# The mock store has a fixed size, so the health payload is encoded once
+HEALTH_BODY = orjson.dumps(
+    {
+        "status": "healthy",
+        "service": "DLP Simulator",
+        "incidents_count": len(incidents),
+    }
+)
+
+
 @app.route("/health", methods=["GET"])
 def health():
     """Health check endpoint"""
-    return jsonify(
-        {
-            "status": "healthy",
-            "service": "DLP Simulator",
-            "incidents_count": len(incidents),
-        }
-    )
+    return app.response_class(HEALTH_BODY, mimetype="application/json")
 
 
 if __name__ == "__main__":
+    # Multi-threaded WSGI server so concurrent client calls are not serialized.
+    # Alternative: gunicorn -w 4 -k gthread --threads 16 server:app
+    from waitress import serve
+
     print("Starting Symantec DLP Simulator on port 8080...")
-    app.run(host="0.0.0.0", port=8080, debug=True)
+    serve(app, host="0.0.0.0", port=8080, threads=16)
@@ -3,37 +3,75 @@ Cisco ISE Simulator
 Phase 3: Mock ISE REST API for local testing
 """
 
-import random
 import uuid
 from datetime import datetime
 
+import numpy as np
+import orjson
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Mock data store
 endpoints = {}
 sessions = {}
 
 
-def generate_mac():
-    """Generate random MAC address"""
-    return ":".join(["%02x" % random.randint(0, 255) for _ in range(6)])
+# Number of seeded mock endpoints (raise for stress-test fixtures)
+MOCK_ENDPOINT_COUNT = 10
+
+# Two-character hex string for every byte value
+HEX_BYTES = np.array([f"{byte:02x}" for byte in range(256)])
+
+rng = np.random.default_rng()
+
+
+def generate_macs(count):
+    """Generate random MAC addresses from one batched draw"""
+    octets = HEX_BYTES[rng.integers(0, 256, size=(count, 6))]
+    return [":".join(row) for row in octets.tolist()]
 
 
 # Initialize some mock endpoints
-for i in range(10):
-    mac = generate_mac()
+seeded_at = datetime.utcnow().isoformat()
+ip_octets = rng.integers(1, 255, size=(MOCK_ENDPOINT_COUNT, 2)).tolist()
+for i, (mac, (subnet, host)) in enumerate(
+    zip(generate_macs(MOCK_ENDPOINT_COUNT), ip_octets)
+):
     endpoints[mac] = {
         "id": str(uuid.uuid4()),
         "mac": mac,
         "name": f"Device-{i}",
         "groupId": "STANDARD_GROUP",
-        "ipAddress": f"10.1.{random.randint(1, 254)}.{random.randint(1, 254)}",
+        "ipAddress": f"10.1.{subnet}.{host}",
         "profileId": "Employee-Profile",
         "status": "CONNECTED",
-        "lastSeen": datetime.utcnow().isoformat(),
+        "lastSeen": seeded_at,
     }
+    sessions[mac] = {
+        "username": f"user_{mac.replace(':', '')}",
+        "session_start": seeded_at,
+    }
+
+
+# Endpoint ID -> MAC index for ID-based lookups
+endpoints_by_id = {ep["id"]: mac for mac, ep in endpoints.items()}
+
+# Encoded ActiveList payload, rebuilt only after an endpoint changes
+_active_cache = {"body": None}
 
 
 @app.route("/ers/config/endpoint", methods=["GET"])
@@ -69,39 +107,41 @@ def list_endpoints():
 @app.route("/ers/config/endpoint/<endpoint_id>", methods=["GET"])
 def get_endpoint(endpoint_id):
     """Get endpoint by ID"""
-    for ep in endpoints.values():
-        if ep["id"] == endpoint_id:
-            return jsonify({"ERSEndPoint": ep})
-    return jsonify({"error": "Endpoint not found"}), 404
+    mac = endpoints_by_id.get(endpoint_id)
+    if mac is None:
+        return jsonify({"error": "Endpoint not found"}), 404
+    return jsonify({"ERSEndPoint": endpoints[mac]})
 
 
 @app.route("/ers/config/endpoint/<endpoint_id>", methods=["PUT"])
 def update_endpoint(endpoint_id):
     """Update endpoint (for quarantine)"""
-    for mac, ep in endpoints.items():
-        if ep["id"] == endpoint_id:
-            data = request.json
-            if "ERSEndPoint" in data:
-                endpoints[mac].update(data["ERSEndPoint"])
-            return jsonify({"success": True})
-    return jsonify({"error": "Endpoint not found"}), 404
+    mac = endpoints_by_id.get(endpoint_id)
+    if mac is None:
+        return jsonify({"error": "Endpoint not found"}), 404
+    data = request.json
+    if "ERSEndPoint" in data:
+        endpoints[mac].update(data["ERSEndPoint"])
+        _active_cache["body"] = None
+        # Keep the index consistent if the payload changed the endpoint ID
+        new_id = endpoints[mac]["id"]
+        if new_id != endpoint_id:
+            del endpoints_by_id[endpoint_id]
+            endpoints_by_id[new_id] = mac
+    return jsonify({"success": True})
 
 
 @app.route("/admin/API/mnt/Session/ActiveList", methods=["GET"])
 def get_active_sessions():
     """Get active sessions"""
-    active = []
-    for mac, ep in endpoints.items():
-        if ep["status"] == "CONNECTED":
-            active.append(
-                {
-                    "mac_address": mac,
-                    "ip_address": ep["ipAddress"],
-                    "username": f"user_{mac.replace(':', '')}",
-                    "session_start": datetime.utcnow().isoformat(),
-                }
-            )
-    return jsonify({"activeList": active})
+    if _active_cache["body"] is None:
+        active = [
+            {"mac_address": mac, "ip_address": ep["ipAddress"], **sessions[mac]}
+            for mac, ep in endpoints.items()
+            if ep["status"] == "CONNECTED"
+        ]
+        _active_cache["body"] = orjson.dumps({"activeList": active})
+    return app.response_class(_active_cache["body"], mimetype="application/json")
 
 
 @app.route("/admin/API/mnt/AuthStatus/MACAddress/<mac>", methods=["GET"])
@@ -120,18 +160,26 @@ def get_auth_status(mac):
     return jsonify({"error": "MAC not found"}), 404
 
 
+# The mock store has a fixed size, so the health payload is encoded once
+HEALTH_BODY = orjson.dumps(
+    {
+        "status": "healthy",
+        "service": "ISE Simulator",
+        "endpoints_count": len(endpoints),
+    }
+)
+
+
 @app.route("/health", methods=["GET"])
 def health():
     """Health check endpoint"""
-    return jsonify(
-        {
-            "status": "healthy",
-            "service": "ISE Simulator",
-            "endpoints_count": len(endpoints),
-        }
-    )
+    return app.response_class(HEALTH_BODY, mimetype="application/json")
 
 
 if __name__ == "__main__":
+    # Multi-threaded WSGI server so concurrent client calls are not serialized.
+    # Alternative: gunicorn -w 4 -k gthread --threads 16 server:app
+    from waitress import serve
+
     print("Starting Cisco ISE Simulator on port 9060...")
-    app.run(host="0.0.0.0", port=9060, debug=True)
+    serve(app, host="0.0.0.0", port=9060, threads=16)
@@ -7,9 +7,15 @@ import pytest
 import sys
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Rows in the shared synthetic_events frame (enough for the performance tests)
+SYNTHETIC_EVENT_ROWS = 1000
+
 @pytest.fixture
 def sample_network_event():
     """Sample network event for testing"""
@@ -30,6 +36,36 @@ def sample_network_event():
         'location': 'store-001'
     }
 
+@pytest.fixture(scope="session")
+def synthetic_events():
+    """
+    Synthetic hourly traffic built once per test session
+    
+    Tests slice rows from it instead of rebuilding a frame each; the
+    detector never modifies its input, so sharing is safe.
+    """
+    rng = np.random.default_rng(0)
+    n_rows = SYNTHETIC_EVENT_ROWS
+    counters = np.empty((n_rows, 4), dtype=np.int32)
+    counters[:, :2] = rng.integers(1000, 50000, size=(n_rows, 2), dtype=np.int32)
+    counters[:, 2:] = rng.integers(10, 100, size=(n_rows, 2), dtype=np.int32)
+    
+    df = pd.DataFrame(
+        counters,
+        columns=['bytes_sent', 'bytes_received', 'packets_sent', 'packets_received'],
+        copy=False
+    )
+    df['timestamp'] = pd.date_range('2024-01-01', periods=n_rows, freq='h').as_unit('s')
+    return df
+
+@pytest.fixture(scope="session")
+def ise_session():
+    """HTTP session shared by every ISE integration test, so connections are reused"""
+    from src.integrations.cisco_ise.client import create_session
+    session = create_session()
+    yield session
+    session.close()
+
 @pytest.fixture
 def sample_security_incident():
     """Sample security incident for testing"""
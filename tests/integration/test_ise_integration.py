@@ -10,13 +10,14 @@ class TestCiscoISEIntegration:
     """Test ISE integration with simulator"""
     
     @pytest.fixture
-    def ise_client(self):
-        """Create ISE client connected to simulator"""
+    def ise_client(self, ise_session):
+        """Create ISE client connected to simulator (on the shared session)"""
         return CiscoISEClient(
             base_url='http://localhost:9060',
             username='admin',
             password='admin',
-            verify_ssl=False
+            verify_ssl=False,
+            session=ise_session
         )
     
     def test_get_endpoints(self, ise_client):
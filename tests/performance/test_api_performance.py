@@ -4,26 +4,17 @@ Phase 7: Load and performance testing
 """
 
 import pytest
+import statistics
 import time
-import pandas as pd
-import numpy as np
 from src.ml.models.anomaly_detector import NetworkAnomalyDetector
 
 @pytest.mark.performance
 class TestPerformance:
     """Performance benchmarks"""
     
-    def test_anomaly_detection_latency(self):
+    def test_anomaly_detection_latency(self, synthetic_events):
         """Test anomaly detection latency < 100ms for 100 events"""
-        # Generate test data
-        data = {
-            'bytes_sent': np.random.randint(1000, 50000, 1000),
-            'bytes_received': np.random.randint(1000, 50000, 1000),
-            'packets_sent': np.random.randint(10, 100, 1000),
-            'packets_received': np.random.randint(10, 100, 1000),
-            'timestamp': pd.date_range('2024-01-01', periods=1000, freq='H')
-        }
-        df = pd.DataFrame(data)
+        df = synthetic_events
         
         # Train model
         detector = NetworkAnomalyDetector()
@@ -32,8 +23,15 @@ class TestPerformance:
         # Test inference latency
         test_data = df[800:][:100]
         
-        start = time.time()
-        results = detector.detect_anomalies(test_data)
-        latency = (time.time() - start) * 1000  # Convert to ms
+        # Warm up so one-off import and allocation costs are not timed
+        for _ in range(3):
+            detector.detect_anomalies(test_data)
         
-        assert latency < 100, f"Latency {latency}ms exceeds 100ms threshold"
+        samples = []
+        for _ in range(5):
+            start = time.perf_counter_ns()
+            detector.detect_anomalies(test_data)
+            samples.append((time.perf_counter_ns() - start) / 1e6)  # Convert to ms
+        latency = statistics.median(samples)
+        
+        assert latency < 100, f"Median latency {latency}ms exceeds 100ms threshold"
@@ -5,7 +5,6 @@ Phase 7: ML model testing
 
 import pytest
 import pandas as pd
-import numpy as np
 from src.ml.models.anomaly_detector import NetworkAnomalyDetector
 
 class TestNetworkAnomalyDetector:
@@ -26,17 +25,9 @@ class TestNetworkAnomalyDetector:
         assert features.shape[0] == 1
         assert features.shape[1] == len(detector.feature_names)
     
-    def test_training(self):
+    def test_training(self, synthetic_events):
         """Test model training"""
-        # Generate synthetic training data
-        data = {
-            'bytes_sent': np.random.randint(1000, 50000, 100),
-            'bytes_received': np.random.randint(1000, 50000, 100),
-            'packets_sent': np.random.randint(10, 100, 100),
-            'packets_received': np.random.randint(10, 100, 100),
-            'timestamp': pd.date_range('2024-01-01', periods=100, freq='H')
-        }
-        df = pd.DataFrame(data)
+        df = synthetic_events[:100]
         
         detector = NetworkAnomalyDetector(contamination=0.1)
         metrics = detector.train(df)
@@ -45,17 +36,10 @@ class TestNetworkAnomalyDetector:
         assert metrics['samples_trained'] == 100
         assert 0 <= metrics['anomaly_rate'] <= 1
     
-    def test_prediction(self):
+    def test_prediction(self, synthetic_events):
         """Test anomaly prediction"""
         # Train model
-        data = {
-            'bytes_sent': np.random.randint(1000, 50000, 100),
-            'bytes_received': np.random.randint(1000, 50000, 100),
-            'packets_sent': np.random.randint(10, 100, 100),
-            'packets_received': np.random.randint(10, 100, 100),
-            'timestamp': pd.date_range('2024-01-01', periods=100, freq='H')
-        }
-        df = pd.DataFrame(data)
+        df = synthetic_events[:100]
         
         detector = NetworkAnomalyDetector(contamination=0.1)
         detector.train(df)
@@ -67,3 +51,18 @@ class TestNetworkAnomalyDetector:
         assert len(predictions) == 10
         assert len(scores) == 10
         assert all(p in [-1, 1] for p in predictions)
+    
+    def test_feature_importance(self, synthetic_events):
+        """Test feature importance reflects split usage"""
+        df = synthetic_events[:100]
+        
+        detector = NetworkAnomalyDetector(contamination=0.1)
+        assert detector.get_feature_importance() == {}
+        detector.train(df)
+        
+        importance = detector.get_feature_importance()
+        
+        assert list(importance) == detector.feature_names
+        assert sum(importance.values()) == pytest.approx(1.0)
+        # Constant features can never be used as a split
+        assert importance['port_entropy'] == 0
@@ -0,0 +1,41 @@
+"""
+Unit Tests for Anomaly Routes
+Phase 7: API request handling
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes import anomaly
+from src.ml.inference.engine import InferenceEngine
+from src.ml.models.anomaly_detector import NetworkAnomalyDetector
+
+
+class TestAnomalyRoutes:
+    """Test the anomaly detection endpoint"""
+
+    @pytest.fixture
+    def client(self, synthetic_events, tmp_path):
+        """Anomaly router backed by a detector trained on synthetic traffic"""
+        detector = NetworkAnomalyDetector(contamination=0.1)
+        detector.train(synthetic_events.iloc[:200])
+        detector.save_model(str(tmp_path / "anomaly_detector_v1.joblib"))
+
+        app = FastAPI()
+        app.include_router(anomaly.router, prefix="/api/v1")
+        app.state.inference = InferenceEngine(models_dir=str(tmp_path))
+        return TestClient(app)
+
+    def test_detect_without_optional_fields(self, client):
+        """Events missing counters, ids, timestamps and ports are still scored"""
+        events = [
+            {"source_ip": "10.1.1.100", "bytes_sent": 1500},
+            {"packets_received": 12},
+            {},
+        ]
+
+        response = client.post("/api/v1/anomaly/detect", json={"events": events})
+
+        assert response.status_code == 200
+        assert response.json()["total_events"] == len(events)